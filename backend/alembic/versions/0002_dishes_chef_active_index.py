@@ -0,0 +1,36 @@
+"""partial index for active dishes per chef
+
+Revision ID: 0002_dishes_chef_active
+Revises: 0001_baseline
+Create Date: 2026-10-17
+
+Speeds up `GET /dishes?active_only=true`: the index only holds active dishes,
+so the list no longer reads a chef's inactive rows and filters them out.
+
+Databases created by the baseline migration after this index was added to the
+model already have it, hence `if_not_exists`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0002_dishes_chef_active"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_dishes_chef_active",
+        "dishes",
+        ["chef_id"],
+        schema="core",
+        postgresql_where=sa.text("is_active = true"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dishes_chef_active", table_name="dishes", schema="core", if_exists=True)
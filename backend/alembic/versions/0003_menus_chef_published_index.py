@@ -0,0 +1,38 @@
+"""partial index for published menus per chef
+
+Revision ID: 0003_menus_chef_published
+Revises: 0002_dishes_chef_active
+Create Date: 2026-10-17
+
+Speeds up the published-only menu lists (`GET /menus?active_only=true` and the
+public chef menus): the index only holds published menus, so drafts and archived
+menus are no longer read and filtered out. `menustatus` stores enum names, hence
+`'PUBLISHED'`.
+
+Databases created by the baseline migration after this index was added to the
+model already have it, hence `if_not_exists`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003_menus_chef_published"
+down_revision = "0002_dishes_chef_active"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_menus_chef_published",
+        "menus",
+        ["chef_id"],
+        schema="core",
+        postgresql_where=sa.text("status = 'PUBLISHED'"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_menus_chef_published", table_name="menus", schema="core", if_exists=True)
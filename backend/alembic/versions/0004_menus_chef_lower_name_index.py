@@ -0,0 +1,36 @@
+"""index for case-insensitive menu names per chef
+
+Revision ID: 0004_menus_chef_lower_name
+Revises: 0003_menus_chef_published
+Create Date: 2026-10-17
+
+Backs the duplicate-name check on menu creation
+(`MenuRepository.get_by_chef_and_name`), which compares `lower(name)` within a
+chef's menus.
+
+Databases created by the baseline migration after this index was added to the
+model already have it, hence `if_not_exists`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004_menus_chef_lower_name"
+down_revision = "0003_menus_chef_published"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_menus_chef_lower_name",
+        "menus",
+        ["chef_id", sa.text("lower(name)")],
+        schema="core",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_menus_chef_lower_name", table_name="menus", schema="core", if_exists=True)
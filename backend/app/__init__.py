@@ -18,7 +18,11 @@ def create_app():
         Flask: Configured Flask application instance
     """
     app = Flask(__name__)
-    
+
+    # Encode/decode JSON with orjson (used by jsonify and request.get_json)
+    from app.core.lib.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+
     # Configure logging
     from config.logging import setup_logging
     setup_logging()
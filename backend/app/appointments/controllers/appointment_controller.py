@@ -1,7 +1,7 @@
 """
 Appointment Controller - HTTP request/response handling for appointment endpoints
 """
-from flask import request, jsonify, g
+from flask import request
 from datetime import datetime
 from app.appointments.schemas import (
     AppointmentCreateSchema,
@@ -14,6 +14,7 @@ from app.appointments.repositories import AppointmentRepository
 from app.chefs.repositories import ChefRepository
 from app.clients.repositories import ClientRepository
 from app.core.lib.error_utils import error_response, success_response
+from app.core.lib.request_utils import parse_bool
 from app.core.database import get_db
 from app.core.middleware.request_decorators import validate_json
 from app.appointments.services.calendar_ics_service import CalendarIcsService
@@ -105,7 +106,7 @@ class AppointmentController:
             service = self._get_service()
             
             # Check for upcoming flag
-            upcoming = request.args.get('upcoming', 'false').lower() == 'true'
+            upcoming = parse_bool(request.args.get('upcoming'))
             
             if upcoming:
                 days = int(request.args.get('days', '7'))
@@ -2,7 +2,7 @@
 Appointment Routes
 Blueprint registration for appointment endpoints
 """
-from flask import Blueprint
+from flask import Blueprint, g
 from app.appointments.controllers import AppointmentController
 from app.core.middleware.auth_middleware import jwt_required
 
@@ -21,7 +21,6 @@ def create_appointment():
     Create a new appointment
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return appointment_controller.create_appointment(g.current_user)
 
 
@@ -39,7 +38,6 @@ def get_all_appointments():
         - days: int (optional, default: 7) - Days to look ahead for upcoming
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return appointment_controller.get_all_appointments(g.current_user)
 
 
@@ -51,7 +49,6 @@ def get_appointment_by_id(appointment_id):
     Get appointment by ID
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return appointment_controller.get_appointment_by_id(appointment_id, g.current_user)
 
 
@@ -63,7 +60,6 @@ def update_appointment(appointment_id):
     Update appointment
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return appointment_controller.update_appointment(appointment_id, g.current_user)
 
 
@@ -75,7 +71,6 @@ def update_appointment_status(appointment_id):
     Update appointment status
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return appointment_controller.update_appointment_status(appointment_id, g.current_user)
 
 
@@ -87,7 +82,6 @@ def delete_appointment(appointment_id):
     Delete appointment
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return appointment_controller.delete_appointment(appointment_id, g.current_user)
 
 
@@ -95,6 +89,5 @@ def delete_appointment(appointment_id):
 @jwt_required
 def download_appointment_ics(appointment_id):
     """GET /appointments/:id/calendar.ics - Download appointment as iCalendar file."""
-    from flask import g
     return appointment_controller.download_appointment_ics(appointment_id, g.current_user)
 
@@ -12,6 +12,7 @@ from app.auth.repositories import UserRepository
 from app.auth.services.security_service import SecurityService
 from app.auth.schemas import UserResponseSchema
 from app.core.cache_manager import cached, invalidate_cache
+from app.core.database import get_db
 from app.core.lib.time_utils import utcnow_aware
 from config.logging import get_logger
 
@@ -21,16 +22,38 @@ logger = get_logger(__name__)
 class AuthService:
     """Service for authentication business logic."""
     
-    def __init__(self, user_repository: UserRepository):
+    _shared: Optional['AuthService'] = None
+    
+    def __init__(self, user_repository: Optional[UserRepository] = None):
         """
         Initialize service with dependencies.
         
         Args:
-            user_repository: UserRepository instance
+            user_repository: UserRepository instance; if omitted, one is built
+                on the current request's session whenever data is accessed
         """
-        self.user_repo = user_repository
+        self._user_repo = user_repository
         self.security = SecurityService()
     
+    @classmethod
+    def shared(cls) -> 'AuthService':
+        """
+        Process-wide instance without a bound repository.
+        
+        Used on the per-request auth path: token verification needs no
+        database, and a repository is only built when a lookup misses the cache.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+    
+    @property
+    def user_repo(self) -> UserRepository:
+        """Repository for user data (request-scoped when none was injected)."""
+        if self._user_repo is not None:
+            return self._user_repo
+        return UserRepository(get_db())
+    
     def register_user(self, username: str, email: str, password: str, role: str = 'chef') -> Optional[User]:
         """
         Register a new user (PUBLIC REGISTRATION).
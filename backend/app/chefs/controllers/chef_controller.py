@@ -1,7 +1,7 @@
 """
 Chef Controller - HTTP request/response handling for chef endpoints
 """
-from flask import request, jsonify, g
+from flask import request
 from app.chefs.schemas import (
     ChefCreateSchema,
     ChefUpdateSchema,
@@ -11,6 +11,7 @@ from app.chefs.schemas import (
 from app.chefs.services import ChefService
 from app.chefs.repositories import ChefRepository
 from app.core.lib.error_utils import error_response, success_response
+from app.core.lib.request_utils import parse_bool
 from app.core.database import get_db
 from app.core.middleware.request_decorators import validate_json
 from config.logging import get_logger
@@ -158,7 +159,7 @@ class ChefController:
             service = self._get_service()
             
             # Check if we should include inactive chefs
-            include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+            include_inactive = parse_bool(request.args.get('include_inactive'))
             active_only = not include_inactive
             
             chefs = service.get_all_profiles(active_only=active_only)
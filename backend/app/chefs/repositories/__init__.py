@@ -1,3 +1,3 @@
-from .chef_repository import ChefRepository
+from .chef_repository import ChefRepository, get_chef_for_user
 
-__all__ = ['ChefRepository']
+__all__ = ['ChefRepository', 'get_chef_for_user']
@@ -4,6 +4,7 @@ Chef Repository - Data access layer for Chef model
 from typing import Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from flask import g, has_app_context
 from app.chefs.models.chef_model import Chef
 from config.logging import get_logger
 
@@ -160,3 +161,30 @@ class ChefRepository:
         except SQLAlchemyError as e:
             logger.error(f"Error checking chef existence for user {user_id}: {e}", exc_info=True)
             raise
+
+
+def get_chef_for_user(chef_repository: ChefRepository, user_id: int) -> Optional[Chef]:
+    """
+    Chef profile of a user, looked up once per request (memoized on g)
+    
+    Shared by the services that resolve the calling chef, so one request
+    touching several of them queries the profile once. Missing profiles are
+    not memoized.
+    
+    Args:
+        chef_repository: Repository used on a memo miss
+        user_id: User ID
+        
+    Returns:
+        Chef instance or None
+    """
+    if not has_app_context():
+        return chef_repository.get_by_user_id(user_id)
+    
+    chefs = g.setdefault('chef_by_user_id', {})
+    chef = chefs.get(user_id)
+    if chef is None:
+        chef = chef_repository.get_by_user_id(user_id)
+        if chef is not None:
+            chefs[user_id] = chef
+    return chef
@@ -8,7 +8,7 @@ Note: Public chef listing/viewing has been moved to /public/chefs for better
       
       Use /public/chefs for browsing chefs (with caching and advanced filters).
 """
-from flask import Blueprint
+from flask import Blueprint, g
 from app.chefs.controllers import ChefController
 from app.core.middleware.auth_middleware import jwt_required
 from app.core.middleware.cache_decorators import invalidate_on_modify
@@ -30,7 +30,6 @@ def create_profile():
     Requires: Authorization header with Bearer token
     Invalidates: All public chef caches
     """
-    from flask import g
     return chef_controller.create_profile(g.current_user)
 
 
@@ -42,7 +41,6 @@ def get_my_profile():
     Get current user's chef profile
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return chef_controller.get_my_profile(g.current_user)
 
 
@@ -56,5 +54,4 @@ def update_my_profile():
     Requires: Authorization header with Bearer token
     Invalidates: All public chef caches
     """
-    from flask import g
     return chef_controller.update_my_profile(g.current_user)
@@ -16,7 +16,7 @@ class ChefService:
     
     def __init__(self, chef_repository: ChefRepository):
         self.chef_repository = chef_repository
-        self.cache_helper = CacheHelper(resource_name="chef", version="v1")
+        self.cache_helper = CacheHelper(resource_name="chef", version="v1", generational=True)
     
     def create_profile(self, user_id: int, profile_data: dict) -> Chef:
         """
@@ -51,7 +51,7 @@ class ChefService:
         logger.info(f"Created chef profile for user {user_id}")
         
         # Invalidate related caches
-        self.cache_helper.invalidate_pattern("*")  # Clear all chef caches
+        self.cache_helper.invalidate_all()  # Clear all chef caches (one INCR)
         invalidate_cache('route:public:chefs:*')  # Clear public route cache
         
         return chef
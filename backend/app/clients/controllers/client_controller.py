@@ -1,11 +1,11 @@
 """
 Client Controller - HTTP request/response handling for client endpoints
 """
-from flask import request, jsonify, g
+from flask import request
 from app.clients.schemas import (
     ClientCreateSchema,
     ClientUpdateSchema,
-    ClientResponseSchema
+    client_response_schema
 )
 from app.clients.services import ClientService
 from app.clients.repositories import ClientRepository
@@ -61,8 +61,7 @@ class ClientController:
             client = service.create_client(current_user['id'], client_data)
             
             # Serialize response
-            schema = ClientResponseSchema()
-            result = schema.dump(client)
+            result = client_response_schema.dump(client)
             
             self.logger.info(f"Client created for user {current_user['id']}")
             return success_response(
@@ -90,10 +89,11 @@ class ClientController:
         try:
             service = self._get_service()
             clients = service.get_all_clients(current_user['id'])
-            
+
             # Serialize response
-            schema = ClientResponseSchema(many=True)
-            result = schema.dump(clients)
+            # Client.to_dict() emits the same shape as ClientResponseSchema but
+            # skips marshmallow's per-field dispatch, which dominates on long lists.
+            result = [c.to_dict() for c in clients]
             
             return success_response(
                 data=result,
@@ -127,8 +127,7 @@ class ClientController:
                 return error_response("Client not found or access denied", 404)
             
             # Serialize response
-            schema = ClientResponseSchema()
-            result = schema.dump(client)
+            result = client_response_schema.dump(client)
             
             return success_response(data=result)
             
@@ -169,8 +168,7 @@ class ClientController:
             client = service.update_client(client_id, current_user['id'], update_data)
             
             # Serialize response
-            schema = ClientResponseSchema()
-            result = schema.dump(client)
+            result = client_response_schema.dump(client)
             
             self.logger.info(f"Client {client_id} updated")
             return success_response(
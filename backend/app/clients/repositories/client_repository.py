@@ -2,13 +2,18 @@
 Client Repository - Data access layer for Client model
 """
 from typing import Optional, List
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.clients.models.client_model import Client
+from app.chefs.models.chef_model import Chef
 from config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Columns a client update may touch (ids and timestamps are never client-writable)
+_UPDATABLE_FIELDS = frozenset({'name', 'email', 'phone', 'company', 'notes'})
+
 
 class ClientRepository:
     """Repository for Client database operations"""
@@ -77,6 +82,26 @@ class ClientRepository:
             logger.error(f"Error retrieving client by email {email}: {e}", exc_info=True)
             raise
     
+    def email_exists(self, email: str) -> bool:
+        """
+        Check whether any client already uses an email
+        
+        Compiles to SELECT EXISTS(...), so no row is fetched or hydrated.
+        
+        Args:
+            email: Client email (case-insensitive)
+            
+        Returns:
+            True if a client with this email exists, False otherwise
+        """
+        try:
+            return self.db.query(
+                exists().where(Client.email.ilike(email))  # Case-insensitive comparison
+            ).scalar()
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking client email {email}: {e}", exc_info=True)
+            raise
+    
     def get_by_chef_id(self, chef_id: int) -> List[Client]:
         """
         Get all clients for a specific chef
@@ -95,6 +120,52 @@ class ClientRepository:
             logger.error(f"Error retrieving clients for chef {chef_id}: {e}", exc_info=True)
             raise
     
+    def get_owned_by_chef_user(self, user_id: int, client_id: int) -> Optional[Client]:
+        """
+        Get client by ID only if it belongs to the chef of the given user
+        
+        Resolves ownership with a single JOIN on chefs instead of fetching
+        the chef profile first.
+        
+        Args:
+            user_id: User ID of the owning chef
+            client_id: Client ID
+            
+        Returns:
+            Client instance or None if not found or not owned
+        """
+        try:
+            client = self.db.query(Client).join(Chef, Client.chef_id == Chef.id).filter(
+                Chef.user_id == user_id,
+                Client.id == client_id
+            ).first()
+            if client:
+                logger.debug(f"Retrieved client ID: {client_id} for user {user_id}")
+            return client
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving client {client_id} for user {user_id}: {e}", exc_info=True)
+            raise
+    
+    def get_by_chef_user_id(self, user_id: int) -> List[Client]:
+        """
+        Get all clients for the chef of the given user
+        
+        Args:
+            user_id: User ID of the owning chef
+            
+        Returns:
+            List of Client instances
+        """
+        try:
+            clients = self.db.query(Client).join(Chef, Client.chef_id == Chef.id).filter(
+                Chef.user_id == user_id
+            ).all()
+            logger.debug(f"Retrieved {len(clients)} clients for user {user_id}")
+            return clients
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving clients for user {user_id}: {e}", exc_info=True)
+            raise
+    
     def update(self, client: Client, update_data: dict) -> Client:
         """
         Update client
@@ -111,7 +182,7 @@ class ClientRepository:
         """
         try:
             for key, value in update_data.items():
-                if hasattr(client, key):
+                if key in _UPDATABLE_FIELDS:
                     setattr(client, key, value)
             
             self.db.flush()
@@ -2,7 +2,7 @@
 Client Routes
 Blueprint registration for client endpoints
 """
-from flask import Blueprint
+from flask import Blueprint, g
 from app.clients.controllers import ClientController
 from app.core.middleware.auth_middleware import jwt_required
 
@@ -21,7 +21,6 @@ def create_client():
     Create a new client
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return client_controller.create_client(g.current_user)
 
 
@@ -33,7 +32,6 @@ def get_all_clients():
     Get all clients for the current chef
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return client_controller.get_all_clients(g.current_user)
 
 
@@ -45,7 +43,6 @@ def get_client_by_id(client_id):
     Get client by ID
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return client_controller.get_client_by_id(client_id, g.current_user)
 
 
@@ -57,7 +54,6 @@ def update_client(client_id):
     Update client
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return client_controller.update_client(client_id, g.current_user)
 
 
@@ -69,5 +65,4 @@ def delete_client(client_id):
     Delete client
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return client_controller.delete_client(client_id, g.current_user)
@@ -1,11 +1,13 @@
 from .client_schema import (
     ClientCreateSchema,
     ClientUpdateSchema,
-    ClientResponseSchema
+    ClientResponseSchema,
+    client_response_schema
 )
 
 __all__ = [
     'ClientCreateSchema',
     'ClientUpdateSchema',
-    'ClientResponseSchema'
+    'ClientResponseSchema',
+    'client_response_schema'
 ]
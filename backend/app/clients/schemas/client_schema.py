@@ -1,7 +1,7 @@
 """
 Client schemas for validation and serialization
 """
-from marshmallow import Schema, fields, validate, validates, ValidationError
+from marshmallow import Schema, fields, validate, validates, ValidationError, EXCLUDE
 import re
 
 
@@ -22,6 +22,12 @@ class ClientCreateSchema(Schema):
 
 class ClientUpdateSchema(Schema):
     """Schema for updating client"""
+
+    class Meta:
+        # Loaded data is already whitelisted to the declared fields,
+        # so the service can apply it as-is.
+        unknown = EXCLUDE
+
     name = fields.Str(required=False, validate=validate.Length(min=1, max=100))
     email = fields.Email(required=False, allow_none=True)
     phone = fields.Str(required=False, allow_none=True, validate=validate.Length(max=20))
@@ -46,3 +52,7 @@ class ClientResponseSchema(Schema):
     notes = fields.Str(allow_none=True)
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
+
+
+# Schema instances
+client_response_schema = ClientResponseSchema()
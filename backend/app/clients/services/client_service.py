@@ -39,11 +39,9 @@ class ClientService:
         
         # Check for duplicate email
         email = client_data.get('email', '').strip()
-        if email:
-            existing_client = self.client_repository.get_by_email(email)
-            if existing_client:
-                logger.warning(f"Attempted to create client with duplicate email: {email}")
-                raise ValueError(f"A client with email '{email}' already exists.")
+        if email and self.client_repository.email_exists(email):
+            logger.warning(f"Attempted to create client with duplicate email: {email}")
+            raise ValueError(f"A client with email '{email}' already exists.")
         
         # Add chef_id to client data
         client_data['chef_id'] = chef.id
@@ -66,20 +64,22 @@ class ClientService:
         Raises:
             ValueError: If chef profile not found
         """
-        # Get chef profile
+        # Single query: client joined to its chef, filtered by owner
+        client = self.client_repository.get_owned_by_chef_user(user_id, client_id)
+        if client:
+            return client
+        
+        # Miss path only: tell "no chef profile" apart from "not found / not owned"
         chef = self.chef_repository.get_by_user_id(user_id)
         if not chef:
             raise ValueError("Chef profile not found")
         
-        # Get client
+        # Audit cross-chef access attempts
         client = self.client_repository.get_by_id(client_id)
-        
-        # Verify ownership
         if client and client.chef_id != chef.id:
             logger.warning(f"User {user_id} attempted to access client {client_id} owned by chef {client.chef_id}")
-            return None
         
-        return client
+        return None
     
     def get_all_clients(self, user_id: int) -> List[Client]:
         """
@@ -94,12 +94,13 @@ class ClientService:
         Raises:
             ValueError: If chef profile not found
         """
-        # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
-        if not chef:
+        clients = self.client_repository.get_by_chef_user_id(user_id)
+        
+        # An empty result is ambiguous; only then check the chef profile exists
+        if not clients and not self.chef_repository.get_by_user_id(user_id):
             raise ValueError("Chef profile not found")
         
-        return self.client_repository.get_by_chef_id(chef.id)
+        return clients
     
     def update_client(self, client_id: int, user_id: int, update_data: dict) -> Client:
         """
@@ -121,13 +122,9 @@ class ClientService:
         if not client:
             raise ValueError("Client not found or access denied")
         
-        # Filter out None values and fields that shouldn't be updated
-        filtered_data = {
-            k: v for k, v in update_data.items() 
-            if v is not None and k in ['name', 'email', 'phone', 'company', 'notes']
-        }
-        
-        updated_client = self.client_repository.update(client, filtered_data)
+        # update_data comes from ClientUpdateSchema.load(), which only keeps
+        # declared fields; explicit nulls are kept so optional fields can be cleared.
+        updated_client = self.client_repository.update(client, update_data)
         logger.info(f"Updated client {client_id}")
         
         # Note: ClientService doesn't currently use caching, but adding invalidation for future compatibility
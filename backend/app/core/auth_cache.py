@@ -0,0 +1,64 @@
+"""
+Auth Token Cache
+In-process cache of verified JWTs, so repeated requests carrying the same
+token skip signature verification and the user lookup.
+"""
+
+import hashlib
+import time
+from typing import Dict, Optional, Tuple
+
+from app.core.lib.ttl_cache import TTLCache
+from config import settings
+
+
+class TokenCache(TTLCache):
+    """
+    Bounded LRU cache of verified tokens with a per-entry expiry.
+
+    Entries are keyed by a 16-byte BLAKE2b digest of the token (never the
+    token itself) and expire after `ttl` seconds or when the token's own `exp`
+    passes, whichever comes first. Only successful verifications are stored.
+    """
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        # Internal lookup key only: 128 bits is ample for a few thousand live tokens
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Look up a verified token.
+
+        Args:
+            token: Raw JWT string
+
+        Returns:
+            (payload, user_dict) or None on a miss or expired entry
+        """
+        if not self.enabled:
+            return None
+        return super().get(self._key(token))
+
+    def set(self, token: str, payload: Dict, user_dict: Dict) -> None:
+        """
+        Store a verified token.
+
+        Args:
+            token: Raw JWT string
+            payload: Decoded token payload
+            user_dict: Serialized user resolved from the payload
+        """
+        if not self.enabled:
+            return
+
+        ttl = self.ttl
+        token_exp = payload.get('exp')
+        if isinstance(token_exp, (int, float)):
+            ttl = min(ttl, token_exp - time.time())
+
+        super().set(self._key(token), (payload, user_dict), ttl)
+
+
+# Process-wide instance used by the auth middleware
+token_cache = TokenCache(settings.JWT_CACHE_SIZE, settings.JWT_CACHE_TTL)
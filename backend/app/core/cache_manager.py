@@ -2,40 +2,123 @@
 Cache Manager using Redis
 
 Provides centralized cache management with Redis backend.
-Supports TTL, JSON serialization, and key namespacing.
+Supports TTL, JSON serialization (orjson), and key namespacing.
 """
 
-import json
+import inspect
+import logging
+import random
+import threading
+import orjson
 import redis
 from functools import wraps
-from typing import Any, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
+from app.core.lib.ttl_cache import TTLCache
 from config.settings import settings
 from config.logging import get_logger
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
 logger = get_logger(__name__)
 
+# Per-process L1 copy of cached route bodies (see cache_response), in front of
+# Redis. delete()/delete_pattern() drop matching entries in this process only,
+# so ROUTE_CACHE_L1_TTL bounds how long other workers serve an invalidated body.
+route_body_cache = TTLCache(settings.ROUTE_CACHE_L1_SIZE, settings.ROUTE_CACHE_L1_TTL)
+
+
+# Values of at least CACHE_COMPRESS_MIN_BYTES are stored as zstd frames. Reads
+# tell them apart by the frame magic number, which JSON never starts with.
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+_zstd_local = threading.local()  # zstandard (de)compressors aren't thread safe
+
+
+def _zstd():
+    """This thread's (compressor, decompressor) pair, or None without zstandard."""
+    if zstandard is None:
+        return None
+    pair = getattr(_zstd_local, 'pair', None)
+    if pair is None:
+        pair = _zstd_local.pair = (zstandard.ZstdCompressor(level=1), zstandard.ZstdDecompressor())
+    return pair
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize a value for Redis, compressing large payloads."""
+    # datetimes serialize natively (ISO 8601); default=str covers Decimal and friends
+    data = orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    min_bytes = settings.CACHE_COMPRESS_MIN_BYTES
+    if min_bytes and len(data) >= min_bytes:
+        codecs = _zstd()
+        if codecs is not None:
+            return codecs[0].compress(data)
+    return data
+
+
+def _decode(data: bytes) -> Any:
+    """Inverse of _encode()."""
+    if data[:4] == _ZSTD_MAGIC:
+        codecs = _zstd()
+        if codecs is None:
+            raise ValueError("compressed cache value but zstandard is not installed")
+        data = codecs[1].decompress(data)
+    return orjson.loads(data)
+
+
+# SCAN + UNLINK for several patterns in a single server-side call.
+# ARGV holds the (already namespaced) patterns; returns the number of keys removed.
+_DELETE_PATTERNS_LUA = """
+local total = 0
+for _, pattern in ipairs(ARGV) do
+    local cursor = '0'
+    repeat
+        local page = redis.call('SCAN', cursor, 'MATCH', pattern, 'COUNT', 500)
+        cursor = page[1]
+        if #page[2] > 0 then
+            total = total + redis.call('UNLINK', unpack(page[2]))
+        end
+    until cursor == '0'
+end
+return total
+"""
+
 
 class CacheManager:
     """Redis-based cache manager with JSON serialization support"""
     
+    # Keys fetched per SCAN page and removed per UNLINK call in delete_pattern()
+    SCAN_BATCH_SIZE = 500
+    
+    # Up to this fraction of the TTL is added at random on set(), so entries
+    # written together don't all expire (and hit the database) together
+    TTL_JITTER = 0.1
+    
     def __init__(self):
         """Initialize Redis connection"""
         self.redis_client = None
         self.enabled = False
+        self._delete_patterns_script = None
         self._connect()
     
     def _connect(self):
         """Establish connection to Redis server"""
         try:
-            self.redis_client = redis.Redis(
+            pool = redis.ConnectionPool(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 password=settings.REDIS_PASSWORD,
                 db=settings.REDIS_DB,
-                decode_responses=True,  # Automatically decode bytes to strings
+                decode_responses=False,  # orjson reads/writes bytes directly
+                max_connections=settings.REDIS_POOL_SIZE,
+                socket_keepalive=True,
                 socket_connect_timeout=5,
-                socket_timeout=5
+                socket_timeout=5,
+                health_check_interval=30  # PING idle connections before reuse
             )
+            self.redis_client = redis.Redis(connection_pool=pool)
             # Test connection
             self.redis_client.ping()
             self.enabled = True
@@ -51,40 +134,113 @@ class CacheManager:
             return f"{prefix}:{key}"
         return key
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
         """
         Retrieve value from cache
         
         Args:
             key: Cache key
+            default: Returned on a miss (or when the cache is unavailable).
+                     Pass a sentinel to tell a miss apart from a cached None.
             
         Returns:
-            Cached value (deserialized from JSON) or None
+            Cached value (deserialized from JSON) or default
         """
         if not self.enabled:
-            return None
+            return default
         
         try:
             formatted_key = self._format_key(key)
             value = self.redis_client.get(formatted_key)
             if value is None:
-                logger.debug(f"Cache MISS: {formatted_key}")
-                return None
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache MISS: {formatted_key}")
+                return default
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache HIT: {formatted_key}")
+            return _decode(value)
+        except Exception as e:
+            logger.error(f"Error getting cache key '{key}': {e}")
+            return default
+    
+    def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve the stored JSON bytes without decoding them
+        
+        For callers that forward the payload as-is (e.g. cached HTTP bodies),
+        skipping a decode/re-encode round trip.
+        
+        Args:
+            key: Cache key
             
-            logger.debug(f"Cache HIT: {formatted_key}")
-            return json.loads(value)
+        Returns:
+            Raw JSON bytes or None
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            formatted_key = self._format_key(key)
+            value = self.redis_client.get(formatted_key)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache {'MISS' if value is None else 'HIT'} (raw): {formatted_key}")
+            return value
         except Exception as e:
             logger.error(f"Error getting cache key '{key}': {e}")
             return None
     
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve several values in one round trip (MGET)
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dict of key -> deserialized value for the keys that were found;
+            values that fail to decode are left out, like misses
+        """
+        found = {}
+        for key, value in self.get_many_raw(keys).items():
+            try:
+                found[key] = _decode(value)
+            except Exception as e:
+                logger.error(f"Error decoding cache key '{key}': {e}")
+        return found
+    
+    def get_many_raw(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Retrieve several stored JSON payloads in one round trip, undecoded
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dict of key -> raw JSON bytes for the keys that were found
+        """
+        if not self.enabled or not keys:
+            return {}
+        
+        try:
+            values = self.redis_client.mget([self._format_key(key) for key in keys])
+            found = {key: value for key, value in zip(keys, values) if value is not None}
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache MGET: {len(found)}/{len(keys)} hits")
+            return found
+        except Exception as e:
+            logger.error(f"Error getting {len(keys)} cache keys: {e}")
+            return {}
+    
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """
         Store value in cache with TTL
         
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
-            ttl: Time-to-live in seconds (default: 1 hour)
+            value: Value to cache (JSON serialized; zstd-compressed from
+                   CACHE_COMPRESS_MIN_BYTES when zstandard is installed)
+            ttl: Time-to-live in seconds (default: 1 hour), plus up to TTL_JITTER
             
         Returns:
             True if successful, False otherwise
@@ -93,8 +249,9 @@ class CacheManager:
             return False
         
         try:
-            serialized = json.dumps(value, default=str)  # default=str handles datetime objects
+            serialized = _encode(value)
             formatted_key = self._format_key(key)
+            ttl += random.randint(0, int(ttl * self.TTL_JITTER))
             self.redis_client.setex(formatted_key, ttl, serialized)
             logger.debug(f"Cache SET: {formatted_key} (TTL: {ttl}s)")
             return True
@@ -102,6 +259,57 @@ class CacheManager:
             logger.error(f"Error setting cache key '{key}': {e}")
             return False
     
+    def set_raw(self, key: str, data: bytes, ttl: int = 3600) -> bool:
+        """
+        Store already-serialized JSON bytes with TTL (counterpart of get_raw)
+        
+        Args:
+            key: Cache key
+            data: JSON bytes, stored as-is
+            ttl: Time-to-live in seconds, plus up to TTL_JITTER
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.enabled:
+            return False
+        
+        try:
+            formatted_key = self._format_key(key)
+            ttl += random.randint(0, int(ttl * self.TTL_JITTER))
+            self.redis_client.setex(formatted_key, ttl, data)
+            logger.debug(f"Cache SET (raw): {formatted_key} (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Error setting cache key '{key}': {e}")
+            return False
+
+    def set_many(self, mapping: Dict[str, Any], ttl: int = 3600) -> bool:
+        """
+        Store several values in one round trip (pipelined SETEX)
+
+        Args:
+            mapping: Dict of cache key -> value (JSON serialized like set())
+            ttl: Time-to-live in seconds, plus up to TTL_JITTER per key
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.enabled or not mapping:
+            return False
+
+        try:
+            jitter = int(ttl * self.TTL_JITTER)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(self._format_key(key), ttl + random.randint(0, jitter), _encode(value))
+            pipe.execute()
+            logger.debug(f"Cache SET: {len(mapping)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Error setting {len(mapping)} cache keys: {e}")
+            return False
+    
     def delete(self, key: str) -> bool:
         """
         Delete key from cache
@@ -112,6 +320,7 @@ class CacheManager:
         Returns:
             True if key existed and was deleted, False otherwise
         """
+        route_body_cache.delete(key)
         if not self.enabled:
             return False
         
@@ -124,6 +333,28 @@ class CacheManager:
             logger.error(f"Error deleting cache key '{key}': {e}")
             return False
     
+    def delete_many(self, keys: List[str]) -> int:
+        """
+        Delete several keys in one round trip (single UNLINK)
+        
+        Args:
+            keys: Cache keys to delete
+            
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        route_body_cache.delete(*keys)
+        if not self.enabled or not keys:
+            return 0
+        
+        try:
+            deleted = self.redis_client.unlink(*[self._format_key(key) for key in keys])
+            logger.debug(f"Cache UNLINK: {deleted}/{len(keys)} keys")
+            return deleted
+        except Exception as e:
+            logger.error(f"Error deleting {len(keys)} cache keys: {e}")
+            return 0
+    
     def delete_pattern(self, pattern: str) -> int:
         """
         Delete all keys matching a pattern
@@ -134,21 +365,104 @@ class CacheManager:
         Returns:
             Number of keys deleted
         """
+        route_body_cache.delete_matching(pattern)
         if not self.enabled:
             return 0
         
         try:
             formatted_pattern = self._format_key(pattern)
-            keys = self.redis_client.keys(formatted_pattern)
-            if keys:
-                deleted = self.redis_client.delete(*keys)
+            deleted = 0
+            batch = []
+            # SCAN walks the keyspace incrementally instead of blocking Redis like KEYS,
+            # and UNLINK frees memory in the background instead of inline like DEL.
+            for key in self.redis_client.scan_iter(match=formatted_pattern, count=self.SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= self.SCAN_BATCH_SIZE:
+                    deleted += self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis_client.unlink(*batch)
+            if deleted:
                 logger.debug(f"Cache DELETE PATTERN: {formatted_pattern} ({deleted} keys)")
-                return deleted
-            return 0
+            return deleted
         except Exception as e:
             logger.error(f"Error deleting cache pattern '{pattern}': {e}")
             return 0
     
+    def delete_patterns(self, patterns: List[str]) -> int:
+        """
+        Delete all keys matching any of several patterns in one round trip
+        
+        Runs SCAN + UNLINK server-side in a Lua script (EVALSHA). The script
+        holds Redis while it walks the keyspace, which is fine at this cache's
+        size; if scripting is unavailable it falls back to delete_pattern().
+        
+        Args:
+            patterns: Patterns to match (e.g., ['route:public:dishes:*', 'route:dishes:*'])
+            
+        Returns:
+            Number of keys deleted
+        """
+        for pattern in patterns:
+            route_body_cache.delete_matching(pattern)
+        if not self.enabled or not patterns:
+            return 0
+        
+        try:
+            if self._delete_patterns_script is None:
+                self._delete_patterns_script = self.redis_client.register_script(_DELETE_PATTERNS_LUA)
+            deleted = int(self._delete_patterns_script(args=[self._format_key(p) for p in patterns]))
+            if deleted:
+                logger.debug(f"Cache DELETE PATTERNS: {patterns} ({deleted} keys)")
+            return deleted
+        except Exception as e:
+            logger.warning(f"Batched pattern delete failed, deleting one pattern at a time: {e}")
+            return sum(self.delete_pattern(pattern) for pattern in patterns)
+    
+    def incr(self, key: str) -> Optional[int]:
+        """
+        Atomically increment an integer counter (created at 1, no TTL)
+        
+        The stored value is plain integer text, so get() reads it back as an int.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            New value, or None if the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            return self.redis_client.incr(self._format_key(key))
+        except Exception as e:
+            logger.error(f"Error incrementing cache key '{key}': {e}")
+            return None
+    
+    def get_counter(self, key: str) -> Optional[int]:
+        """
+        Read an integer counter written by incr()
+        
+        Unlike get(), a failed read is not reported as a miss.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Counter value (0 if never incremented), or None if the cache is
+            unavailable or the read failed
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            value = self.redis_client.get(self._format_key(key))
+            return int(value) if value is not None else 0
+        except Exception as e:
+            logger.error(f"Error reading counter '{key}': {e}")
+            return None
+    
     def exists(self, key: str) -> bool:
         """
         Check if key exists in cache
@@ -178,6 +492,7 @@ class CacheManager:
         if not self.enabled:
             return False
         
+        route_body_cache.clear()
         try:
             self.redis_client.flushdb()
             logger.warning("Cache FLUSH ALL: All keys deleted")
@@ -209,6 +524,14 @@ class CacheManager:
 # Global cache instance
 _cache_instance = None
 
+# Returned by CacheManager.get() on a miss inside cached(); a cached None is
+# stored as JSON null, so it round-trips as a real None hit
+_MISS = object()
+
+# Marker older releases stored for a cached None; read back as None until
+# those entries expire
+_LEGACY_NONE = "__CACHE_NONE__"
+
 
 def get_cache() -> CacheManager:
     """
@@ -250,6 +573,12 @@ def cached(key_prefix: str, ttl: int = 3600, skip_self: bool = True):
         - Handles class methods and static functions
     """
     def decorator(func: Callable) -> Callable:
+        # Decide once, from the signature, whether the first positional
+        # argument is 'self'/'cls' rather than inspecting args[0] on every call
+        params = list(inspect.signature(func).parameters)
+        skip = 1 if skip_self and params and params[0] in ('self', 'cls') else 0
+        prefix = f"{key_prefix}:"
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             cache = get_cache()
@@ -259,44 +588,36 @@ def cached(key_prefix: str, ttl: int = 3600, skip_self: bool = True):
                 return func(*args, **kwargs)
             
             # Skip 'self' or 'cls' if it's a method
-            cache_args = args
-            if skip_self and args and hasattr(args[0], '__dict__'):
-                # Skip first arg if it looks like an instance (has __dict__)
-                cache_args = args[1:]
-            elif skip_self and args and isinstance(args[0], type):
-                # Skip first arg if it's a class (classmethod)
-                cache_args = args[1:]
+            cache_args = args[skip:] if skip else args
             
             # Build cache key from prefix and arguments
-            args_str = ':'.join(str(arg) for arg in cache_args) if cache_args else ''
-            kwargs_str = ':'.join(f"{k}={v}" for k, v in sorted(kwargs.items())) if kwargs else ''
-            
-            # Combine parts, removing trailing colons
-            key_parts = [key_prefix, args_str, kwargs_str]
-            cache_key = ':'.join(part for part in key_parts if part)
+            if len(cache_args) == 1 and not kwargs:
+                # Fast path for the common single-ID lookup (e.g. user:auth:123)
+                cache_key = f"{prefix}{cache_args[0]}"
+            else:
+                args_str = ':'.join(str(arg) for arg in cache_args) if cache_args else ''
+                kwargs_str = ':'.join(f"{k}={v}" for k, v in sorted(kwargs.items())) if kwargs else ''
+                
+                # Combine parts, removing trailing colons
+                key_parts = [key_prefix, args_str, kwargs_str]
+                cache_key = ':'.join(part for part in key_parts if part)
             
-            # Try to get from cache
-            cached_result = cache.get(cache_key)
-            if cached_result is not None:
-                # Handle special __NONE__ marker for cached None values
-                if cached_result == "__CACHE_NONE__":
-                    logger.debug(f"Cache HIT (None): {func.__name__}({cache_key})")
+            # Try to get from cache (a cached None comes back as None, a miss as _MISS)
+            cached_result = cache.get(cache_key, _MISS)
+            if cached_result is not _MISS:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache HIT: {func.__name__}({cache_key})")
+                if cached_result == _LEGACY_NONE:
                     return None
-                logger.debug(f"Cache HIT: {func.__name__}({cache_key})")
                 return cached_result
             
             # Execute function
             logger.debug(f"Cache MISS: {func.__name__}({cache_key})")
             result = func(*args, **kwargs)
             
-            # Cache result (including None to avoid repeated queries)
-            if result is None:
-                # Use special marker for None to distinguish from cache miss
-                cache.set(cache_key, "__CACHE_NONE__", ttl)
-                logger.debug(f"Result cached (None): {func.__name__}({cache_key}) - TTL: {ttl}s")
-            else:
-                cache.set(cache_key, result, ttl)
-                logger.debug(f"Result cached: {func.__name__}({cache_key}) - TTL: {ttl}s")
+            # Cache result (including None, stored as JSON null, to avoid repeated queries)
+            cache.set(cache_key, result, ttl)
+            logger.debug(f"Result cached: {func.__name__}({cache_key}) - TTL: {ttl}s")
             
             return result
         return wrapper
@@ -4,10 +4,11 @@ Handles database connection and session management.
 """
 
 import logging
+from typing import Callable
 from flask import g
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session, Session
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -19,14 +20,70 @@ SessionLocal = None
 # Base class for models
 Base = declarative_base()
 
+# Session.info flag set once a session has sent writes to the database
+WRITES_FLAG = 'has_writes'
+
+
+@event.listens_for(Session, 'after_flush')
+def _mark_flush_writes(session, flush_context):
+    """Record that ORM changes were flushed in the current transaction."""
+    session.info[WRITES_FLAG] = True
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_statement_writes(orm_execute_state):
+    """Record writes issued as statements (bulk INSERT/UPDATE/DELETE, text())."""
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[WRITES_FLAG] = True
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _clear_writes(session):
+    """A finished transaction has nothing left to commit."""
+    session.info.pop(WRITES_FLAG, None)
+
+
+def _has_writes(db: Session) -> bool:
+    """Return True if the session holds changes that need a COMMIT."""
+    return bool(db.info.get(WRITES_FLAG) or db.new or db.dirty or db.deleted)
+
+
+def call_after_commit(callback: Callable[[], None]) -> None:
+    """
+    Run callback once the current request's transaction has committed.
+    
+    Callbacks are dropped if the request fails or the commit rolls back, so
+    side effects such as cache write-through never expose uncommitted rows.
+    
+    Args:
+        callback: Function taking no arguments
+    """
+    g.setdefault('after_commit', []).append(callback)
+
+
+def _run_after_commit(callbacks) -> None:
+    """Run after-commit callbacks; a failing callback doesn't stop the rest."""
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"After-commit callback failed: {e}")
+
 
 def init_db():
     """
     Initialize database connection and create engine.
-    Should be called once at application startup.
+    Should be called once at application startup; calling it again (e.g. a
+    second create_app()) disposes the previous engine instead of leaking its pool.
     """
     global engine, SessionLocal
     
+    if SessionLocal is not None:
+        SessionLocal.remove()
+    if engine is not None:
+        engine.dispose()
+    
     try:
         database_url = settings.get_database_url()
         logger.info(f"Connecting to database at {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
@@ -34,16 +91,25 @@ def init_db():
         engine = create_engine(
             database_url,
             pool_pre_ping=True,  # Verify connections before using
-            pool_size=10,
-            max_overflow=20,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,  # Drop connections before server/NAT idle cutoffs
+            pool_use_lifo=True,  # Reuse the most recent connection; idle extras can time out
+            connect_args={
+                'connect_timeout': 5,
+                'application_name': 'lyftercook'  # Shows up in pg_stat_activity
+            },
             echo=settings.FLASK_DEBUG  # Log SQL queries in debug mode
         )
         
-        SessionLocal = sessionmaker(
+        # Thread-local session registry: one Session per request thread,
+        # discarded with SessionLocal.remove() at teardown.
+        SessionLocal = scoped_session(sessionmaker(
             autocommit=False,
             autoflush=False,
             bind=engine
-        )
+        ))
         
         logger.info("Database connection established successfully")
         
@@ -74,23 +140,36 @@ def close_db(exception=None):
     """
     Close the database session at the end of the request.
     This should be registered as a teardown function in your Flask app.
+    Also clears the scoped-session registry for the current thread.
     
-    Automatically commits or rolls back based on whether an exception occurred.
+    Commits only if the request wrote something; read-only requests just close
+    the session (releasing the connection) and skip the COMMIT round trip.
+    Rolls back if an exception occurred. Callbacks registered with
+    call_after_commit() run only once the commit has succeeded.
     """
     db = g.pop('db', None)
+    callbacks = g.pop('after_commit', [])
+    committed = exception is None
     
     if db is not None:
         try:
             if exception is None:
-                db.commit()
+                if _has_writes(db):
+                    db.commit()
             else:
                 logger.warning("Rolling back transaction due to exception")
                 db.rollback()
         except SQLAlchemyError as e:
             logger.error(f"Error during session teardown: {e}")
             db.rollback()
+            committed = False
         finally:
             db.close()
+            if SessionLocal is not None:
+                SessionLocal.remove()
+    
+    if committed:
+        _run_after_commit(callbacks)
 
 
 def create_tables():
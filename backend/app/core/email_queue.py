@@ -0,0 +1,216 @@
+"""Background email queue backed by Redis lists.
+
+Request handlers enqueue messages and return immediately; a separate worker
+process (scripts/email_worker.py) sends them through EmailService.
+
+A worker moves each job into its own processing list while sending it and
+removes it only once it is sent, rescheduled or dead-lettered, so a worker
+that dies mid-send leaves the job there; it is re-queued when a worker with
+the same ID starts again. Failed sends wait in a sorted set scored by their
+retry time (exponential backoff) and go back to the outbound list when due.
+Messages that keep failing are moved to a dead-letter list for inspection.
+"""
+
+from __future__ import annotations
+
+import socket
+import time
+import uuid
+from typing import Optional
+
+import orjson
+
+from app.core.cache_manager import get_cache
+from app.core.email_service import EmailService
+from config import settings
+from config.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+OUTBOUND_QUEUE = "emails:outbound"
+RETRY_QUEUE = "emails:retry"            # Sorted set: job -> retry-at (epoch seconds)
+PROCESSING_QUEUE = "emails:processing"  # One list per worker: emails:processing:<worker_id>
+DEAD_LETTER_QUEUE = "emails:dead"
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 60   # Seconds before the first retry; doubles per failed attempt
+RETRY_MAX_DELAY = 3600
+PROMOTE_BATCH_SIZE = 100
+
+# Move due retries back to the outbound list in one atomic step, so two
+# workers can't both re-queue (or both drop) the same job.
+# KEYS: retry set, outbound list; ARGV: now, batch size. Returns jobs moved.
+_PROMOTE_RETRIES_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, job in ipairs(due) do
+    redis.call('ZREM', KEYS[1], job)
+    redis.call('LPUSH', KEYS[2], job)
+end
+return #due
+"""
+
+_promote_script = None
+
+
+def queue_enabled() -> bool:
+    """Whether emails should be queued (needs EMAIL_QUEUE_ENABLED and Redis)."""
+    return bool(getattr(settings, "EMAIL_QUEUE_ENABLED", False)) and get_cache().enabled
+
+
+def enqueue_email(
+    *,
+    to_email: str,
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None,
+) -> bool:
+    """Push an email onto the outbound queue.
+
+    Returns:
+        bool: True if queued; False if email is not configured or the queue is
+        unavailable, in which case the caller should send synchronously.
+    """
+    # Unconfigured email would only fail MAX_ATTEMPTS times in the worker
+    if not EmailService.enabled() or not queue_enabled():
+        return False
+
+    cache = get_cache()
+    job = {
+        "to_email": to_email,
+        "subject": subject,
+        "html_content": html_content,
+        "text_content": text_content,
+        "attempts": 0,
+        "id": uuid.uuid4().hex,  # Keeps identical emails distinct in the retry set
+    }
+    try:
+        cache.redis_client.lpush(cache._format_key(OUTBOUND_QUEUE), orjson.dumps(job))
+        logger.info(f"Email queued for {to_email}: {subject}")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to queue email for {to_email}: {e}")
+        return False
+
+
+def retry_delay(attempts: int) -> int:
+    """Seconds to wait before retrying a job that has failed `attempts` times."""
+    return min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY)
+
+
+def default_worker_id() -> str:
+    """Worker ID used when none is given (stable across restarts of one host)."""
+    return socket.gethostname()
+
+
+def _promote_due_retries(cache) -> int:
+    """Move retries whose backoff has elapsed back onto the outbound list."""
+    global _promote_script
+    client = cache.redis_client
+    if _promote_script is None or _promote_script.registered_client is not client:
+        _promote_script = client.register_script(_PROMOTE_RETRIES_LUA)
+    return int(_promote_script(
+        keys=[cache._format_key(RETRY_QUEUE), cache._format_key(OUTBOUND_QUEUE)],
+        args=[time.time(), PROMOTE_BATCH_SIZE],
+    ))
+
+
+def requeue_unfinished(worker_id: Optional[str] = None) -> int:
+    """Put jobs left in a worker's processing list back on the outbound queue.
+
+    Call before the worker starts processing: anything still in its list was
+    being sent when a previous run of the same worker stopped.
+
+    Returns:
+        Number of jobs re-queued.
+    """
+    cache = get_cache()
+    processing = cache._format_key(f"{PROCESSING_QUEUE}:{worker_id or default_worker_id()}")
+    outbound = cache._format_key(OUTBOUND_QUEUE)
+
+    count = 0
+    while cache.redis_client.lmove(processing, outbound, "RIGHT", "RIGHT") is not None:
+        count += 1
+    if count:
+        logger.warning(f"Re-queued {count} unfinished email(s) from {processing}")
+    return count
+
+
+def process_next(timeout: int = 2, worker_id: Optional[str] = None) -> Optional[bool]:
+    """Take one queued email and send it.
+
+    The job is moved (BLMOVE) into the worker's processing list while it is
+    sent. Failed sends are rescheduled with exponential backoff until
+    MAX_ATTEMPTS, then moved to the dead-letter list.
+
+    Args:
+        timeout: Seconds to block waiting for a message (keep below the
+                 Redis socket timeout)
+        worker_id: Processing list to use; each running worker needs its own
+
+    Returns:
+        True/False for the send result, or None if the queue was empty.
+    """
+    cache = get_cache()
+    client = cache.redis_client
+    outbound = cache._format_key(OUTBOUND_QUEUE)
+    processing = cache._format_key(f"{PROCESSING_QUEUE}:{worker_id or default_worker_id()}")
+
+    _promote_due_retries(cache)
+
+    raw = client.blmove(outbound, processing, timeout, "RIGHT", "LEFT")
+    if raw is None:
+        return None
+
+    try:
+        job = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        pipe = client.pipeline()
+        pipe.lpush(cache._format_key(DEAD_LETTER_QUEUE), raw)
+        pipe.lrem(processing, 1, raw)
+        pipe.execute()
+        logger.error(f"Undecodable email job moved to dead-letter queue: {e}")
+        return False
+
+    sent = EmailService.send_email(
+        to_email=job["to_email"],
+        subject=job["subject"],
+        html_content=job["html_content"],
+        text_content=job.get("text_content"),
+    )
+
+    # Reschedule/dead-letter and release the job in one transaction, so it is
+    # never in neither place
+    pipe = client.pipeline()
+    if not sent:
+        job["attempts"] = job.get("attempts", 0) + 1
+        if job["attempts"] >= MAX_ATTEMPTS:
+            pipe.lpush(cache._format_key(DEAD_LETTER_QUEUE), orjson.dumps(job))
+            logger.error(f"Email to {job['to_email']} moved to dead-letter queue after {job['attempts']} attempts")
+        else:
+            delay = retry_delay(job["attempts"])
+            pipe.zadd(cache._format_key(RETRY_QUEUE), {orjson.dumps(job): time.time() + delay})
+            logger.warning(f"Email to {job['to_email']} failed (attempt {job['attempts']}); retrying in {delay}s")
+    pipe.lrem(processing, 1, raw)
+    pipe.execute()
+    return sent
+
+
+def run_worker(worker_id: Optional[str] = None) -> None:
+    """Process the outbound queue until interrupted.
+
+    Args:
+        worker_id: Defaults to the host name; concurrent workers on one host
+                   must pass distinct IDs
+    """
+    if not get_cache().enabled:
+        raise RuntimeError("Redis is not available; cannot process the email queue")
+
+    worker_id = worker_id or default_worker_id()
+    requeue_unfinished(worker_id)
+    logger.info(f"Email worker {worker_id} started")
+    while True:
+        try:
+            process_next(worker_id=worker_id)
+        except Exception as e:
+            logger.error(f"Email worker error: {e}", exc_info=True)
+            time.sleep(1)  # Back off instead of spinning while Redis is down
@@ -6,20 +6,85 @@ This service is best-effort: failures are logged and should not break core flows
 from __future__ import annotations
 
 import os
-from typing import Optional
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 from config import settings
 from config.logging import get_logger
 
+try:
+    from sendgrid import SendGridAPIClient
+    from sendgrid.helpers.mail import Mail
+except ImportError:  # pragma: no cover - optional dependency
+    SendGridAPIClient = None
+    Mail = None
+
 
 logger = get_logger(__name__)
 
+# Shared SendGrid client, built on first send
+_sg_client = None
+
+
+# Bulk sending
+SEND_MANY_BATCH_SIZE = 200  # Messages submitted to the pool at a time
+MAX_SEND_ATTEMPTS = 5
+MAX_RETRY_DELAY = 30  # Seconds
+
+
+def _get_client():
+    """Return the process-wide SendGrid client."""
+    global _sg_client
+    if _sg_client is None:
+        _sg_client = SendGridAPIClient(settings.SENDGRID_API_KEY)
+    return _sg_client
+
+
+def _build_mail(to_email: str, subject: str, html_content: str, text_content: Optional[str]):
+    return Mail(
+        from_email=(settings.SENDGRID_FROM_EMAIL, settings.SENDGRID_FROM_NAME),
+        to_emails=to_email,
+        subject=subject,
+        html_content=html_content,
+        plain_text_content=text_content,
+    )
+
+
+def _is_retryable(status_code: Optional[int]) -> bool:
+    """429 and 5xx are transient; None means the request never got a response."""
+    return status_code is None or status_code == 429 or status_code >= 500
+
+
+class _Throttle:
+    """Spaces calls evenly so at most `rate` start per second, across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class EmailService:
     """Simple wrapper around SendGrid."""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def enabled() -> bool:
+        """Whether email is configured; resolved once per process (see cache_clear)."""
         raw = os.getenv("EMAIL_ENABLED", "")
         value = raw.strip().strip('"').strip("'").lower()
         if value in {"0", "false", "no"}:
@@ -42,23 +107,13 @@ class EmailService:
         if not EmailService.enabled():
             return False
 
-        try:
-            from sendgrid import SendGridAPIClient
-            from sendgrid.helpers.mail import Mail
-        except Exception as e:
-            logger.warning(f"SendGrid dependencies unavailable: {e}")
+        if SendGridAPIClient is None:
+            logger.warning("SendGrid dependencies unavailable")
             return False
 
         try:
-            message = Mail(
-                from_email=(settings.SENDGRID_FROM_EMAIL, settings.SENDGRID_FROM_NAME),
-                to_emails=to_email,
-                subject=subject,
-                html_content=html_content,
-                plain_text_content=text_content,
-            )
-            sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-            response = sg.send(message)
+            message = _build_mail(to_email, subject, html_content, text_content)
+            response = _get_client().send(message)
             accepted = 200 <= response.status_code < 300
             if accepted:
                 logger.info(f"Email sent to {to_email}: {subject}")
@@ -72,7 +127,78 @@ class EmailService:
             return False
 
     @staticmethod
-    def send_welcome_email(*, to_email: str, username: str) -> bool:
+    def _send_with_retry(message: Dict, throttle: _Throttle) -> bool:
+        """Send one message, retrying 429/5xx with exponential backoff and jitter."""
+        to_email = message["to_email"]
+        for attempt in range(MAX_SEND_ATTEMPTS):
+            throttle.wait()
+            try:
+                mail = _build_mail(
+                    to_email,
+                    message["subject"],
+                    message["html_content"],
+                    message.get("text_content"),
+                )
+                status_code = _get_client().send(mail).status_code
+                if 200 <= status_code < 300:
+                    return True
+            except Exception as e:
+                # SendGrid raises HTTPError (with status_code) for non-2xx responses
+                status_code = getattr(e, "status_code", None)
+                if not _is_retryable(status_code):
+                    logger.error(f"Failed to send email to {to_email}: {e}")
+                    return False
+
+            if not _is_retryable(status_code):
+                logger.warning(f"SendGrid rejected email to {to_email}: status={status_code}")
+                return False
+            if attempt + 1 < MAX_SEND_ATTEMPTS:
+                time.sleep(min(2 ** attempt, MAX_RETRY_DELAY) + random.uniform(0, 1))
+
+        logger.error(f"Giving up on email to {to_email} after {MAX_SEND_ATTEMPTS} attempts")
+        return False
+
+    @staticmethod
+    def send_many(messages: Iterable[Dict], max_concurrency: Optional[int] = None) -> List[bool]:
+        """Send many emails concurrently, throttled to SENDGRID_RATE_PER_SEC.
+
+        Args:
+            messages: Dicts with to_email, subject, html_content and optional text_content
+            max_concurrency: Worker threads (defaults to EMAIL_WORKERS)
+
+        Returns:
+            list[bool]: Per-message result, in input order.
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+        if not EmailService.enabled() or SendGridAPIClient is None:
+            return [False] * len(messages)
+
+        workers = min(max_concurrency or settings.EMAIL_WORKERS, len(messages))
+        throttle = _Throttle(settings.SENDGRID_RATE_PER_SEC)
+        results: List[bool] = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="email") as pool:
+            for start in range(0, len(messages), SEND_MANY_BATCH_SIZE):
+                batch = messages[start:start + SEND_MANY_BATCH_SIZE]
+                results.extend(
+                    pool.map(lambda m: EmailService._send_with_retry(m, throttle), batch)
+                )
+
+        sent = sum(results)
+        logger.info(f"Bulk email: {sent}/{len(results)} accepted")
+        return results
+
+    @staticmethod
+    def send_welcome_email(*, to_email: str, username: str, send_sync: bool = False) -> bool:
+        """Send the welcome email, via the background queue when it is enabled.
+
+        Args:
+            send_sync: Skip the queue and send within the current request
+
+        Returns:
+            bool: True if the email was queued or accepted by SendGrid.
+        """
         subject = "Welcome to LyfterCook"
         html = (
             "<h2>Welcome to LyfterCook</h2>"
@@ -80,6 +206,18 @@ class EmailService:
             "<p>You can now log in and start creating menus, quotations, and appointments.</p>"
         )
         text = f"Welcome to LyfterCook, {username}. Your account is ready."
+
+        if not send_sync:
+            from app.core.email_queue import enqueue_email
+
+            if enqueue_email(
+                to_email=to_email,
+                subject=subject,
+                html_content=html,
+                text_content=text,
+            ):
+                return True
+
         return EmailService.send_email(
             to_email=to_email,
             subject=subject,
@@ -1,9 +1,12 @@
 """
 Error Utilities
 Centralized error response formatting.
+
+Responses are built straight through the app's JSON provider (orjson, see
+json_provider.py), which encodes the payload to bytes in one pass.
 """
 
-from flask import jsonify
+from flask import current_app
 from config.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,9 +34,9 @@ def error_response(message: str, status_code: int, details: dict = None):
     if details:
         response['details'] = details
     
-    logger.error(f"Error response: {status_code} - {message}")
+    logger.error("Error response: %d - %s", status_code, message)
     
-    return jsonify(response), status_code
+    return current_app.json.response(response), status_code
 
 
 def success_response(data: dict, message: str = None, status_code: int = 200):
@@ -53,4 +56,4 @@ def success_response(data: dict, message: str = None, status_code: int = 200):
     if message:
         response['message'] = message
     
-    return jsonify(response), status_code
+    return current_app.json.response(response), status_code
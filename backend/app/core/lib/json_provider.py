@@ -0,0 +1,62 @@
+"""JSON provider.
+
+Flask JSON provider backed by orjson, so jsonify() (and therefore
+success_response/error_response) encodes payloads in a single native pass.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Datetimes go through Flask's default hook so raw datetimes keep their
+# existing HTTP-date format; marshmallow-dumped payloads are already strings.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider that serializes with orjson.
+
+    Honours the provider's ``sort_keys`` and ``compact`` settings the same way
+    Flask's default provider does.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        """orjson option flags matching the provider settings."""
+        option = ORJSON_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        """Serialize to a JSON string; stdlib kwargs fall back to Flask's encoder."""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
+        """Deserialize request bodies with orjson."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: t.Any, **kwargs: t.Any):
+        """Build a JSON response from orjson bytes without a str round trip.
+
+        Takes the same arguments as Flask's ``response()``; output is indented
+        when ``compact`` is False or, if unset, in debug mode.
+        """
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        if len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs or None
+
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent))
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
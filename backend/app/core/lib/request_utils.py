@@ -0,0 +1,21 @@
+"""Request parsing helpers."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+# Spellings clients actually send, matched without lowercasing the value
+_TRUE_SPELLINGS = frozenset({'true', 'True', 'TRUE'})
+
+
+def parse_bool(value: Optional[str]) -> bool:
+    """Parse a boolean query-string flag.
+
+    "true" in any case is True; anything else (including a missing value)
+    is False. Common spellings are a set lookup, so only unusual casings
+    pay for a lowered copy of the string.
+    """
+
+    if value is None:
+        return False
+    return value in _TRUE_SPELLINGS or value.lower() == 'true'
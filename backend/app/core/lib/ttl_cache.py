@@ -0,0 +1,85 @@
+"""TTL cache.
+
+Small thread-safe in-process LRU cache with per-entry expiry, used where a
+Redis round trip (or the work behind it) is too costly on a hot path.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries (0 disables the cache)
+            ttl: Default seconds an entry stays valid (0 disables the cache)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[t.Hashable, tuple[t.Any, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: t.Hashable, default: t.Any = None) -> t.Any:
+        """Return the live value for `key`, or `default` on a miss/expiry."""
+        if not self.enabled:
+            return default
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: t.Hashable, value: t.Any, ttl: t.Optional[float] = None) -> None:
+        """Store `value`, expiring after `ttl` seconds (capped at the cache TTL)."""
+        if not self.enabled:
+            return
+
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: t.Hashable) -> int:
+        """Drop the given keys; returns how many were present."""
+        with self._lock:
+            return sum(self._entries.pop(key, None) is not None for key in keys)
+
+    def delete_matching(self, pattern: str) -> int:
+        """Drop string keys matching a glob pattern (Redis-style `*`/`?`)."""
+        with self._lock:
+            matched = [k for k in self._entries if isinstance(k, str) and fnmatchcase(k, pattern)]
+            for key in matched:
+                del self._entries[key]
+        return len(matched)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -8,6 +8,7 @@ import os
 
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from limits.strategies import STRATEGIES
 
 from config import settings
 
@@ -28,6 +29,42 @@ def _storage_uri() -> str:
     return "memory://"
 
 
+def _strategy() -> str:
+    """Return the rate limiting strategy.
+
+    Uses the cheap fixed window by default. Against Redis (shared storage)
+    prefer the sliding window counter: two plain counters per limit, far
+    lighter than moving-window sorted sets while still smoothing bursts at
+    window edges. Override with RATELIMIT_STRATEGY.
+    """
+    explicit = os.getenv("RATELIMIT_STRATEGY")
+    if explicit:
+        return explicit
+
+    if _storage_uri().startswith("redis") and "sliding-window-counter" in STRATEGIES:
+        return "sliding-window-counter"
+
+    return "fixed-window"
+
+
+def _storage_options() -> dict:
+    """Return connection options for the limiter storage.
+
+    Redis checks run on every limited request, so they share a bounded pool
+    and use short timeouts; with swallow_errors a slow or unavailable Redis
+    lets requests through instead of failing them.
+    """
+    if not _storage_uri().startswith("redis"):
+        return {}
+
+    return {
+        "max_connections": settings.REDIS_POOL_SIZE,
+        "socket_connect_timeout": 0.5,
+        "socket_timeout": 0.5,
+        "socket_keepalive": True,
+    }
+
+
 def _enabled() -> bool:
     """Enable rate limiting except during tests."""
     if os.getenv("TESTING", "False").lower() == "true":
@@ -40,6 +77,9 @@ def _enabled() -> bool:
 limiter = Limiter(
     key_func=get_remote_address,
     storage_uri=_storage_uri(),
+    storage_options=_storage_options(),
+    strategy=_strategy(),
+    swallow_errors=True,
     default_limits=[],
     enabled=_enabled(),
 )
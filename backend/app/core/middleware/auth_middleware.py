@@ -7,13 +7,56 @@ from functools import wraps
 from flask import request, g
 from app.core.lib.error_utils import error_response
 from app.auth.services import AuthService
-from app.auth.repositories import UserRepository
-from app.auth.models import User
-from app.core.database import get_db
+from app.auth.models import User, UserRole
+from app.core.auth_cache import token_cache
 from config.logging import get_logger
 
 logger = get_logger(__name__)
 
+_ADMIN_ROLE = UserRole.ADMIN.value
+
+# Spellings handled without any allocation beyond the token slice
+_BEARER_PREFIXES = ('Bearer ', 'bearer ')
+
+# Anything shorter cannot be a signed JWT; optional_auth skips verifying it
+_MIN_TOKEN_LENGTH = 20
+
+
+def _parse_bearer(auth_header):
+    """
+    Split a "Bearer <token>" header without exceptions or list allocation.
+    
+    Args:
+        auth_header: Raw Authorization header value
+        
+    Returns:
+        Tuple (token, error_message); exactly one of them is None
+    """
+    if auth_header.startswith(_BEARER_PREFIXES):
+        token = auth_header[7:]
+        if token and ' ' not in token:
+            return token, None
+        return None, 'Invalid authorization header format'
+    
+    scheme, _, token = auth_header.partition(' ')
+    if not token or ' ' in token:
+        return None, 'Invalid authorization header format'
+    if scheme != 'Bearer' and scheme.lower() != 'bearer':
+        return None, 'Invalid token type. Use Bearer token'
+    return token, None
+
+
+def _set_current_user(user_dict):
+    """
+    Store the authenticated user on g for the rest of the request.
+    
+    Flask discards g with the app context, so nothing survives into the next
+    request.
+    """
+    g.current_user = user_dict
+    g.user_id = user_dict['id']
+    g.is_admin = user_dict.get('role') == _ADMIN_ROLE
+
 
 def jwt_required(f):
     """
@@ -35,17 +78,18 @@ def jwt_required(f):
             return error_response('Missing authorization header', 401)
         
         # Extract token from "Bearer <token>"
-        try:
-            token_type, token = auth_header.split(' ')
-            if token_type.lower() != 'bearer':
-                return error_response('Invalid token type. Use Bearer token', 401)
-        except ValueError:
-            return error_response('Invalid authorization header format', 401)
+        token, header_error = _parse_bearer(auth_header)
+        if header_error:
+            return error_response(header_error, 401)
         
-        # Verify token
-        db = get_db()
-        user_repo = UserRepository(db)
-        auth_service = AuthService(user_repo)
+        # Reuse a recent verification of this exact token
+        cached = token_cache.get(token)
+        if cached is not None:
+            _set_current_user(cached[1])
+            return f(*args, **kwargs)
+        
+        # Verify token (shared service; the DB is only touched on a user cache miss)
+        auth_service = AuthService.shared()
         
         payload = auth_service.verify_jwt_token(token)
         if not payload:
@@ -56,9 +100,10 @@ def jwt_required(f):
         if not user_dict or not user_dict.get('is_active'):
             return error_response('User not found or inactive', 401)
         
+        token_cache.set(token, payload, user_dict)
+        
         # Store user dict in Flask's g context
-        g.current_user = user_dict
-        g.user_id = user_dict['id']
+        _set_current_user(user_dict)
         
         return f(*args, **kwargs)
     
@@ -81,7 +126,11 @@ def admin_required(f):
         if not hasattr(g, 'current_user'):
             return error_response('Authentication required', 401)
         
-        if g.current_user.get('role') != 'admin':
+        # Role is resolved once per request by the auth decorators
+        is_admin = g.get('is_admin')
+        if is_admin is None:
+            is_admin = g.current_user.get('role') == _ADMIN_ROLE
+        if not is_admin:
             return error_response('Admin access required', 403)
         
         return f(*args, **kwargs)
@@ -107,18 +156,20 @@ def optional_auth(f):
         
         if auth_header:
             try:
-                token_type, token = auth_header.split(' ')
-                if token_type.lower() == 'bearer':
-                    db = get_db()
-                    user_repo = UserRepository(db)
-                    auth_service = AuthService(user_repo)
-                    
-                    payload = auth_service.verify_jwt_token(token)
-                    if payload:
-                        user_dict = auth_service.get_user_by_id(payload['user_id'])
-                        if user_dict and user_dict.get('is_active'):
-                            g.current_user = user_dict
-                            g.user_id = user_dict['id']
+                token, _ = _parse_bearer(auth_header)
+                if token and len(token) >= _MIN_TOKEN_LENGTH:
+                    cached = token_cache.get(token)
+                    if cached is not None:
+                        _set_current_user(cached[1])
+                    else:
+                        auth_service = AuthService.shared()
+                        
+                        payload = auth_service.verify_jwt_token(token)
+                        if payload:
+                            user_dict = auth_service.get_user_by_id(payload['user_id'])
+                            if user_dict and user_dict.get('is_active'):
+                                token_cache.set(token, payload, user_dict)
+                                _set_current_user(user_dict)
             except Exception as e:
                 logger.warning(f"Optional auth failed: {e}")
                 # Continue without authentication
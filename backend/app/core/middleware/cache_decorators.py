@@ -4,21 +4,72 @@ Cache decorators for route-level caching
 Provides decorators for caching Flask route responses.
 """
 
+import hashlib
+import logging
 from functools import wraps
-from flask import request, jsonify
-from app.core.cache_manager import get_cache
+from urllib.parse import urlencode
+from flask import current_app, request
+from app.core.cache_manager import get_cache, route_body_cache
 from config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Request header asking a paged route to warm the next N pages (see prefetch_pages)
+PREFETCH_HEADER = 'X-Prefetch'
 
-def cache_response(ttl: int = 300, key_prefix: str = None):
+
+def _etag(body: bytes) -> str:
+    """Strong validator for a cached JSON body (unquoted, as Werkzeug expects)."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _query_key(args) -> str:
+    """
+    Query-string part of a route cache key, built from the decoded arguments.
+    
+    Arguments are sorted by name (repeated names keep their order) and
+    re-encoded, so spellings of the same query ("a b" as %20 or +, escaped
+    or literal characters, parameter order) share one cache entry, and
+    keys built for prefetched pages match the ones requests read.
+    """
+    return urlencode(sorted(args.items(multi=True), key=lambda item: item[0]))
+
+
+def _prefetch_next_pages(cache, base_key: str, ttl: int, max_pages: int) -> None:
+    """
+    Load the next pages of a paged route from Redis into the process cache.
+    
+    Sibling keys are built from the current arguments with only `page`
+    changed (see _query_key); their bodies come back in a single MGET.
+    """
+    try:
+        pages = min(int(request.headers[PREFETCH_HEADER]), max_pages)
+        current_page = int(request.args.get('page', 1))
+    except (TypeError, ValueError):
+        return
+    
+    args = request.args.copy()
+    keys = []
+    for page in range(current_page + 1, current_page + 1 + pages):
+        args['page'] = str(page)
+        key = f"{base_key}:{_query_key(args)}"
+        if route_body_cache.get(key) is None:
+            keys.append(key)
+    
+    for key, body in cache.get_many_raw(keys).items():
+        route_body_cache.set(key, (body, _etag(body)), ttl)
+
+
+def cache_response(ttl: int = 300, key_prefix: str = None, prefetch_pages: int = 0):
     """
     Decorator to cache route responses
     
     Args:
         ttl: Time-to-live in seconds (default: 5 minutes)
         key_prefix: Custom key prefix (default: route path)
+        prefetch_pages: For paged routes, up to this many following pages are
+            loaded from Redis (one MGET) into the process cache when the client
+            sends an X-Prefetch: <n> header (default: 0, disabled)
         
     Usage:
         @app.route('/api/chefs')
@@ -28,9 +79,15 @@ def cache_response(ttl: int = 300, key_prefix: str = None):
     
     Note: 
         - Only caches GET requests
+        - Cached responses carry a strong ETag; a matching If-None-Match
+          gets an empty 304 Not Modified
+
         - Includes query parameters in cache key
         - Does not cache authenticated requests (different users)
     """
+    # Header value is fixed per route; build it once instead of per request
+    cache_control = f"public, max-age={ttl}"
+    
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -40,18 +97,13 @@ def cache_response(ttl: int = 300, key_prefix: str = None):
             
             cache = get_cache()
             # If Redis cache is disabled, we still want to emit cache headers so
-            # clients/proxies can cache responses based on TTL.
+            # clients/proxies can cache responses based on TTL. Nothing else runs:
+            # no key building, lookups or body capture.
             if not cache.enabled:
                 result = func(*args, **kwargs)
-                if isinstance(result, tuple):
-                    response_obj, status_code = result
-                    try:
-                        response_obj.headers['Cache-Control'] = f"public, max-age={ttl}"
-                    except Exception:
-                        pass
-                    return response_obj, status_code
+                response_obj = result[0] if type(result) is tuple else result
                 try:
-                    result.headers['Cache-Control'] = f"public, max-age={ttl}"
+                    response_obj.headers['Cache-Control'] = cache_control
                 except Exception:
                     pass
                 return result
@@ -63,57 +115,69 @@ def cache_response(ttl: int = 300, key_prefix: str = None):
             # don't collide and return the wrong cached response.
             prefix = key_prefix or request.path
             path = request.path
-            query_string = request.query_string.decode('utf-8')
+            query_string = _query_key(request.args) if request.query_string else ''
             base_key = f"route:{prefix}:{path}"
             cache_key = f"{base_key}:{query_string}" if query_string else base_key
             
-            # Try to get cached response
-            cached_result = cache.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache HIT for: {cache_key}")
-                response = jsonify(cached_result)
-                response.headers['Cache-Control'] = f"public, max-age={ttl}"
+            if prefetch_pages and route_body_cache.enabled and PREFETCH_HEADER in request.headers:
+                _prefetch_next_pages(cache, base_key, ttl, prefetch_pages)
+            
+            # Try to get cached response (process L1, then Redis); the stored JSON
+            # is already the body, so it is sent as-is without a decode + jsonify round trip.
+            # The L1 keeps the body with its ETag so hits don't rehash it.
+            cached = route_body_cache.get(cache_key)
+            if cached is None:
+                cached_body = cache.get_raw(cache_key)
+                if cached_body is not None:
+                    cached = (cached_body, _etag(cached_body))
+                    route_body_cache.set(cache_key, cached, ttl)
+            if cached is not None:
+                cached_body, etag = cached
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache HIT for: {cache_key}")
+                if request.if_none_match.contains(etag):
+                    # Client already has this body: answer with headers only
+                    response = current_app.response_class(status=304)
+                    response.set_etag(etag)
+                    response.headers['Cache-Control'] = cache_control
+                    return response
+                response = current_app.response_class(cached_body, mimetype='application/json')
+                response.set_etag(etag)
+                response.headers['Cache-Control'] = cache_control
                 return response, 200
             
             # Execute route and cache response
             result = func(*args, **kwargs)
 
-            # Add cache header to successful responses. This is useful even on cache MISS,
-            # because clients/proxies can still cache based on Cache-Control.
-            if isinstance(result, tuple):
+            # Handle both Response objects and tuples (response, status_code).
+            # Views return plain tuples, so an exact type check is enough.
+            is_tuple = type(result) is tuple
+            if is_tuple:
                 response_obj, status_code = result
-                try:
-                    response_obj.headers['Cache-Control'] = f"public, max-age={ttl}"
-                except Exception:
-                    pass
-                result_for_header = (response_obj, status_code)
             else:
-                try:
-                    result.headers['Cache-Control'] = f"public, max-age={ttl}"
-                except Exception:
-                    pass
-                result_for_header = result
-            
-            # Handle both Response objects and tuples (response, status_code)
-            response_data = None
-            status_code = 200
-            
-            if isinstance(result, tuple):
-                # Tuple format: (response, status_code)
-                response_obj, status_code = result
-                if hasattr(response_obj, 'get_json'):
-                    response_data = response_obj.get_json()
-            elif hasattr(result, 'status_code'):
-                # Response object
-                status_code = result.status_code
-                if hasattr(result, 'get_json'):
-                    response_data = result.get_json()
+                response_obj = result
+                status_code = getattr(result, 'status_code', 200)
+
+            # Add cache header to successful responses. This is useful even on cache MISS,
+            # because clients/proxies can still cache based on Cache-Control.
+            response_obj.headers['Cache-Control'] = cache_control
+            result_for_header = (response_obj, status_code) if is_tuple else result
             
-            # Only cache successful responses (status 200)
-            if status_code == 200 and response_data is not None:
+            # Only cache successful JSON responses (status 200). The serialized
+            # body is stored as-is, so neither a MISS nor a later HIT re-encodes it.
+            if (
+                status_code == 200
+                and getattr(response_obj, 'is_json', False)
+                and not response_obj.is_streamed
+            ):
                 try:
-                    cache.set(cache_key, response_data, ttl)
-                    logger.debug(f"Cache SET for: {cache_key} (TTL: {ttl}s)")
+                    body = response_obj.get_data()
+                    etag = _etag(body)
+                    response_obj.set_etag(etag)
+                    cache.set_raw(cache_key, body, ttl)
+                    route_body_cache.set(cache_key, (body, etag), ttl)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Cache SET for: {cache_key} (TTL: {ttl}s)")
                 except Exception as e:
                     logger.warning(f"Could not cache response: {e}")
 
@@ -143,21 +207,18 @@ def invalidate_on_modify(*patterns: str):
             response = func(*args, **kwargs)
             
             # Invalidate cache after successful modification
-            if hasattr(response, 'status_code') and 200 <= response.status_code < 300:
+            # Handle both Response objects and tuple responses (jsonify_obj, status_code)
+            if type(response) is tuple:
+                status_code = response[1]
+            else:
+                status_code = getattr(response, 'status_code', None)
+            
+            if status_code is not None and 200 <= status_code < 300:
                 cache = get_cache()
                 if cache.enabled:
-                    for pattern in patterns:
-                        deleted = cache.delete_pattern(pattern)
-                        logger.info(f"Cache invalidated: {pattern} ({deleted} keys)")
-            elif isinstance(response, tuple):
-                # Handle tuple responses (jsonify_obj, status_code)
-                _, status_code = response
-                if 200 <= status_code < 300:
-                    cache = get_cache()
-                    if cache.enabled:
-                        for pattern in patterns:
-                            deleted = cache.delete_pattern(pattern)
-                            logger.info(f"Cache invalidated: {pattern} ({deleted} keys)")
+                    # All patterns go to Redis in a single call
+                    deleted = cache.delete_patterns(list(patterns))
+                    logger.info(f"Cache invalidated: {', '.join(patterns)} ({deleted} keys)")
             
             return response
         return wrapper
@@ -11,6 +11,7 @@ Examples:
     - chef:list:active:True:v1      (List of active chefs)
     - dish:detail:789:user:1:v1     (Dish 789 owned by user 1)
     - menu:list:chef:5:active:True:v1   (Active menus for chef 5)
+    - chef:profile:123:v1:g4        (Generational helper, generation 4)
 
 Usage:
     from app.core.middleware.cache_helper import CacheHelper
@@ -28,14 +29,153 @@ Usage:
             )
 """
 
-import json
-from typing import Any, Callable, Optional, List
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from flask import g, has_app_context
 from app.core.cache_manager import get_cache
+from config.settings import settings
 from config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _get_schema(schema_class: type, many: bool = False, schema_kwargs: tuple = ()):
+    """
+    Return a shared schema instance per (schema class, many, kwargs) triple.
+    
+    Schema construction binds and deep-copies every declared field, so it is
+    done once per process instead of on every cache miss.
+    
+    Args:
+        schema_class: Marshmallow schema class
+        many: Whether the schema serializes a list
+        schema_kwargs: Extra constructor kwargs as sorted (name, value) pairs
+        
+    Returns:
+        Schema instance to call dump() on
+    """
+    return schema_class(many=many, **dict(schema_kwargs))
+
+
+# Per-key fetch locks: [lock, number of threads using it]. Entries are dropped
+# when the last user leaves, so the dict only holds keys being fetched right now.
+_fetch_locks: Dict[str, list] = {}
+_fetch_locks_guard = threading.Lock()
+
+
+@contextmanager
+def _single_flight(key: str) -> Iterator[None]:
+    """
+    Serialize cache misses for the same key within this process.
+    
+    The first thread fetches and stores; the others wait, then find the
+    value in the cache instead of querying the database again.
+    """
+    with _fetch_locks_guard:
+        entry = _fetch_locks.get(key)
+        if entry is None:
+            entry = _fetch_locks[key] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _fetch_locks_guard:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _fetch_locks[key]
+
+
+class _KeyStats:
+    """
+    Per-process read/write counts per cache key, used to adapt TTLs.
+    
+    Keys read many times per write keep their entries longer (up to
+    CACHE_ADAPTIVE_TTL_MAX times the requested TTL); keys rewritten often get
+    shorter TTLs (down to MIN_FACTOR). Tracking is a bounded LRU, fed only by
+    helpers with adaptive TTLs enabled.
+    """
+    
+    MAX_KEYS = 10000
+    # Reads per write at which a key keeps exactly the requested TTL
+    READS_PER_WRITE = 10
+    # Writes older than this (seconds) no longer count against a key
+    WRITE_WINDOW = 3600
+    MIN_FACTOR = 0.5
+    
+    def __init__(self):
+        # key -> [reads since last write, writes in window, last write time]
+        self._stats: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _entry(self, key: str) -> list:
+        """Return the stats for key, creating/evicting as needed (lock held)."""
+        entry = self._stats.get(key)
+        if entry is None:
+            entry = self._stats[key] = [0, 0, 0.0]
+            if len(self._stats) > self.MAX_KEYS:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key)
+        return entry
+    
+    def record_read(self, key: str) -> None:
+        with self._lock:
+            self._entry(key)[0] += 1
+    
+    def record_write(self, key: str) -> None:
+        now = time.time()
+        with self._lock:
+            entry = self._entry(key)
+            if now - entry[2] > self.WRITE_WINDOW:
+                entry[1] = 0
+            entry[0] = 0
+            entry[1] += 1
+            entry[2] = now
+    
+    def record_write_matching(self, pattern: str) -> None:
+        with self._lock:
+            keys = [key for key in self._stats if fnmatchcase(key, pattern)]
+        for key in keys:
+            self.record_write(key)
+    
+    @staticmethod
+    def max_factor(override: Optional[float] = None) -> float:
+        """Effective TTL multiple cap; 1 or less means adaptive TTLs are off."""
+        return settings.CACHE_ADAPTIVE_TTL_MAX if override is None else override
+    
+    def ttl_for(self, key: str, ttl: int, max_factor: Optional[float] = None) -> int:
+        """Scale the requested TTL by the key's observed reads per write."""
+        max_factor = self.max_factor(max_factor)
+        if max_factor <= 1:
+            return ttl
+        
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                return ttl
+            reads, writes, last_write = entry
+        
+        if writes and time.time() - last_write > self.WRITE_WINDOW:
+            writes = 0
+        factor = reads / (self.READS_PER_WRITE * max(writes, 1))
+        if not writes:
+            # Keys never invalidated are only ever extended
+            factor = max(factor, 1.0)
+        factor = min(max(factor, self.MIN_FACTOR), max_factor)
+        return max(int(ttl * factor), 1)
+
+
+_key_stats = _KeyStats()
+
+
 class CacheHelper:
     """
     Reusable helper for schema-based caching.
@@ -47,19 +187,55 @@ class CacheHelper:
     - Prevent AttributeError when accessing cached data
     """
     
-    def __init__(self, resource_name: str, version: str = "v1"):
+    def __init__(
+        self,
+        resource_name: str,
+        version: str = "v1",
+        generational: bool = False,
+        adaptive_ttl_max: Optional[float] = None
+    ):
         """
         Initialize cache helper for a specific resource type.
         
         Args:
             resource_name: Name of resource (e.g., "chef", "dish", "menu")
             version: Cache version for schema compatibility (default: "v1")
+            generational: Append a generation number kept in Redis to every key,
+                so invalidate_all() drops the whole resource with a single INCR
+                instead of a keyspace SCAN. Costs one GET per request to read
+                the generation (default: False)
+            adaptive_ttl_max: Max TTL multiple for read-mostly keys of this
+                resource; overrides CACHE_ADAPTIVE_TTL_MAX (default: None)
         """
         self.resource_name = resource_name
         self.version = version
+        self.generational = generational
+        self.adaptive_ttl_max = adaptive_ttl_max
+        self._generation_key = f"{resource_name}:__generation__"
         self.cache = get_cache()
     
-    def _build_cache_key(self, key_suffix: str) -> str:
+    def _adaptive(self) -> bool:
+        """Whether this helper adapts TTLs (and so feeds _KeyStats at all)."""
+        return _KeyStats.max_factor(self.adaptive_ttl_max) > 1
+    
+    def _generation(self) -> Optional[int]:
+        """
+        Current generation of this resource, read once per request.
+        
+        None when Redis could not be read: the generation is unknown, so the
+        request must neither read nor write this resource's entries.
+        """
+        if not self.cache.enabled:
+            return 0
+        if not has_app_context():
+            return self.cache.get_counter(self._generation_key)
+        
+        generations = g.setdefault('cache_generations', {})
+        if self.resource_name not in generations:
+            generations[self.resource_name] = self.cache.get_counter(self._generation_key)
+        return generations[self.resource_name]
+    
+    def _build_cache_key(self, key_suffix: str) -> Optional[str]:
         """
         Build full cache key with resource name and version.
         
@@ -69,7 +245,13 @@ class CacheHelper:
         Returns:
             Full cache key following pattern: namespace:entity:identifier:version
             Examples: "chef:profile:123:v1", "dish:detail:456:v1"
+            None for a generational helper whose generation could not be read
         """
+        if self.generational:
+            generation = self._generation()
+            if generation is None:
+                return None
+            return f"{self.resource_name}:{key_suffix}:{self.version}:g{generation}"
         return f"{self.resource_name}:{key_suffix}:{self.version}"
     
     def get_or_set(
@@ -97,7 +279,8 @@ class CacheHelper:
             schema_class: Marshmallow schema class for serialization
             schema_kwargs: Additional kwargs for schema instantiation
                           Example: {'include_admin_data': True}
-            ttl: Time to live in seconds (default: 300)
+            ttl: Time to live in seconds (default: 300); scaled per key by its
+                 observed reads per invalidation (see _KeyStats)
             many: Whether serializing list of objects (default: False)
         
         Returns:
@@ -105,32 +288,59 @@ class CacheHelper:
         """
         # Build full cache key
         full_key = self._build_cache_key(cache_key)
+        if full_key is None:
+            # Generation unknown: bypass the cache entirely
+            data = fetch_func()
+            if data is None:
+                return None
+            return self._serialize(cache_key, data, schema_class, schema_kwargs, many)
+        if self._adaptive():
+            _key_stats.record_read(full_key)
         
         # Try cache first
         cached = self.cache.get(full_key)
         if cached is not None:
-            logger.debug(f"Cache HIT: {full_key}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache HIT: {full_key}")
             return cached
         
-        # Cache miss - fetch from database
-        logger.debug(f"Cache MISS: {full_key}")
+        # Cache miss - fetch from database. With Redis up, concurrent misses for
+        # this key wait for the first fetch instead of all querying at once.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache MISS: {full_key}")
+        if not self.cache.enabled:
+            return self._fetch_and_store(full_key, fetch_func, schema_class, schema_kwargs, ttl, many)
+        
+        with _single_flight(full_key):
+            cached = self.cache.get(full_key)
+            if cached is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache HIT after wait: {full_key}")
+                return cached
+            return self._fetch_and_store(full_key, fetch_func, schema_class, schema_kwargs, ttl, many)
+    
+    def _fetch_and_store(
+        self,
+        full_key: str,
+        fetch_func: Callable,
+        schema_class: type,
+        schema_kwargs: Optional[dict],
+        ttl: int,
+        many: bool
+    ) -> Optional[Any]:
+        """Fetch, serialize and cache one value (the miss path of get_or_set)."""
         data = fetch_func()
         
         if data is None:
             logger.debug(f"Data not found for key: {full_key}")
             return None
         
-        # Serialize with Marshmallow schema
-        schema_kwargs = schema_kwargs or {}
-        schema = schema_class(many=many, **schema_kwargs)
-        
-        try:
-            serialized = schema.dump(data)
-        except Exception as e:
-            logger.error(f"Schema serialization error for '{full_key}': {e}")
+        serialized = self._serialize(full_key, data, schema_class, schema_kwargs, many)
+        if serialized is None:
             return None
         
-        # Cache the serialized data
+        # Cache the serialized data (TTL adapted to the key's read/write ratio)
+        ttl = _key_stats.ttl_for(full_key, ttl, self.adaptive_ttl_max)
         try:
             self.cache.set(full_key, serialized, ttl=ttl)
             count = len(serialized) if many else 1
@@ -140,9 +350,123 @@ class CacheHelper:
         
         return serialized
     
+    @staticmethod
+    def _serialize(full_key: str, data: Any, schema_class: type, schema_kwargs: Optional[dict], many: bool) -> Optional[Any]:
+        """Dump data with a (shared) Marshmallow schema; None on serialization errors."""
+        try:
+            schema = _get_schema(schema_class, many, tuple(sorted((schema_kwargs or {}).items())))
+        except TypeError:
+            # Unhashable kwargs (e.g. a context dict) can't be cached
+            schema = schema_class(many=many, **schema_kwargs)
+        
+        try:
+            return schema.dump(data)
+        except Exception as e:
+            logger.error(f"Schema serialization error for '{full_key}': {e}")
+            return None
+    
+    def get_or_set_many(
+        self,
+        index_key: str,
+        item_key_prefix: str,
+        fetch_all_func: Callable,
+        fetch_by_ids_func: Callable,
+        schema_class: type,
+        schema_kwargs: Optional[dict] = None,
+        ttl: int = 300,
+        id_field: str = "id"
+    ) -> Optional[List[Any]]:
+        """
+        Get a list cached as one entry per item plus an index of item IDs.
+        
+        Unlike get_or_set(many=True), editing one item only requires dropping
+        that item's key; the list is reassembled from the index with one MGET.
+        
+        1. Index hit: MGET every item key; items that expired are fetched with
+           fetch_by_ids_func(missing_ids) and stored again
+        2. Index miss: fetch_all_func() loads the whole list (one query), and
+           the index and every item are stored
+        
+        Args:
+            index_key: Cache key suffix for the ordered ID list
+                      Example: "index:chef:5:active:True" -> dish:index:chef:5:active:True:v1
+            item_key_prefix: Cache key suffix prefix for items
+                            Example: "item" -> dish:item:<id>:v1
+            fetch_all_func: Function returning every object in the list
+            fetch_by_ids_func: Function returning the objects for a list of IDs
+            schema_class: Marshmallow schema class for serialization
+            schema_kwargs: Additional kwargs for schema instantiation
+            ttl: Time to live in seconds for the index and items (default: 300)
+            id_field: Serialized field holding the item ID (default: "id")
+        
+        Returns:
+            List of serialized dicts in index order, or None on serialization errors
+        """
+        full_index_key = self._build_cache_key(index_key)
+        if full_index_key is None:
+            # Generation unknown: bypass the cache entirely
+            return self._serialize(index_key, fetch_all_func(), schema_class, schema_kwargs, True)
+        
+        def item_key(item_id) -> str:
+            return self._build_cache_key(f"{item_key_prefix}:{item_id}")
+        
+        ids = self.cache.get(full_index_key)
+        if ids is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache MISS: {full_index_key}")
+            if not self.cache.enabled:
+                return self._serialize(full_index_key, fetch_all_func(), schema_class, schema_kwargs, True)
+            
+            with _single_flight(full_index_key):
+                ids = self.cache.get(full_index_key)
+                if ids is None:
+                    items = self._serialize(full_index_key, fetch_all_func(), schema_class, schema_kwargs, True)
+                    if items is None:
+                        return None
+                    self.cache.set_many({item_key(item[id_field]): item for item in items}, ttl=ttl)
+                    self.cache.set(full_index_key, [item[id_field] for item in items], ttl=ttl)
+                    logger.info(f"Cached {len(items)} item(s) under '{full_index_key}' (TTL: {ttl}s)")
+                    return items
+        
+        # Index hit: reassemble the list in one MGET
+        keys = [item_key(item_id) for item_id in ids]
+        found = self.cache.get_many(keys)
+        missing = [item_id for item_id, key in zip(ids, keys) if key not in found]
+        if missing:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache MISS: {len(missing)}/{len(ids)} item(s) for '{full_index_key}'")
+            fetched = self._serialize(full_index_key, fetch_by_ids_func(missing), schema_class, schema_kwargs, True)
+            if fetched is None:
+                return None
+            refreshed = {item_key(item[id_field]): item for item in fetched}
+            self.cache.set_many(refreshed, ttl=ttl)
+            found.update(refreshed)
+        
+        # IDs whose item no longer exists are skipped
+        return [found[key] for key in keys if key in found]
+    
+    def set(self, cache_key: str, value: Any, ttl: int = 300) -> None:
+        """
+        Store an already-serialized value (write-through after a create/update).
+        
+        Args:
+            cache_key: Cache key suffix (will be prefixed with resource:version:)
+            value: Serialized dict/list, as returned by schema.dump()
+            ttl: Time to live in seconds (default: 300)
+        """
+        full_key = self._build_cache_key(cache_key)
+        if full_key is None:
+            return
+        try:
+            self.cache.set(full_key, value, ttl=ttl)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache WRITE-THROUGH: {full_key}")
+        except Exception as e:
+            logger.error(f"Failed to write through cache key '{full_key}': {e}")
+    
     def invalidate(self, *key_suffixes: str) -> None:
         """
-        Invalidate multiple cache keys.
+        Invalidate multiple cache keys (one Redis round trip).
         
         Args:
             *key_suffixes: Cache key suffixes to invalidate
@@ -150,16 +474,37 @@ class CacheHelper:
         Example:
             helper.invalidate("123", "all", "user:456:all")
         """
-        for suffix in key_suffixes:
-            full_key = self._build_cache_key(suffix)
-            try:
-                deleted = self.cache.delete(full_key)
-                if deleted:
-                    logger.info(f"Cache invalidated: {full_key}")
-                else:
-                    logger.debug(f"Cache key not found: {full_key}")
-            except Exception as e:
-                logger.error(f"Failed to invalidate cache key '{full_key}': {e}")
+        full_keys = [self._build_cache_key(suffix) for suffix in key_suffixes]
+        if None in full_keys:
+            logger.error(f"Cache generation unknown, '{self.resource_name}' keys not invalidated: {key_suffixes}")
+            return
+        if self._adaptive():
+            for full_key in full_keys:
+                _key_stats.record_write(full_key)
+        try:
+            deleted = self.cache.delete_many(full_keys)
+            logger.info(f"Cache invalidated: {deleted}/{len(full_keys)} key(s) {full_keys}")
+        except Exception as e:
+            logger.error(f"Failed to invalidate cache keys {full_keys}: {e}")
+    
+    def invalidate_all(self) -> None:
+        """
+        Invalidate every cache key of this resource.
+        
+        Generational helpers move to a new generation (one INCR); entries of
+        the old one are never read again and expire through their TTL. Other
+        helpers fall back to invalidate_pattern("*").
+        """
+        if not self.generational:
+            self.invalidate_pattern("*")
+            return
+        
+        generation = self.cache.incr(self._generation_key)
+        if generation is None:
+            return
+        if has_app_context():
+            g.setdefault('cache_generations', {})[self.resource_name] = generation
+        logger.info(f"Cache generation bumped: {self.resource_name} -> {generation}")
     
     def invalidate_pattern(self, pattern: str) -> int:
         """
@@ -175,6 +520,11 @@ class CacheHelper:
             helper.invalidate_pattern("*")  # Clear all for this resource
         """
         full_pattern = self._build_cache_key(pattern)
+        if full_pattern is None:
+            logger.error(f"Cache generation unknown, pattern '{pattern}' not invalidated for '{self.resource_name}'")
+            return 0
+        if self._adaptive():
+            _key_stats.record_write_matching(full_pattern)
         try:
             deleted = self.cache.delete_pattern(full_pattern)
             logger.info(f"Cache pattern invalidated: {full_pattern} ({deleted} keys)")
@@ -3,7 +3,7 @@ Request Decorators
 Reusable decorators for request validation and processing.
 """
 
-from functools import wraps
+from functools import lru_cache, wraps
 from flask import request
 from marshmallow import ValidationError, Schema
 from app.core.lib.error_utils import error_response
@@ -12,6 +12,23 @@ from config.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _get_schema(schema_class: type[Schema]) -> Schema:
+    """
+    Return a shared schema instance per schema class.
+    
+    Schema construction binds and deep-copies every declared field, so it is
+    done once per process instead of once per request.
+    
+    Args:
+        schema_class: Marshmallow schema class
+        
+    Returns:
+        Schema instance to call load() on
+    """
+    return schema_class()
+
+
 def validate_json(schema_class: type[Schema] = None):
     """
     Decorator to validate JSON request body.
@@ -28,10 +45,19 @@ def validate_json(schema_class: type[Schema] = None):
         def register():
             validated_data = request.validated_data
     """
+    # Resolved once per decorated endpoint, not on every request
+    schema = _get_schema(schema_class) if schema_class else None
+    
     def decorator(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
-            # Parse JSON
+            # An empty body is rejected before parsing (no decode-error path).
+            # get_data() caches the bytes, so get_json() below doesn't re-read them.
+            if not request.get_data():
+                return error_response('Request body is required', 400)
+            
+            # Parse JSON (orjson via the app's JSON provider; the result is
+            # cached on the request, so handlers can call get_json() again)
             try:
                 data = request.get_json()
             except Exception as e:
@@ -42,9 +68,8 @@ def validate_json(schema_class: type[Schema] = None):
                 return error_response('Request body is required', 400)
             
             # Validate with schema if provided
-            if schema_class:
+            if schema is not None:
                 try:
-                    schema = schema_class()
                     validated_data = schema.load(data)
                     # Store validated data in request object
                     request.validated_data = validated_data
@@ -62,17 +87,21 @@ def require_content_type(content_type='application/json'):
     Decorator to enforce specific Content-Type header.
     
     Args:
-        content_type: Required Content-Type value
+        content_type: Required media type (parameters such as charset are ignored)
         
     Usage:
         @require_content_type('application/json')
         def my_endpoint():
             ...
     """
+    # Compared against the parsed mimetype, so "application/json; charset=utf-8"
+    # matches "application/json"
+    expected = content_type.lower()
+    
     def decorator(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
-            if request.content_type != content_type:
+            if request.mimetype != expected:
                 logger.warning(f"Invalid Content-Type for {request.path}: {request.content_type}")
                 return error_response(
                     f'Content-Type must be {content_type}',
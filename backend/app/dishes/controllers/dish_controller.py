@@ -1,16 +1,17 @@
 """
 Dish Controller - HTTP request/response handling for dish endpoints
 """
-from flask import request, jsonify, g
+from flask import request, g
 from app.dishes.schemas import (
     DishCreateSchema,
     DishUpdateSchema,
-    DishResponseSchema
+    dish_response_schema
 )
 from app.dishes.services import DishService
 from app.dishes.repositories import DishRepository
 from app.chefs.repositories import ChefRepository
 from app.core.lib.error_utils import error_response, success_response
+from app.core.lib.request_utils import parse_bool
 from app.core.database import get_db
 from app.core.middleware.request_decorators import validate_json
 from config.logging import get_logger
@@ -28,12 +29,17 @@ class DishController:
     def _get_service(self):
         """
         Get dish service with database session.
-        Creates new instances per request using Flask's g.db.
+        Built once per request (memoized on Flask's g alongside g.db).
         """
+        service = getattr(g, '_dish_service', None)
+        if service is not None:
+            return service
+        
         db = get_db()
         dish_repo = DishRepository(db)
         chef_repo = ChefRepository(db)
-        return DishService(dish_repo, chef_repo)
+        service = g._dish_service = DishService(dish_repo, chef_repo)
+        return service
     
     @validate_json(DishCreateSchema)
     def create_dish(self, current_user):
@@ -78,8 +84,8 @@ class DishController:
             dish = service.create_dish(current_user['id'], dish_data)
             
             # Serialize response
-            schema = DishResponseSchema()
-            result = schema.dump(dish)
+            result = dish_response_schema.dump(dish)
+            service.cache_dish(result, current_user['id'])
             
             self.logger.info(f"Dish created for chef {current_user['id']}")
             return success_response(
@@ -111,7 +117,7 @@ class DishController:
             service = self._get_service()
             
             # Check if we should filter by active only
-            active_only = request.args.get('active_only', 'false').lower() == 'true'
+            active_only = parse_bool(request.args.get('active_only'))
             
             result = service.get_all_dishes_cached(current_user['id'], active_only=active_only)
             
@@ -184,8 +190,8 @@ class DishController:
             dish = service.update_dish(dish_id, current_user['id'], update_data)
             
             # Serialize response
-            schema = DishResponseSchema()
-            result = schema.dump(dish)
+            result = dish_response_schema.dump(dish)
+            service.cache_dish(result, current_user['id'])
             
             self.logger.info(f"Dish {dish_id} updated")
             return success_response(
@@ -1,8 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, ForeignKey, DateTime
+from operator import attrgetter
+from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from app.core.lib.time_utils import utcnow_naive
 from app.core.database import Base
 
+# to_dict() output keys, read in one attrgetter call instead of 13 lookups
+_DICT_KEYS = (
+    'id', 'chef_id', 'name', 'description', 'price', 'category', 'preparation_steps',
+    'prep_time', 'servings', 'photo_url', 'is_active', 'created_at', 'updated_at'
+)
+_get_dict_values = attrgetter(*_DICT_KEYS)
+
 
 class Dish(Base):
     """
@@ -10,7 +18,11 @@ class Dish(Base):
     Schema: core
     """
     __tablename__ = 'dishes'
-    __table_args__ = {'schema': 'core'}
+    __table_args__ = (
+        # Partial index for the active_only dish list (skips inactive dishes)
+        Index('ix_dishes_chef_active', 'chef_id', postgresql_where=text('is_active = true')),
+        {'schema': 'core'}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     chef_id = Column(Integer, ForeignKey('core.chefs.id', ondelete='CASCADE'), nullable=False, index=True)
@@ -35,21 +47,12 @@ class Dish(Base):
     
     def to_dict(self, include_ingredients=True):
         """Convert model to dictionary"""
-        data = {
-            'id': self.id,
-            'chef_id': self.chef_id,
-            'name': self.name,
-            'description': self.description,
-            'price': float(self.price) if self.price else None,
-            'category': self.category,
-            'preparation_steps': self.preparation_steps,
-            'prep_time': self.prep_time,
-            'servings': self.servings,
-            'photo_url': self.photo_url,
-            'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        values = _get_dict_values(self)
+        data = dict(zip(_DICT_KEYS, values))
+        price, created_at, updated_at = values[4], values[11], values[12]
+        data['price'] = float(price) if price is not None else None
+        data['created_at'] = created_at.isoformat() if created_at else None
+        data['updated_at'] = updated_at.isoformat() if updated_at else None
         
         if include_ingredients and self.ingredients:
             data['ingredients'] = [ing.to_dict() for ing in self.ingredients]
@@ -1,8 +1,13 @@
+from operator import attrgetter
 from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
 from app.core.lib.time_utils import utcnow_naive
 from app.core.database import Base
 
+# to_dict() output keys, read in one attrgetter call
+_DICT_KEYS = ('id', 'dish_id', 'name', 'quantity', 'unit', 'is_optional', 'created_at', 'updated_at')
+_get_dict_values = attrgetter(*_DICT_KEYS)
+
 
 class Ingredient(Base):
     """
@@ -28,14 +33,10 @@ class Ingredient(Base):
         return f"<Ingredient(id={self.id}, name='{self.name}', dish_id={self.dish_id})>"
     
     def to_dict(self):
-        """Convert model to dictionary"""
-        return {
-            'id': self.id,
-            'dish_id': self.dish_id,
-            'name': self.name,
-            'quantity': float(self.quantity) if self.quantity else None,
-            'unit': self.unit,
-            'is_optional': self.is_optional,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        """Convert model to dictionary (quantity stays a string, e.g. "1/2 cup")"""
+        values = _get_dict_values(self)
+        data = dict(zip(_DICT_KEYS, values))
+        created_at, updated_at = values[6], values[7]
+        data['created_at'] = created_at.isoformat() if created_at else None
+        data['updated_at'] = updated_at.isoformat() if updated_at else None
+        return data
@@ -1,9 +1,16 @@
 """
 Dish Repository - Data access layer for Dish and Ingredient models
 """
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
 from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import SQLAlchemyError
+from app.chefs.models.chef_model import Chef
 from app.dishes.models.dish_model import Dish
 from app.dishes.models.ingredient_model import Ingredient
 from config.logging import get_logger
@@ -11,6 +18,41 @@ from config.logging import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class IngredientRow:
+    """Ingredient fields of a dish list item (see IngredientSchema)"""
+    id: int
+    dish_id: int
+    name: str
+    quantity: Optional[str]
+    unit: Optional[str]
+    is_optional: bool
+
+
+@dataclass(slots=True)
+class DishListRow:
+    """Dish list item read without the ORM (see DishListResponseSchema)"""
+    id: int
+    chef_id: int
+    name: str
+    price: Optional[Decimal]
+    category: Optional[str]
+    prep_time: Optional[int]
+    servings: Optional[int]
+    photo_url: Optional[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    ingredients: List[IngredientRow] = field(default_factory=list)
+
+
+_dishes = Dish.__table__
+_ingredients = Ingredient.__table__
+# Selected in dataclass field order
+_DISH_LIST_COLUMNS = tuple(_dishes.c[name] for name in DishListRow.__dataclass_fields__ if name != 'ingredients')
+_INGREDIENT_LIST_COLUMNS = tuple(_ingredients.c[name] for name in IngredientRow.__dataclass_fields__)
+
+
 class DishRepository:
     """Repository for Dish and Ingredient database operations"""
     
@@ -37,19 +79,56 @@ class DishRepository:
             self.db.flush()  # Get dish ID
             
             # Add ingredients if provided
-            if ingredients_data:
-                for ing_data in ingredients_data:
-                    ing_data['dish_id'] = dish.id
-                    ingredient = Ingredient(**ing_data)
-                    self.db.add(ingredient)
+            self._insert_ingredients(dish, ingredients_data)
             
-            self.db.flush()
             logger.info(f"Dish created with ID: {dish.id}, {len(ingredients_data or [])} ingredients")
             return dish
         except SQLAlchemyError as e:
             logger.error(f"Error creating dish: {e}", exc_info=True)
             raise
     
+    def _insert_ingredients(self, dish: Dish, ingredients_data: Optional[List[dict]]) -> None:
+        """
+        Insert a dish's ingredients with one multi-row INSERT ... RETURNING
+        
+        The returned rows become dish.ingredients as-is (no change event), so
+        serializing the dish afterwards doesn't SELECT them again.
+        """
+        ingredients = []
+        if ingredients_data:
+            for ing_data in ingredients_data:
+                ing_data['dish_id'] = dish.id
+            # populate_existing: an identity left in the session by the
+            # unsynchronized DELETE in update() is overwritten, not reused stale
+            ingredients = self.db.scalars(
+                insert(Ingredient).returning(Ingredient, sort_by_parameter_order=True),
+                ingredients_data,
+                execution_options={'populate_existing': True}
+            ).all()
+        set_committed_value(dish, 'ingredients', ingredients)
+    
+    @staticmethod
+    def _same_ingredients(dish: Dish, ingredients_data: List[dict]) -> bool:
+        """
+        Whether ingredients_data holds the dish's current ingredients (any order)
+        
+        Compares against the loaded dish.ingredients collection; quantities are
+        compared as stored (VARCHAR).
+        """
+        current = Counter(
+            (ing.name, ing.quantity, ing.unit, ing.is_optional) for ing in dish.ingredients
+        )
+        incoming = Counter(
+            (
+                data.get('name'),
+                None if data.get('quantity') is None else str(data['quantity']),
+                data.get('unit'),
+                bool(data.get('is_optional', False)),
+            )
+            for data in ingredients_data
+        )
+        return current == incoming
+    
     def get_by_id(self, dish_id: int, include_ingredients: bool = True) -> Optional[Dish]:
         """
         Get dish by ID
@@ -74,19 +153,51 @@ class DishRepository:
             logger.error(f"Error retrieving dish by ID {dish_id}: {e}", exc_info=True)
             raise
     
-    def get_by_chef_id(self, chef_id: int, active_only: bool = False) -> List[Dish]:
+    def get_owned_by_chef_user(self, user_id: int, dish_id: int) -> Optional[Dish]:
+        """
+        Get dish (with ingredients) by ID only if it belongs to the chef of the given user
+        
+        Resolves ownership with a single JOIN on chefs instead of fetching
+        the chef profile first.
+        
+        Args:
+            user_id: User ID of the owning chef
+            dish_id: Dish ID
+            
+        Returns:
+            Dish instance or None if not found or not owned
+        """
+        try:
+            dish = self.db.query(Dish).join(Chef, Dish.chef_id == Chef.id).options(
+                joinedload(Dish.ingredients)
+            ).filter(
+                Chef.user_id == user_id,
+                Dish.id == dish_id
+            ).first()
+            if dish:
+                logger.debug(f"Retrieved dish ID: {dish_id} for user {user_id}")
+            return dish
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving dish {dish_id} for user {user_id}: {e}", exc_info=True)
+            raise
+    
+    def get_by_chef_id(self, chef_id: int, active_only: bool = False, include_ingredients: bool = True) -> List[Dish]:
         """
         Get all dishes for a specific chef
         
         Args:
             chef_id: Chef ID
             active_only: If True, only return active dishes
+            include_ingredients: If True, load all dishes' ingredients in one
+                extra query (instead of one lazy load per dish on serialization)
             
         Returns:
             List of Dish instances
         """
         try:
             query = self.db.query(Dish).filter(Dish.chef_id == chef_id)
+            if include_ingredients:
+                query = query.options(selectinload(Dish.ingredients))
             if active_only:
                 query = query.filter(Dish.is_active == True)
             return query.all()
@@ -94,6 +205,49 @@ class DishRepository:
             logger.error(f"Error retrieving dishes for chef {chef_id}: {e}", exc_info=True)
             raise
     
+    def get_list_rows(
+        self,
+        chef_id: int,
+        active_only: bool = False,
+        dish_ids: Optional[List[int]] = None
+    ) -> List[DishListRow]:
+        """
+        Get a chef's dishes (with ingredients) as plain rows for list responses
+        
+        Only the list columns are selected (no description/preparation_steps),
+        and rows are read with Core statements, so no ORM instances are built
+        or added to the session. Ingredients take one extra query.
+        
+        Args:
+            chef_id: Chef ID
+            active_only: If True, only return active dishes
+            dish_ids: If given, only these dishes are returned
+            
+        Returns:
+            List of DishListRow (IDs not found are skipped)
+        """
+        if dish_ids is not None and not dish_ids:
+            return []
+        try:
+            stmt = select(*_DISH_LIST_COLUMNS).where(_dishes.c.chef_id == chef_id)
+            if active_only:
+                stmt = stmt.where(_dishes.c.is_active == True)
+            if dish_ids is not None:
+                stmt = stmt.where(_dishes.c.id.in_(dish_ids))
+            rows = [DishListRow(*row) for row in self.db.execute(stmt)]
+            if not rows:
+                return rows
+            
+            by_id = {row.id: row for row in rows}
+            ingredient_stmt = select(*_INGREDIENT_LIST_COLUMNS).where(_ingredients.c.dish_id.in_(by_id))
+            for values in self.db.execute(ingredient_stmt):
+                ingredient = IngredientRow(*values)
+                by_id[ingredient.dish_id].ingredients.append(ingredient)
+            return rows
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving dish rows for chef {chef_id}: {e}", exc_info=True)
+            raise
+    
     def get_by_chef_and_name(self, chef_id: int, name: str) -> Optional[Dish]:
         """
         Check if dish with name already exists for chef
@@ -121,7 +275,7 @@ class DishRepository:
         
         Args:
             dish: Dish instance to update
-            update_data: Dictionary with fields to update
+            update_data: Dictionary of Dish column names to new values
             ingredients_data: If provided, replaces all ingredients
             
         Returns:
@@ -131,21 +285,23 @@ class DishRepository:
             SQLAlchemyError: If database operation fails
         """
         try:
-            # Update dish fields
+            # Update dish fields (callers pass column names only)
             for key, value in update_data.items():
-                if hasattr(dish, key):
-                    setattr(dish, key, value)
+                setattr(dish, key, value)
             
-            # Replace ingredients if provided
-            if ingredients_data is not None:
-                # Delete existing ingredients
-                self.db.query(Ingredient).filter(Ingredient.dish_id == dish.id).delete()
+            # Replace ingredients if provided and different (an unchanged list
+            # keeps its rows and IDs, and costs no DELETE/INSERT)
+            if ingredients_data is not None and not self._same_ingredients(dish, ingredients_data):
+                # Delete existing ingredients (one DELETE; the loaded collection
+                # is replaced below instead of synchronized object by object)
+                self.db.execute(
+                    delete(Ingredient)
+                    .where(Ingredient.dish_id == dish.id)
+                    .execution_options(synchronize_session=False)
+                )
                 
                 # Add new ingredients
-                for ing_data in ingredients_data:
-                    ing_data['dish_id'] = dish.id
-                    ingredient = Ingredient(**ing_data)
-                    self.db.add(ingredient)
+                self._insert_ingredients(dish, ingredients_data)
             
             self.db.flush()
             logger.info(f"Updated dish ID: {dish.id}")
@@ -2,7 +2,7 @@
 Dish Routes
 Blueprint registration for dish endpoints
 """
-from flask import Blueprint
+from flask import Blueprint, g
 from app.dishes.controllers import DishController
 from app.core.middleware.auth_middleware import jwt_required
 from app.core.middleware.cache_decorators import invalidate_on_modify
@@ -24,7 +24,6 @@ def create_dish():
     Requires: Authorization header with Bearer token
     Invalidates: All public dish caches
     """
-    from flask import g
     return dish_controller.create_dish(g.current_user)
 
 
@@ -37,7 +36,6 @@ def get_all_dishes():
     Query params: active_only=true (optional)
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return dish_controller.get_all_dishes(g.current_user)
 
 
@@ -49,7 +47,6 @@ def get_dish_by_id(dish_id):
     Get dish by ID with ingredients
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return dish_controller.get_dish_by_id(dish_id, g.current_user)
 
 
@@ -63,7 +60,6 @@ def update_dish(dish_id):
     Requires: Authorization header with Bearer token
     Invalidates: All public dish caches
     """
-    from flask import g
     return dish_controller.update_dish(dish_id, g.current_user)
 
 
@@ -77,5 +73,4 @@ def delete_dish(dish_id):
     Requires: Authorization header with Bearer token
     Invalidates: All public dish caches
     """
-    from flask import g
     return dish_controller.delete_dish(dish_id, g.current_user)
@@ -2,12 +2,16 @@ from .dish_schema import (
     IngredientSchema,
     DishCreateSchema,
     DishUpdateSchema,
-    DishResponseSchema
+    DishResponseSchema,
+    DishListResponseSchema,
+    dish_response_schema
 )
 
 __all__ = [
     'IngredientSchema',
     'DishCreateSchema',
     'DishUpdateSchema',
-    'DishResponseSchema'
+    'DishResponseSchema',
+    'DishListResponseSchema',
+    'dish_response_schema'
 ]
@@ -1,7 +1,28 @@
 """
 Dish schemas for validation and serialization
 """
-from marshmallow import Schema, fields, validate, validates, ValidationError
+from marshmallow import Schema, fields, utils, validate, validates, ValidationError
+
+MAX_INGREDIENTS = 50
+
+
+class BoundedList(fields.List):
+    """
+    List field that rejects inputs longer than max_length before loading items
+    
+    A List's validate= runs after every item has been deserialized, so an
+    oversized payload would still pay for loading all of its nested items.
+    """
+    default_error_messages = {'too_long': 'Maximum {max_length} items allowed'}
+    
+    def __init__(self, cls_or_instance, *, max_length: int, **kwargs):
+        super().__init__(cls_or_instance, **kwargs)
+        self.max_length = max_length
+    
+    def _deserialize(self, value, attr, data, **kwargs):
+        if utils.is_collection(value) and len(value) > self.max_length:
+            raise self.make_error('too_long', max_length=self.max_length)
+        return super()._deserialize(value, attr, data, **kwargs)
 
 
 class IngredientSchema(Schema):
@@ -23,19 +44,16 @@ class DishCreateSchema(Schema):
     prep_time = fields.Int(required=True, allow_none=False, validate=validate.Range(min=1, max=1440))  # Max 24 hours
     servings = fields.Int(required=True, allow_none=False, validate=validate.Range(min=1, max=100))
     photo_url = fields.Str(required=False, allow_none=True, validate=validate.Length(max=500))
-    ingredients = fields.List(fields.Nested(IngredientSchema), required=False, load_default=[])
+    ingredients = BoundedList(
+        fields.Nested(IngredientSchema), max_length=MAX_INGREDIENTS, required=False, load_default=[],
+        error_messages={'too_long': f'Maximum {MAX_INGREDIENTS} ingredients allowed per dish'}
+    )
     
     @validates('price')
     def validate_price(self, value, **kwargs):
         """Validate price is positive"""
         if value is not None and value < 0:
             raise ValidationError('Price must be positive')
-    
-    @validates('ingredients')
-    def validate_ingredients(self, value, **kwargs):
-        """Validate ingredients list"""
-        if len(value) > 50:
-            raise ValidationError('Maximum 50 ingredients allowed per dish')
 
 
 class DishUpdateSchema(Schema):
@@ -49,19 +67,16 @@ class DishUpdateSchema(Schema):
     servings = fields.Int(required=False, allow_none=True, validate=validate.Range(min=1, max=100))
     photo_url = fields.Str(required=False, allow_none=True, validate=validate.Length(max=500))
     is_active = fields.Bool(required=False)
-    ingredients = fields.List(fields.Nested(IngredientSchema), required=False)
+    ingredients = BoundedList(
+        fields.Nested(IngredientSchema), max_length=MAX_INGREDIENTS, required=False,
+        error_messages={'too_long': f'Maximum {MAX_INGREDIENTS} ingredients allowed per dish'}
+    )
     
     @validates('price')
     def validate_price(self, value, **kwargs):
         """Validate price is positive"""
         if value is not None and value < 0:
             raise ValidationError('Price must be positive')
-    
-    @validates('ingredients')
-    def validate_ingredients(self, value, **kwargs):
-        """Validate ingredients list"""
-        if value is not None and len(value) > 50:
-            raise ValidationError('Maximum 50 ingredients allowed per dish')
 
 
 class DishResponseSchema(Schema):
@@ -80,3 +95,13 @@ class DishResponseSchema(Schema):
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
     ingredients = fields.List(fields.Nested(IngredientSchema), dump_only=True)
+
+
+class DishListResponseSchema(DishResponseSchema):
+    """Schema for dish list items (long text fields are only sent by the detail endpoint)"""
+    class Meta:
+        exclude = ('description', 'preparation_steps')
+
+
+# Schema instances for reuse
+dish_response_schema = DishResponseSchema()
@@ -3,16 +3,23 @@ Dish Service - Business logic for dish management
 Note: Cloudinary integration will be added later when configured
 """
 from typing import Optional, List
+from flask import has_app_context
 from app.dishes.repositories.dish_repository import DishRepository
 from app.dishes.models.dish_model import Dish
-from app.dishes.schemas.dish_schema import DishResponseSchema
-from app.chefs.repositories.chef_repository import ChefRepository
-from app.core.cache_manager import invalidate_cache
+from app.dishes.schemas.dish_schema import DishResponseSchema, DishListResponseSchema
+from app.chefs.repositories.chef_repository import ChefRepository, get_chef_for_user
+from app.core.database import call_after_commit
 from app.core.middleware.cache_helper import CacheHelper
 from config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Dish columns a chef may change through update_dish()
+_ALLOWED_UPDATE_FIELDS = frozenset({
+    'name', 'description', 'price', 'category', 'preparation_steps',
+    'prep_time', 'servings', 'photo_url', 'is_active'
+})
+
 
 class DishService:
     """Service for dish business logic"""
@@ -37,7 +44,7 @@ class DishService:
             ValueError: If chef profile not found or dish name already exists
         """
         # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         if not chef:
             logger.warning(f"Attempted to create dish for user {user_id} without chef profile")
             raise ValueError("Chef profile not found. Please create your chef profile first.")
@@ -51,7 +58,7 @@ class DishService:
                 raise ValueError(f"You already have a dish named '{dish_name}'. Please use a different name.")
         
         # Extract ingredients from dish_data
-        ingredients_data = dish_data.pop('ingredients', [])
+        ingredients_data = dish_data.pop('ingredients', None)
         
         # Add chef_id to dish data
         dish_data['chef_id'] = chef.id
@@ -59,9 +66,12 @@ class DishService:
         dish = self.dish_repository.create(dish_data, ingredients_data)
         logger.info(f"Created dish {dish.id} for chef {chef.id}")
         
-        # Invalidate related caches
-        self.cache_helper.invalidate(f"*:user:{user_id}:*")  # Invalidate all user's dishes
-        invalidate_cache('route:public:dishes:*')  # Clear public route cache
+        # Invalidate related caches (the new dish joins the chef's list indexes).
+        # route:public:dishes:* is cleared once by the route's @invalidate_on_modify.
+        self.cache_helper.invalidate(
+            f"index:chef:{chef.id}:active:True",
+            f"index:chef:{chef.id}:active:False"
+        )
         
         return dish
     
@@ -79,19 +89,16 @@ class DishService:
         Raises:
             ValueError: If chef profile not found
         """
-        # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
-        if not chef:
-            raise ValueError("Chef profile not found")
+        # Single query: dish joined to its chef, filtered by owner
+        dish = self.dish_repository.get_owned_by_chef_user(user_id, dish_id)
+        if dish:
+            return dish
         
-        # Get dish
-        dish = self.dish_repository.get_by_id(dish_id, include_ingredients=True)
+        # Miss path only: tell "no chef profile" apart from "not found / not owned"
+        if not get_chef_for_user(self.chef_repository, user_id):
+            raise ValueError("Chef profile not found")
         
-        # Verify ownership
-        if not dish or dish.chef_id != chef.id:
-            return None
-            
-        return dish
+        return None
     
     def get_dish_by_id_cached(self, dish_id: int, user_id: int) -> Optional[dict]:
         """
@@ -107,28 +114,14 @@ class DishService:
         Raises:
             ValueError: If chef profile not found
         """
-        # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
-        if not chef:
-            raise ValueError("Chef profile not found")
-        
+        # The key is per user, so the chef lookup only runs on a miss
         return self.cache_helper.get_or_set(
             cache_key=f"detail:{dish_id}:user:{user_id}",
-            fetch_func=lambda: self._get_dish_if_owned(dish_id, chef.id),
+            fetch_func=lambda: self.get_dish_by_id(dish_id, user_id),
             schema_class=DishResponseSchema,
             ttl=600
         )
     
-    def _get_dish_if_owned(self, dish_id: int, chef_id: int) -> Optional[Dish]:
-        """Helper to get dish only if owned by chef"""
-        dish = self.dish_repository.get_by_id(dish_id, include_ingredients=True)
-        
-        # Verify ownership
-        if not dish or dish.chef_id != chef_id:
-            return None
-            
-        return dish
-    
     def get_all_dishes(self, user_id: int, active_only: bool = False) -> List[Dish]:
         """
         Get all dishes for the logged in chef - Returns ORM objects for internal use
@@ -144,7 +137,7 @@ class DishService:
             ValueError: If chef profile not found
         """
         # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         if not chef:
             raise ValueError("Chef profile not found")
         
@@ -161,24 +154,52 @@ class DishService:
             active_only: Whether to filter only active dishes
             
         Returns:
-            List of serialized dish dicts
+            List of serialized dish dicts (without description/preparation_steps)
             
         Raises:
             ValueError: If chef profile not found
         """
         # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         if not chef:
             raise ValueError("Chef profile not found")
         
-        return self.cache_helper.get_or_set(
-            cache_key=f"list:chef:{chef.id}:active:{active_only}",
-            fetch_func=lambda: self.dish_repository.get_by_chef_id(chef.id, active_only=active_only),
-            schema_class=DishResponseSchema,
-            ttl=300,
-            many=True
+        # Cached as one entry per dish plus an ID index, so editing a dish
+        # only drops that dish's entry instead of the whole list
+        return self.cache_helper.get_or_set_many(
+            index_key=f"index:chef:{chef.id}:active:{active_only}",
+            item_key_prefix="item",
+            fetch_all_func=lambda: self.dish_repository.get_list_rows(chef.id, active_only=active_only),
+            fetch_by_ids_func=lambda dish_ids: self.dish_repository.get_list_rows(chef.id, dish_ids=dish_ids),
+            schema_class=DishListResponseSchema,
+            ttl=300
         )
     
+    def cache_dish(self, dish_data: dict, user_id: int) -> None:
+        """
+        Write a freshly serialized dish through to its cache entries
+        
+        Called after create/update so the next detail or list read hits the
+        cache instead of re-querying the dish that was just written. Within a
+        request the write waits for the teardown commit, and is skipped if the
+        transaction rolls back.
+        
+        Args:
+            dish_data: Dish serialized with DishResponseSchema
+            user_id: User ID of the chef
+        """
+        dish_id = dish_data['id']
+        list_item = {k: v for k, v in dish_data.items() if k not in DishListResponseSchema.Meta.exclude}
+        
+        def write_through():
+            self.cache_helper.set(f"item:{dish_id}", list_item, ttl=300)
+            self.cache_helper.set(f"detail:{dish_id}:user:{user_id}", dish_data, ttl=600)
+        
+        if has_app_context():
+            call_after_commit(write_through)
+        else:
+            write_through()
+    
     def update_dish(self, dish_id: int, user_id: int, update_data: dict) -> Dish:
         """
         Update dish (only if owned by the chef)
@@ -203,24 +224,20 @@ class DishService:
         ingredients_data = update_data.pop('ingredients', None)
         
         # Filter out None values and fields that shouldn't be updated
-        allowed_fields = ['name', 'description', 'price', 'category', 'preparation_steps', 
-                         'prep_time', 'servings', 'photo_url', 'is_active']
         filtered_data = {
             k: v for k, v in update_data.items() 
-            if v is not None and k in allowed_fields
+            if v is not None and k in _ALLOWED_UPDATE_FIELDS
         }
         
         updated_dish = self.dish_repository.update(dish, filtered_data, ingredients_data)
         logger.info(f"Updated dish {dish_id}")
         
-        # Invalidate related caches
-        chef = self.chef_repository.get_by_user_id(user_id)
-        self.cache_helper.invalidate(
-            f"detail:{dish_id}:user:{user_id}",
-            f"list:chef:{chef.id}:active:True",
-            f"list:chef:{chef.id}:active:False"
-        )
-        invalidate_cache('route:public:dishes:*')
+        # Invalidate related caches: only this dish's entries, plus the active
+        # index when the dish may have entered or left it
+        stale_keys = [f"detail:{dish_id}:user:{user_id}", f"item:{dish_id}"]
+        if 'is_active' in filtered_data:
+            stale_keys.append(f"index:chef:{dish.chef_id}:active:True")
+        self.cache_helper.invalidate(*stale_keys)
         
         return updated_dish
     
@@ -240,19 +257,17 @@ class DishService:
         if not dish:
             raise ValueError("Dish not found or access denied")
         
+        chef_id = dish.chef_id
         self.dish_repository.delete(dish)
         logger.info(f"Deleted dish {dish_id}")
         
         # Invalidate related caches
-        chef = self.chef_repository.get_by_user_id(user_id)
         self.cache_helper.invalidate(
             f"detail:{dish_id}:user:{user_id}",
-            f"list:chef:{chef.id}:active:True",
-            f"list:chef:{chef.id}:active:False",
-            f"list:user:{user_id}:active:True",
-            f"list:user:{user_id}:active:False"
+            f"item:{dish_id}",
+            f"index:chef:{chef_id}:active:True",
+            f"index:chef:{chef_id}:active:False"
         )
-        invalidate_cache('route:public:dishes:*')
     
     def upload_dish_photo(self, dish_id: int, user_id: int, photo_file) -> str:
         """
@@ -1,18 +1,19 @@
 """
 Menu Controller - HTTP request/response handling for menu endpoints
 """
-from flask import request, jsonify, g
+from flask import request, g
 from app.menus.schemas import (
     MenuCreateSchema,
     MenuUpdateSchema,
-    MenuResponseSchema,
-    MenuAssignDishesSchema
+    MenuAssignDishesSchema,
+    menu_response_schema
 )
 from app.menus.services import MenuService
 from app.menus.repositories import MenuRepository
 from app.chefs.repositories import ChefRepository
 from app.dishes.repositories import DishRepository
 from app.core.lib.error_utils import error_response, success_response
+from app.core.lib.request_utils import parse_bool
 from app.core.database import get_db
 from app.core.middleware.request_decorators import validate_json
 from config.logging import get_logger
@@ -30,13 +31,18 @@ class MenuController:
     def _get_service(self):
         """
         Get menu service with database session.
-        Creates new instances per request using Flask's g.db.
+        Built once per request (memoized on Flask's g alongside g.db).
         """
+        service = getattr(g, '_menu_service', None)
+        if service is not None:
+            return service
+        
         db = get_db()
         menu_repo = MenuRepository(db)
         chef_repo = ChefRepository(db)
         dish_repo = DishRepository(db)
-        return MenuService(menu_repo, chef_repo, dish_repo)
+        service = g._menu_service = MenuService(menu_repo, chef_repo, dish_repo)
+        return service
     
     @validate_json(MenuCreateSchema)
     def create_menu(self, current_user):
@@ -63,8 +69,7 @@ class MenuController:
             menu = service.create_menu(current_user['id'], menu_data)
             
             # Serialize response
-            schema = MenuResponseSchema()
-            result = schema.dump(menu)
+            result = menu_response_schema.dump(menu)
             
             self.logger.info(f"Menu created for chef {current_user['id']}")
             return success_response(
@@ -96,7 +101,7 @@ class MenuController:
             service = self._get_service()
             
             # Check if we should filter by active only
-            active_only = request.args.get('active_only', 'false').lower() == 'true'
+            active_only = parse_bool(request.args.get('active_only'))
             
             result = service.get_all_menus_cached(current_user['id'], active_only=active_only)
             
@@ -168,8 +173,7 @@ class MenuController:
             menu = service.update_menu(menu_id, current_user['id'], update_data)
             
             # Serialize response
-            schema = MenuResponseSchema()
-            result = schema.dump(menu)
+            result = menu_response_schema.dump(menu)
             
             self.logger.info(f"Menu {menu_id} updated")
             return success_response(
@@ -220,8 +224,7 @@ class MenuController:
             menu = service.assign_dishes_to_menu(menu_id, current_user['id'], dishes_data)
             
             # Serialize response
-            schema = MenuResponseSchema()
-            result = schema.dump(menu)
+            result = menu_response_schema.dump(menu)
             
             self.logger.info(f"Dishes assigned to menu {menu_id}")
             return success_response(
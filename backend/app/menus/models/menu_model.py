@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Enum, Index, text
 from sqlalchemy.orm import relationship
 from app.core.lib.time_utils import utcnow_naive
 from app.core.database import Base
@@ -13,13 +13,23 @@ class MenuStatus(enum.Enum):
     SEASONAL = 'seasonal'        # Available only during specific dates/seasons
 
 
+# API value per status (a plain string status passes through to_dict() unchanged)
+_STATUS_TO_STR = {status: status.value for status in MenuStatus}
+
+
 class Menu(Base):
     """
     Menu model - Collection of dishes for an event/service
     Schema: core
     """
     __tablename__ = 'menus'
-    __table_args__ = {'schema': 'core'}
+    __table_args__ = (
+        # Partial index for published menus per chef (the enum is stored by name)
+        Index('ix_menus_chef_published', 'chef_id', postgresql_where=text("status = 'PUBLISHED'")),
+        # Case-insensitive duplicate-name check per chef
+        Index('ix_menus_chef_lower_name', 'chef_id', text('lower(name)')),
+        {'schema': 'core'}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     chef_id = Column(Integer, ForeignKey('core.chefs.id', ondelete='CASCADE'), nullable=False, index=True)
@@ -43,7 +53,7 @@ class Menu(Base):
             'chef_id': self.chef_id,
             'name': self.name,
             'description': self.description,
-            'status': self.status.value if isinstance(self.status, MenuStatus) else self.status,
+            'status': _STATUS_TO_STR.get(self.status, self.status),
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
@@ -1,16 +1,64 @@
 """
 Menu Repository - Data access layer for Menu and MenuDish models
 """
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
 from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import SQLAlchemyError
 from app.menus.models.menu_model import Menu, MenuStatus
 from app.menus.models.menu_dish_model import MenuDish
+from app.dishes.models.dish_model import Dish
 from config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class MenuListDish:
+    """Dish fields shown in a menu list item (see MenuResponseSchema.get_dishes)"""
+    id: int
+    name: str
+    price: Optional[Decimal]
+    category: Optional[str]
+    photo_url: Optional[str]
+    is_active: bool
+
+
+@dataclass(slots=True)
+class MenuDishRow:
+    """Menu dish link of a menu list item"""
+    dish_id: int
+    order_position: int
+    dish: MenuListDish
+
+
+@dataclass(slots=True)
+class MenuListRow:
+    """Menu list item read without the ORM (see MenuResponseSchema)"""
+    id: int
+    chef_id: int
+    name: str
+    description: Optional[str]
+    status: MenuStatus
+    created_at: datetime
+    updated_at: datetime
+    menu_dishes: List[MenuDishRow] = field(default_factory=list)
+
+
+_menus = Menu.__table__
+_menu_dishes = MenuDish.__table__
+_dishes = Dish.__table__
+# Selected in dataclass field order
+_MENU_LIST_COLUMNS = tuple(_menus.c[name] for name in MenuListRow.__dataclass_fields__ if name != 'menu_dishes')
+_MENU_DISH_LIST_COLUMNS = (_menu_dishes.c.menu_id, _menu_dishes.c.dish_id, _menu_dishes.c.order_position) + tuple(
+    _dishes.c[name] for name in MenuListDish.__dataclass_fields__
+)
+
+
 class MenuRepository:
     """Repository for Menu and MenuDish database operations"""
     
@@ -37,16 +85,11 @@ class MenuRepository:
             self.db.flush()  # Get menu ID
             
             # Add dishes if provided
-            if dish_ids:
-                for idx, dish_id in enumerate(dish_ids):
-                    menu_dish = MenuDish(
-                        menu_id=menu.id,
-                        dish_id=dish_id,
-                        order_position=idx
-                    )
-                    self.db.add(menu_dish)
+            self._set_menu_dishes(menu, self._insert_menu_dishes(menu, [
+                {'dish_id': dish_id, 'order_position': idx}
+                for idx, dish_id in enumerate(dish_ids or [])
+            ]))
             
-            self.db.flush()
             logger.info(f"Menu created with ID: {menu.id}, {len(dish_ids or [])} dishes")
             return menu
         except SQLAlchemyError as e:
@@ -54,6 +97,46 @@ class MenuRepository:
             logger.error(f"Error creating menu: {e}", exc_info=True)
             raise
     
+    def _insert_menu_dishes(self, menu: Menu, menu_dishes_data: List[dict]) -> List[MenuDish]:
+        """
+        Insert a menu's dish links with one multi-row INSERT ... RETURNING
+        
+        Args:
+            menu: Menu instance (already flushed)
+            menu_dishes_data: List of {dish_id, order_position}
+            
+        Returns:
+            Inserted MenuDish instances
+        """
+        if not menu_dishes_data:
+            return []
+        rows = [
+            {
+                'menu_id': menu.id,
+                'dish_id': data['dish_id'],
+                'order_position': data.get('order_position', 0)
+            }
+            for data in menu_dishes_data
+        ]
+        # populate_existing: a link deleted and re-added in the same session
+        # is overwritten, not reused stale
+        return self.db.scalars(
+            insert(MenuDish).returning(MenuDish, sort_by_parameter_order=True),
+            rows,
+            execution_options={'populate_existing': True}
+        ).all()
+    
+    @staticmethod
+    def _set_menu_dishes(menu: Menu, menu_dishes: List[MenuDish]) -> None:
+        """
+        Make menu_dishes the menu's loaded collection as-is (no change event),
+        so serializing the menu afterwards doesn't SELECT them again
+        """
+        # Same order as the relationship's order_by
+        set_committed_value(
+            menu, 'menu_dishes', sorted(menu_dishes, key=lambda md: md.order_position)
+        )
+    
     def get_by_id(self, menu_id: int, include_dishes: bool = True) -> Optional[Menu]:
         """
         Get menu by ID
@@ -68,6 +151,7 @@ class MenuRepository:
         try:
             query = self.db.query(Menu)
             if include_dishes:
+                # A single menu: the joined rows only repeat this one menu
                 query = query.options(joinedload(Menu.menu_dishes).joinedload(MenuDish.dish))
             
             menu = query.filter(Menu.id == menu_id).first()
@@ -90,9 +174,11 @@ class MenuRepository:
             Menu instance or None if not found
         """
         try:
+            # Equality on lower(name) (not ILIKE) matches ix_menus_chef_lower_name,
+            # and '%'/'_' in a name aren't treated as wildcards
             menu = self.db.query(Menu).filter(
                 Menu.chef_id == chef_id,
-                Menu.name.ilike(name)
+                func.lower(Menu.name) == name.lower()
             ).first()
             if menu:
                 logger.debug(f"Found existing menu '{name}' for chef {chef_id}")
@@ -113,8 +199,10 @@ class MenuRepository:
             List of Menu instances with dishes
         """
         try:
+            # One IN-batched query per level (menus, menu_dishes, dishes) instead of
+            # a joined menus x dishes result that repeats every menu row
             query = self.db.query(Menu).options(
-                joinedload(Menu.menu_dishes).joinedload(MenuDish.dish)
+                selectinload(Menu.menu_dishes).selectinload(MenuDish.dish)
             )
             query = query.filter(Menu.chef_id == chef_id)
             
@@ -128,6 +216,45 @@ class MenuRepository:
             logger.error(f"Error retrieving menus for chef {chef_id}: {e}", exc_info=True)
             raise
     
+    def get_list_rows(self, chef_id: int, active_only: bool = False) -> List[MenuListRow]:
+        """
+        Get a chef's menus (with their dishes) as plain rows for list responses
+        
+        Rows are read with Core statements, so no Menu/MenuDish/Dish instances
+        are built or added to the session. Dishes take one extra query.
+        
+        Args:
+            chef_id: Chef ID
+            active_only: If True, only return published menus
+            
+        Returns:
+            List of MenuListRow
+        """
+        try:
+            stmt = select(*_MENU_LIST_COLUMNS).where(_menus.c.chef_id == chef_id)
+            if active_only:
+                stmt = stmt.where(_menus.c.status == MenuStatus.PUBLISHED)
+            rows = [MenuListRow(*row) for row in self.db.execute(stmt)]
+            if not rows:
+                return rows
+            
+            by_id = {row.id: row for row in rows}
+            dish_stmt = (
+                select(*_MENU_DISH_LIST_COLUMNS)
+                .join(_dishes, _dishes.c.id == _menu_dishes.c.dish_id)
+                .where(_menu_dishes.c.menu_id.in_(by_id))
+                .order_by(_menu_dishes.c.menu_id, _menu_dishes.c.order_position)
+            )
+            for menu_id, dish_id, order_position, *dish in self.db.execute(dish_stmt):
+                by_id[menu_id].menu_dishes.append(
+                    MenuDishRow(dish_id, order_position, MenuListDish(*dish))
+                )
+            logger.debug(f"Retrieved {len(rows)} menu rows for chef {chef_id}")
+            return rows
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving menu rows for chef {chef_id}: {e}", exc_info=True)
+            raise
+    
     def update(self, menu: Menu, update_data: dict) -> Menu:
         """
         Update menu basic info (not dishes)
@@ -160,6 +287,10 @@ class MenuRepository:
         """
         Replace all dishes in menu
         
+        Only the difference against the current links is written: removed
+        dishes are deleted, new ones inserted and moved ones re-positioned;
+        links that didn't change are left untouched.
+        
         Args:
             menu: Menu instance
             dishes_data: List of {dish_id, order_position}
@@ -171,18 +302,34 @@ class MenuRepository:
             SQLAlchemyError: If database operation fails
         """
         try:
-            # Delete existing menu_dishes
-            self.db.query(MenuDish).filter(MenuDish.menu_id == menu.id).delete()
+            existing = {md.dish_id: md for md in menu.menu_dishes}
+            desired = {data['dish_id']: data.get('order_position', 0) for data in dishes_data}
             
-            # Add new dishes
-            for dish_data in dishes_data:
-                menu_dish = MenuDish(
-                    menu_id=menu.id,
-                    dish_id=dish_data['dish_id'],
-                    order_position=dish_data.get('order_position', 0)
+            # Delete links to dishes no longer in the menu (one DELETE; the
+            # collection is replaced below instead of synchronized)
+            removed = existing.keys() - desired.keys()
+            if removed:
+                self.db.execute(
+                    delete(MenuDish)
+                    .where(MenuDish.menu_id == menu.id, MenuDish.dish_id.in_(removed))
+                    .execution_options(synchronize_session=False)
                 )
-                self.db.add(menu_dish)
             
+            # Re-position kept dishes whose order changed (UPDATEs on flush)
+            kept = []
+            for dish_id, order_position in desired.items():
+                menu_dish = existing.get(dish_id)
+                if menu_dish is not None:
+                    if menu_dish.order_position != order_position:
+                        menu_dish.order_position = order_position
+                    kept.append(menu_dish)
+            
+            # Add new dishes
+            added = self._insert_menu_dishes(menu, [
+                data for data in dishes_data if data['dish_id'] not in existing
+            ])
+            
+            self._set_menu_dishes(menu, kept + added)
             self.db.flush()
             logger.info(f"Assigned {len(dishes_data)} dishes to menu {menu.id}")
             return menu
@@ -2,7 +2,7 @@
 Menu Routes
 Blueprint registration for menu endpoints
 """
-from flask import Blueprint
+from flask import Blueprint, g
 from app.menus.controllers import MenuController
 from app.core.middleware.auth_middleware import jwt_required
 from app.core.middleware.cache_decorators import invalidate_on_modify
@@ -24,7 +24,6 @@ def create_menu():
     Requires: Authorization header with Bearer token
     Invalidates: All public menu caches
     """
-    from flask import g
     return menu_controller.create_menu(g.current_user)
 
 
@@ -37,7 +36,6 @@ def get_all_menus():
     Query params: active_only=true (optional)
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return menu_controller.get_all_menus(g.current_user)
 
 
@@ -49,7 +47,6 @@ def get_menu_by_id(menu_id):
     Get menu by ID with dishes
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return menu_controller.get_menu_by_id(menu_id, g.current_user)
 
 
@@ -63,7 +60,6 @@ def update_menu(menu_id):
     Requires: Authorization header with Bearer token
     Invalidates: All public menu caches
     """
-    from flask import g
     return menu_controller.update_menu(menu_id, g.current_user)
 
 
@@ -77,7 +73,6 @@ def assign_dishes(menu_id):
     Requires: Authorization header with Bearer token
     Invalidates: All public menu caches
     """
-    from flask import g
     return menu_controller.assign_dishes(menu_id, g.current_user)
 
 
@@ -91,5 +86,4 @@ def delete_menu(menu_id):
     Requires: Authorization header with Bearer token
     Invalidates: All public menu caches
     """
-    from flask import g
     return menu_controller.delete_menu(menu_id, g.current_user)
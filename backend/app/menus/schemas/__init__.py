@@ -3,7 +3,8 @@ from .menu_schema import (
     MenuCreateSchema,
     MenuUpdateSchema,
     MenuResponseSchema,
-    MenuAssignDishesSchema
+    MenuAssignDishesSchema,
+    menu_response_schema
 )
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     'MenuCreateSchema',
     'MenuUpdateSchema',
     'MenuResponseSchema',
-    'MenuAssignDishesSchema'
+    'MenuAssignDishesSchema',
+    'menu_response_schema'
 ]
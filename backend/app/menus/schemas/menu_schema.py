@@ -121,3 +121,7 @@ class MenuResponseSchema(Schema):
             if menu_dish.dish and menu_dish.dish.price
         )
         return str(total)
+
+
+# Schema instances for reuse
+menu_response_schema = MenuResponseSchema()
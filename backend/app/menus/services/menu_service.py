@@ -5,7 +5,7 @@ from typing import Optional, List
 from app.menus.repositories.menu_repository import MenuRepository
 from app.menus.models.menu_model import Menu, MenuStatus
 from app.menus.schemas.menu_schema import MenuResponseSchema
-from app.chefs.repositories.chef_repository import ChefRepository
+from app.chefs.repositories.chef_repository import ChefRepository, get_chef_for_user
 from app.dishes.repositories.dish_repository import DishRepository
 from app.core.cache_manager import invalidate_cache
 from app.core.middleware.cache_helper import CacheHelper
@@ -38,7 +38,7 @@ class MenuService:
             ValueError: If chef profile not found, menu name already exists, or dishes don't belong to chef
         """
         # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         if not chef:
             logger.warning(f"Attempted to create menu for user {user_id} without chef profile")
             raise ValueError("Chef profile not found. Please create your chef profile first.")
@@ -96,7 +96,7 @@ class MenuService:
             ValueError: If chef profile not found
         """
         # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         if not chef:
             raise ValueError("Chef profile not found")
         
@@ -129,7 +129,7 @@ class MenuService:
             ValueError: If chef profile not found
         """
         # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         if not chef:
             raise ValueError("Chef profile not found")
         
@@ -168,7 +168,7 @@ class MenuService:
             ValueError: If chef profile not found
         """
         # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         if not chef:
             raise ValueError("Chef profile not found")
         
@@ -189,13 +189,13 @@ class MenuService:
             ValueError: If chef profile not found
         """
         # Get chef profile
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         if not chef:
             raise ValueError("Chef profile not found")
         
         return self.cache_helper.get_or_set(
             cache_key=f"list:chef:{chef.id}:active:{active_only}",
-            fetch_func=lambda: self.menu_repository.get_by_chef_id(chef.id, active_only=active_only),
+            fetch_func=lambda: self.menu_repository.get_list_rows(chef.id, active_only=active_only),
             schema_class=MenuResponseSchema,
             ttl=300,
             many=True
@@ -239,7 +239,7 @@ class MenuService:
         logger.info(f"Updated menu {menu_id}")
         
         # Invalidate related caches
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         self.cache_helper.invalidate(
             f"detail:{menu_id}:user:{user_id}",
             f"list:chef:{chef.id}:active:True",
@@ -270,7 +270,7 @@ class MenuService:
             raise ValueError("Menu not found or access denied")
         
         # Get chef
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         
         # Validate all dishes belong to chef
         for dish_data in dishes_data:
@@ -314,7 +314,7 @@ class MenuService:
         logger.info(f"Deleted menu {menu_id}")
         
         # Invalidate related caches
-        chef = self.chef_repository.get_by_user_id(user_id)
+        chef = get_chef_for_user(self.chef_repository, user_id)
         self.cache_helper.invalidate(
             f"detail:{menu_id}:user:{user_id}",
             f"list:chef:{chef.id}:active:True",
@@ -3,7 +3,7 @@ from config.logging import get_logger
 from app.core.lib.error_utils import success_response, error_response
 from app.public.services import PublicService
 from app.chefs.schemas import ChefPublicSchema
-from app.dishes.schemas import DishResponseSchema
+from app.dishes.schemas import DishResponseSchema, dish_response_schema
 from app.menus.schemas import MenuResponseSchema
 
 logger = get_logger(__name__)
@@ -107,12 +107,11 @@ class PublicController:
             # Serialize response
             menu_schema = MenuResponseSchema()
             chef_schema = ChefPublicSchema()
-            dish_schema = DishResponseSchema()
             
             # Serialize dishes with order position
             dishes_data = [
                 {
-                    **dish_schema.dump(item["dish"]),
+                    **dish_response_schema.dump(item["dish"]),
                     "order_position": item["order_position"]
                 }
                 for item in result["dishes"]
@@ -139,11 +138,10 @@ class PublicController:
                 return error_response(f"Dish with ID {dish_id} not found or inactive", 404)
             
             # Serialize response
-            dish_schema = DishResponseSchema()
             chef_schema = ChefPublicSchema()
             
             return success_response({
-                "dish": dish_schema.dump(result["dish"]),
+                "dish": dish_response_schema.dump(result["dish"]),
                 "chef": chef_schema.dump(result["chef"]) if result["chef"] else None
             })
             
@@ -8,7 +8,7 @@ public_bp = Blueprint("public", __name__, url_prefix="/public")
 # ==================== Chef Discovery Routes ====================
 
 @public_bp.route("/chefs", methods=["GET"])
-@cache_response(ttl=300, key_prefix='public:chefs:list')
+@cache_response(ttl=300, key_prefix='public:chefs:list', prefetch_pages=3)
 def get_chefs():
     """
     Get paginated list of active chefs
@@ -35,7 +35,7 @@ def get_chef_profile(chef_id: int):
 # ==================== Search Routes ====================
 
 @public_bp.route("/search", methods=["GET"])
-@cache_response(ttl=180, key_prefix='public:search')
+@cache_response(ttl=180, key_prefix='public:search', prefetch_pages=3)
 def search_chefs():
     """
     Full-text search for chefs
@@ -1,7 +1,7 @@
 """
 Quotation Controller - HTTP request/response handling for quotation endpoints
 """
-from flask import request, jsonify, g
+from flask import request
 from app.quotations.schemas import (
     QuotationCreateSchema,
     QuotationUpdateSchema,
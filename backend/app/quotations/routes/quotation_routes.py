@@ -2,7 +2,7 @@
 Quotation Routes
 Blueprint registration for quotation endpoints
 """
-from flask import Blueprint
+from flask import Blueprint, g
 from app.quotations.controllers import QuotationController
 from app.core.middleware.auth_middleware import jwt_required
 
@@ -21,7 +21,6 @@ def create_quotation():
     Create a new quotation with items
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return quotation_controller.create_quotation(g.current_user)
 
 
@@ -34,7 +33,6 @@ def get_all_quotations():
     Query params: status=draft|sent|accepted|rejected|expired (optional)
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return quotation_controller.get_all_quotations(g.current_user)
 
 
@@ -46,7 +44,6 @@ def get_quotation_by_id(quotation_id):
     Get quotation by ID with items
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return quotation_controller.get_quotation_by_id(quotation_id, g.current_user)
 
 
@@ -58,7 +55,6 @@ def update_quotation(quotation_id):
     Update quotation (only draft status)
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return quotation_controller.update_quotation(quotation_id, g.current_user)
 
 
@@ -70,7 +66,6 @@ def update_quotation_status(quotation_id):
     Update quotation status
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return quotation_controller.update_quotation_status(quotation_id, g.current_user)
 
 
@@ -82,7 +77,6 @@ def delete_quotation(quotation_id):
     Delete quotation (only draft status)
     Requires: Authorization header with Bearer token
     """
-    from flask import g
     return quotation_controller.delete_quotation(quotation_id, g.current_user)
 
 
@@ -90,6 +84,5 @@ def delete_quotation(quotation_id):
 @jwt_required
 def download_quotation_pdf(quotation_id):
     """GET /quotations/:id/pdf - Download quotation as PDF."""
-    from flask import g
     return quotation_controller.download_quotation_pdf(quotation_id, g.current_user)
 
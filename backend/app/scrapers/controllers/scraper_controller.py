@@ -3,12 +3,9 @@ from config.logging import get_logger
 from app.core.lib.error_utils import success_response, error_response
 from app.scrapers.services import ScraperService
 from app.scrapers.schemas import (
-    price_source_create_schema,
-    price_source_update_schema,
     price_source_response_schema,
     price_sources_response_schema,
-    scraped_prices_response_schema,
-    scrape_request_schema
+    scraped_prices_response_schema
 )
 
 logger = get_logger(__name__)
@@ -47,6 +47,8 @@ JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key-change-in-productio
 JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'HS256')
 JWT_EXPIRATION_HOURS = int(os.getenv('JWT_EXPIRATION_HOURS', 24))
 JWT_REFRESH_EXPIRATION_DAYS = int(os.getenv('JWT_REFRESH_EXPIRATION_DAYS', 7))
+JWT_CACHE_TTL = int(os.getenv('JWT_CACHE_TTL', 30))  # Seconds a verified token is reused in-process
+JWT_CACHE_SIZE = int(os.getenv('JWT_CACHE_SIZE', 10000))  # Max cached tokens per process (0 disables)
 
 # Database Configuration
 DB_USER = os.getenv('DB_USER', 'postgres')
@@ -55,6 +57,12 @@ DB_HOST = os.getenv('DB_HOST', 'localhost')
 DB_PORT = int(os.getenv('DB_PORT', 5432))
 DB_NAME = os.getenv('DB_NAME', 'lyftercook')
 
+# Connection pool (size to match workers * threads of the WSGI server)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))  # Seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))  # Seconds before a connection is replaced
+
 # Schemas organization (no need for env var, defined in models)
 # auth: users, refresh_tokens
 # core: chefs, clients, dishes, ingredients, menus, menu_dishes, quotations, quotation_items
@@ -66,6 +74,11 @@ REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
 REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
 REDIS_DB = int(os.getenv('REDIS_DB', 0))
 REDIS_KEY_PREFIX = os.getenv('REDIS_KEY_PREFIX', f"lyftercook:{FLASK_ENV}")
+REDIS_POOL_SIZE = int(os.getenv('REDIS_POOL_SIZE', 50))  # Max connections per process
+ROUTE_CACHE_L1_SIZE = int(os.getenv('ROUTE_CACHE_L1_SIZE', 2048))  # In-process route cache entries (0 disables)
+ROUTE_CACHE_L1_TTL = int(os.getenv('ROUTE_CACHE_L1_TTL', 10))  # Max seconds other workers may serve a stale body
+CACHE_ADAPTIVE_TTL_MAX = float(os.getenv('CACHE_ADAPTIVE_TTL_MAX', 1))  # Max TTL multiple for read-mostly CacheHelper keys (1 disables)
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv('CACHE_COMPRESS_MIN_BYTES', 2048))  # zstd-compress cached values from this size (0 disables)
 
 # CORS Configuration
 ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', 'http://localhost:8080').split(',')
@@ -87,6 +100,9 @@ if SENDGRID_API_KEY.strip() in {"your-sendgrid-api-key", "YOUR_SENDGRID_API_KEY"
     SENDGRID_API_KEY = ""
 SENDGRID_FROM_EMAIL = os.getenv('SENDGRID_FROM_EMAIL', 'noreply@lyftercook.com')
 SENDGRID_FROM_NAME = os.getenv('SENDGRID_FROM_NAME', 'LyfterCook')
+SENDGRID_RATE_PER_SEC = float(os.getenv('SENDGRID_RATE_PER_SEC', 14))  # Bulk send throttle
+EMAIL_WORKERS = int(os.getenv('EMAIL_WORKERS', 10))  # Concurrent sends in EmailService.send_many
+EMAIL_QUEUE_ENABLED = os.getenv('EMAIL_QUEUE_ENABLED', 'False').lower() == 'true'  # Needs scripts/email_worker.py
 
 # Calendly Configuration
 CALENDLY_API_KEY = os.getenv('CALENDLY_API_KEY', '')
@@ -109,6 +125,8 @@ class Settings:
     JWT_ALGORITHM = JWT_ALGORITHM
     JWT_EXPIRATION_HOURS = JWT_EXPIRATION_HOURS
     JWT_REFRESH_EXPIRATION_DAYS = JWT_REFRESH_EXPIRATION_DAYS
+    JWT_CACHE_TTL = JWT_CACHE_TTL
+    JWT_CACHE_SIZE = JWT_CACHE_SIZE
     
     # Database
     DB_USER = DB_USER
@@ -116,6 +134,10 @@ class Settings:
     DB_HOST = DB_HOST
     DB_PORT = DB_PORT
     DB_NAME = DB_NAME
+    DB_POOL_SIZE = DB_POOL_SIZE
+    DB_MAX_OVERFLOW = DB_MAX_OVERFLOW
+    DB_POOL_TIMEOUT = DB_POOL_TIMEOUT
+    DB_POOL_RECYCLE = DB_POOL_RECYCLE
     
     # Redis
     REDIS_HOST = REDIS_HOST
@@ -123,6 +145,11 @@ class Settings:
     REDIS_PASSWORD = REDIS_PASSWORD
     REDIS_DB = REDIS_DB
     REDIS_KEY_PREFIX = REDIS_KEY_PREFIX
+    REDIS_POOL_SIZE = REDIS_POOL_SIZE
+    ROUTE_CACHE_L1_SIZE = ROUTE_CACHE_L1_SIZE
+    ROUTE_CACHE_L1_TTL = ROUTE_CACHE_L1_TTL
+    CACHE_ADAPTIVE_TTL_MAX = CACHE_ADAPTIVE_TTL_MAX
+    CACHE_COMPRESS_MIN_BYTES = CACHE_COMPRESS_MIN_BYTES
     
     # CORS
     ALLOWED_ORIGINS = ALLOWED_ORIGINS
@@ -141,6 +168,9 @@ class Settings:
     SENDGRID_API_KEY = SENDGRID_API_KEY
     SENDGRID_FROM_EMAIL = SENDGRID_FROM_EMAIL
     SENDGRID_FROM_NAME = SENDGRID_FROM_NAME
+    SENDGRID_RATE_PER_SEC = SENDGRID_RATE_PER_SEC
+    EMAIL_WORKERS = EMAIL_WORKERS
+    EMAIL_QUEUE_ENABLED = EMAIL_QUEUE_ENABLED
     
     # Calendly
     CALENDLY_API_KEY = CALENDLY_API_KEY
@@ -0,0 +1,26 @@
+"""
+Email queue worker
+Sends emails queued by the API (EMAIL_QUEUE_ENABLED=true).
+
+Usage:
+    python scripts/email_worker.py [worker_id]
+
+worker_id defaults to the host name. Give each worker running on the same
+host its own ID; a restarted worker re-queues the jobs its ID left unfinished.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from app.core.email_queue import run_worker
+
+
+if __name__ == '__main__':
+    try:
+        run_worker(sys.argv[1] if len(sys.argv) > 1 else None)
+    except KeyboardInterrupt:
+        pass
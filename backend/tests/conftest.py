@@ -146,6 +146,28 @@ def db_session(database):
     Session.remove()
     transaction.rollback()
     connection.close()
+    
+    # Rolled-back rows may reuse IDs; drop in-process caches built on them
+    from app.core.auth_cache import token_cache
+    from app.core.cache_manager import route_body_cache
+    token_cache.clear()
+    route_body_cache.clear()
+
+
+@pytest.fixture(scope='function')
+def statements(db_session):
+    """SQL statements executed on the test connection (for query-count tests)."""
+    from sqlalchemy import event
+    
+    executed = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+    
+    connection = db_session.get_bind()
+    event.listen(connection, 'before_cursor_execute', record)
+    yield executed
+    event.remove(connection, 'before_cursor_execute', record)
 
 
 @pytest.fixture(scope='function')
@@ -170,6 +192,9 @@ def client(app, db_session, monkeypatch):
         def delete(self, key):
             return False
 
+        def delete_many(self, keys):
+            return 0
+
         def delete_pattern(self, pattern):
             return 0
 
@@ -28,6 +28,9 @@ class _InMemoryCache:
     def delete(self, key: str):
         return self._store.pop(key, None) is not None
 
+    def delete_many(self, keys):
+        return sum(self._store.pop(k, None) is not None for k in keys)
+
     def delete_pattern(self, pattern: str):
         keys = [k for k in list(self._store.keys()) if fnmatch.fnmatch(k, pattern)]
         for k in keys:
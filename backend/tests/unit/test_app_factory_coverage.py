@@ -180,3 +180,39 @@ def test_global_exception_handler_non_http_debug_branch_includes_traceback(monke
     assert data["error"] == "Internal Server Error"
     assert data["message"] == "boom"
     assert "traceback" in data
+
+
+def test_app_uses_orjson_provider_with_flask_compatible_output(app):
+    from datetime import datetime
+    from decimal import Decimal
+    from flask import jsonify
+    from app.core.lib.json_provider import OrjsonProvider
+
+    assert isinstance(app.json, OrjsonProvider)
+
+    with app.test_request_context("/"):
+        resp = jsonify({"when": datetime(2026, 1, 3, 12, 0, 0), "price": Decimal("9.50"), 1: "x"})
+
+    assert resp.mimetype == "application/json"
+    assert resp.get_json() == {"when": "Sat, 03 Jan 2026 12:00:00 GMT", "price": "9.50", "1": "x"}
+
+
+def test_orjson_provider_matches_flask_key_order_and_indentation(app, monkeypatch):
+    from flask import jsonify
+    from flask.json.provider import DefaultJSONProvider
+
+    payload = {"b": 1, "a": {"d": 2, "c": 3}}
+    with app.test_request_context("/"):
+        expected = DefaultJSONProvider(app).response(payload).get_data()
+        assert jsonify(payload).get_data() == expected
+        assert app.json.dumps(payload) == '{"a":{"c":3,"d":2},"b":1}'
+
+        monkeypatch.setattr(app.json, "compact", False)
+        flask_provider = DefaultJSONProvider(app)
+        flask_provider.compact = False
+        assert jsonify(payload).get_data() == flask_provider.response(payload).get_data()
+        assert jsonify(payload).get_data() == b'{\n  "a": {\n    "c": 3,\n    "d": 2\n  },\n  "b": 1\n}\n'
+
+        monkeypatch.setattr(app.json, "sort_keys", False)
+        monkeypatch.setattr(app.json, "compact", True)
+        assert jsonify(payload).get_data() == b'{"b":1,"a":{"d":2,"c":3}}\n'
@@ -12,9 +12,17 @@ Focuses on uncovered edge cases:
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from flask import Flask, jsonify
+from app.core.cache_manager import route_body_cache
 from app.core.middleware.cache_decorators import cache_response, invalidate_on_modify
 
 
+@pytest.fixture(autouse=True)
+def _clear_route_body_cache():
+    route_body_cache.clear()
+    yield
+    route_body_cache.clear()
+
+
 class TestCacheResponseDecoratorEdgeCases:
     """Tests for cache_response decorator edge cases."""
     
@@ -44,8 +52,8 @@ class TestCacheResponseDecoratorEdgeCases:
             # POST request should NOT interact with cache
             response = client.post('/test')
             assert response.status_code == 200
-            mock_cache.get.assert_not_called()
-            mock_cache.set.assert_not_called()
+            mock_cache.get_raw.assert_not_called()
+            mock_cache.set_raw.assert_not_called()
     
     def test_cache_response_when_cache_disabled_adds_cache_control_header_tuple(self, app, client):
         """Test that Cache-Control header is added even when cache is disabled (tuple response)."""
@@ -103,7 +111,7 @@ class TestCacheResponseDecoratorEdgeCases:
         """Test that query parameters are included in cache key."""
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.get.return_value = None  # Cache miss
+        mock_cache.get_raw.return_value = None  # Cache miss
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test')
@@ -115,7 +123,7 @@ class TestCacheResponseDecoratorEdgeCases:
             assert response.status_code == 200
             
             # Verify cache key includes query parameters
-            call_args = mock_cache.get.call_args
+            call_args = mock_cache.get_raw.call_args
             cache_key = call_args[0][0]
             assert 'page=1' in cache_key
             assert 'limit=10' in cache_key
@@ -124,7 +132,7 @@ class TestCacheResponseDecoratorEdgeCases:
         """Test that custom key_prefix is used in cache key."""
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.get.return_value = None
+        mock_cache.get_raw.return_value = None
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test')
@@ -136,15 +144,98 @@ class TestCacheResponseDecoratorEdgeCases:
             assert response.status_code == 200
             
             # Verify cache key uses custom prefix
-            cache_key = mock_cache.get.call_args[0][0]
+            cache_key = mock_cache.get_raw.call_args[0][0]
             assert 'custom_namespace' in cache_key
     
+    def test_cache_response_stores_serialized_body_on_miss(self, app, client):
+        """Test that a MISS stores the response bytes without re-encoding them."""
+        mock_cache = MagicMock()
+        mock_cache.enabled = True
+        mock_cache.get_raw.return_value = None
+        
+        with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
+            @app.route('/test')
+            @cache_response(ttl=60)
+            def test_route():
+                return jsonify({"data": "test"}), 200
+            
+            response = client.get('/test')
+            assert response.status_code == 200
+            
+            cache_key, body, ttl = mock_cache.set_raw.call_args[0]
+            assert body == response.get_data()
+            assert ttl == 60
+            mock_cache.set.assert_not_called()
+    
+    def test_cache_response_serves_repeat_hits_from_process_cache(self, app, client):
+        """Test that a body fetched from Redis is reused without another round trip."""
+        mock_cache = MagicMock()
+        mock_cache.enabled = True
+        mock_cache.get_raw.return_value = b'{"data":"cached"}'
+        
+        with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
+            @app.route('/test')
+            @cache_response(ttl=60)
+            def test_route():
+                return jsonify({"data": "fresh"}), 200
+            
+            first = client.get('/test')
+            second = client.get('/test')
+            assert first.json == second.json == {"data": "cached"}
+            assert mock_cache.get_raw.call_count == 1
+    
+    def test_cache_response_prefetches_next_pages_on_request(self, app, client):
+        """Test that X-Prefetch loads following pages with one MGET into the process cache."""
+        mock_cache = MagicMock()
+        mock_cache.enabled = True
+        mock_cache.get_raw.return_value = None
+        mock_cache.get_many_raw.side_effect = lambda keys: {keys[0]: b'{"page":2}'}
+        
+        with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
+            @app.route('/test')
+            @cache_response(ttl=60, prefetch_pages=2)
+            def test_route():
+                return jsonify({"page": "fresh"}), 200
+            
+            client.get('/test?per_page=10&page=1', headers={'X-Prefetch': '5'})
+            keys = mock_cache.get_many_raw.call_args[0][0]
+            assert keys == [
+                'route:/test:/test:page=2&per_page=10',
+                'route:/test:/test:page=3&per_page=10',
+            ]
+            
+            mock_cache.get_raw.reset_mock()
+            response = client.get('/test?per_page=10&page=2')
+            assert response.json == {"page": 2}
+            mock_cache.get_raw.assert_not_called()
+    
+    def test_cache_response_prefetched_keys_match_differently_encoded_requests(self, app, client):
+        """Test that prefetched pages are read back whatever encoding/order the next request uses."""
+        mock_cache = MagicMock()
+        mock_cache.enabled = True
+        mock_cache.get_raw.return_value = None
+        mock_cache.get_many_raw.side_effect = lambda keys: {key: b'{"page":"prefetched"}' for key in keys}
+        
+        with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
+            @app.route('/test')
+            @cache_response(ttl=60, prefetch_pages=1)
+            def test_route():
+                return jsonify({"page": "fresh"}), 200
+            
+            # First request has no page, a space as %20 and a non-ASCII term
+            client.get('/test?q=cr%C3%A8me%20br%C3%BBl%C3%A9e', headers={'X-Prefetch': '1'})
+            
+            mock_cache.get_raw.reset_mock()
+            response = client.get('/test?page=2&q=cr\u00e8me+br\u00fbl\u00e9e')
+            assert response.json == {"page": "prefetched"}
+            mock_cache.get_raw.assert_not_called()
+    
     def test_cache_response_handles_cache_hit(self, app, client):
         """Test that cached response is returned on cache hit."""
         cached_data = {"data": "cached", "from_cache": True}
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.get.return_value = cached_data
+        mock_cache.get_raw.return_value = b'{"data":"cached","from_cache":true}'
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test')
@@ -157,12 +248,38 @@ class TestCacheResponseDecoratorEdgeCases:
             assert response.status_code == 200
             assert response.json == cached_data
             assert 'Cache-Control' in response.headers
-    
+
+    def test_cache_response_answers_matching_etag_with_304(self, app, client):
+        """Test that a cached body's ETag is honored via If-None-Match."""
+        mock_cache = MagicMock()
+        mock_cache.enabled = True
+        mock_cache.get_raw.return_value = None
+
+        with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
+            @app.route('/test')
+            @cache_response(ttl=60)
+            def test_route():
+                return jsonify({"data": "test"}), 200
+
+            miss = client.get('/test')
+            etag = miss.headers['ETag']
+            assert etag.startswith('"')
+
+            not_modified = client.get('/test', headers={'If-None-Match': etag})
+            assert not_modified.status_code == 304
+            assert not_modified.get_data() == b''
+            assert not_modified.headers['ETag'] == etag
+            assert not_modified.headers['Cache-Control'] == 'public, max-age=60'
+
+            stale = client.get('/test', headers={'If-None-Match': '"other"'})
+            assert stale.status_code == 200
+            assert stale.json == {"data": "test"}
+
     def test_cache_response_only_caches_200_status(self, app, client):
         """Test that non-200 responses are not cached."""
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.get.return_value = None
+        mock_cache.get_raw.return_value = None
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test')
@@ -173,15 +290,15 @@ class TestCacheResponseDecoratorEdgeCases:
             response = client.get('/test')
             assert response.status_code == 404
             
-            # Verify cache.set was NOT called (404 not cached)
-            mock_cache.set.assert_not_called()
+            # Verify cache.set_raw was NOT called (404 not cached)
+            mock_cache.set_raw.assert_not_called()
     
     def test_cache_response_handles_cache_set_exception(self, app, client):
-        """Test graceful handling when cache.set() raises exception."""
+        """Test graceful handling when cache.set_raw() raises exception."""
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.get.return_value = None
-        mock_cache.set.side_effect = Exception("Redis connection failed")
+        mock_cache.get_raw.return_value = None
+        mock_cache.set_raw.side_effect = Exception("Redis connection failed")
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test')
@@ -198,7 +315,7 @@ class TestCacheResponseDecoratorEdgeCases:
         """Test that responses without JSON data are not cached."""
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.get.return_value = None
+        mock_cache.get_raw.return_value = None
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test')
@@ -210,8 +327,8 @@ class TestCacheResponseDecoratorEdgeCases:
             
             response = client.get('/test')
             assert response.status_code == 200
-            # Verify cache.set was not called (no JSON data to cache)
-            mock_cache.set.assert_not_called()
+            # Verify cache.set_raw was not called (no JSON data to cache)
+            mock_cache.set_raw.assert_not_called()
 
 
 class TestInvalidateOnModifyDecorator:
@@ -233,7 +350,7 @@ class TestInvalidateOnModifyDecorator:
         """Test cache invalidation with tuple response (jsonify_obj, status_code)."""
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.delete_pattern.return_value = 5
+        mock_cache.delete_patterns.return_value = 5
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test', methods=['POST'])
@@ -245,17 +362,14 @@ class TestInvalidateOnModifyDecorator:
             response = client.post('/test')
             assert response.status_code == 201
             
-            # Verify both patterns were invalidated
-            assert mock_cache.delete_pattern.call_count == 2
-            calls = [call[0][0] for call in mock_cache.delete_pattern.call_args_list]
-            assert 'route:test:*' in calls
-            assert 'route:related:*' in calls
+            # Verify both patterns were invalidated in one batched call
+            mock_cache.delete_patterns.assert_called_once_with(['route:test:*', 'route:related:*'])
     
     def test_invalidate_on_modify_with_response_object(self, app, client):
         """Test cache invalidation with Response object."""
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.delete_pattern.return_value = 3
+        mock_cache.delete_patterns.return_value = 3
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test', methods=['PUT'])
@@ -269,7 +383,7 @@ class TestInvalidateOnModifyDecorator:
             assert response.status_code == 200
             
             # Verify pattern was invalidated
-            mock_cache.delete_pattern.assert_called_once_with('route:updated:*')
+            mock_cache.delete_patterns.assert_called_once_with(['route:updated:*'])
     
     def test_invalidate_on_modify_skips_non_success_responses_tuple(self, app, client):
         """Test that cache is NOT invalidated for non-2xx tuple responses."""
@@ -286,7 +400,7 @@ class TestInvalidateOnModifyDecorator:
             assert response.status_code == 404
             
             # Verify cache was NOT invalidated (404 response)
-            mock_cache.delete_pattern.assert_not_called()
+            mock_cache.delete_patterns.assert_not_called()
     
     def test_invalidate_on_modify_skips_non_success_responses_response_obj(self, app, client):
         """Test that cache is NOT invalidated for non-2xx Response objects."""
@@ -305,7 +419,7 @@ class TestInvalidateOnModifyDecorator:
             assert response.status_code == 400
             
             # Verify cache was NOT invalidated (400 response)
-            mock_cache.delete_pattern.assert_not_called()
+            mock_cache.delete_patterns.assert_not_called()
     
     def test_invalidate_on_modify_skips_when_cache_disabled(self, app, client):
         """Test that invalidation is skipped when cache is disabled."""
@@ -321,14 +435,14 @@ class TestInvalidateOnModifyDecorator:
             response = client.post('/test')
             assert response.status_code == 201
             
-            # Verify delete_pattern was NOT called (cache disabled)
-            mock_cache.delete_pattern.assert_not_called()
+            # Verify delete_patterns was NOT called (cache disabled)
+            mock_cache.delete_patterns.assert_not_called()
     
     def test_invalidate_on_modify_with_multiple_patterns(self, app, client):
         """Test invalidating multiple cache patterns."""
         mock_cache = MagicMock()
         mock_cache.enabled = True
-        mock_cache.delete_pattern.return_value = 10
+        mock_cache.delete_patterns.return_value = 10
         
         with patch('app.core.middleware.cache_decorators.get_cache', return_value=mock_cache):
             @app.route('/test', methods=['POST'])
@@ -339,5 +453,7 @@ class TestInvalidateOnModifyDecorator:
             response = client.post('/test')
             assert response.status_code == 201
             
-            # Verify all 3 patterns were invalidated
-            assert mock_cache.delete_pattern.call_count == 3
+            # Verify all 3 patterns were invalidated in one batched call
+            mock_cache.delete_patterns.assert_called_once_with(
+                ['route:dishes:*', 'route:menus:*', 'route:public:*']
+            )
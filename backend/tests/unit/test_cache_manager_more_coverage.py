@@ -25,8 +25,8 @@ class _RedisWithBrokenOps:
     def delete(self, *keys):
         raise RuntimeError("delete failed")
 
-    def keys(self, pattern):
-        raise RuntimeError("keys failed")
+    def scan_iter(self, match=None, count=None):
+        raise RuntimeError("scan failed")
 
     def exists(self, key):
         raise RuntimeError("exists failed")
@@ -110,7 +110,7 @@ def test_cache_manager_methods_handle_redis_exceptions(monkeypatch):
     assert cache.get_ttl("k") == -2
 
 
-def test_cache_manager_set_serializes_datetime_via_default_str(monkeypatch):
+def test_cache_manager_set_serializes_datetime_as_iso(monkeypatch):
     import app.core.cache_manager as cm
     from datetime import datetime
 
@@ -126,8 +126,34 @@ def test_cache_manager_set_serializes_datetime_via_default_str(monkeypatch):
     payload = {"when": datetime(2026, 1, 3, 12, 0, 0)}
     assert cache.set("k", payload, ttl=60) is True
 
-    # Under the hood, it should be JSON-dumped with datetime coerced to string
+    # Under the hood, it should be JSON bytes with datetime as an ISO 8601 string
     raw = fake_redis.get(cache._format_key("k"))
-    assert isinstance(raw, str)
+    assert isinstance(raw, bytes)
     decoded = json.loads(raw)
-    assert "when" in decoded
+    assert decoded["when"] == "2026-01-03T12:00:00"
+
+
+def test_cache_manager_uses_bounded_connection_pool(monkeypatch):
+    import app.core.cache_manager as cm
+
+    from tests.unit.test_hotspot_cache_manager import _FakeRedis
+
+    captured = {}
+
+    def _pool(**kwargs):
+        captured.update(kwargs)
+        return "pool"
+
+    def _redis(**kwargs):
+        captured["connection_pool"] = kwargs.get("connection_pool")
+        return _FakeRedis()
+
+    monkeypatch.setattr(cm.redis, "ConnectionPool", _pool)
+    monkeypatch.setattr(cm.redis, "Redis", _redis)
+    monkeypatch.setattr(cm.settings, "REDIS_POOL_SIZE", 8)
+
+    cache = cm.CacheManager()
+    assert cache.enabled is True
+    assert captured["connection_pool"] == "pool"
+    assert captured["max_connections"] == 8
+    assert captured["health_check_interval"] == 30
@@ -97,3 +97,88 @@ class TestClientDelete:
         """Test deleting non-existent client."""
         response = client.delete('/clients/99999', headers=chef_headers)
         assert_not_found_error(response)
+
+
+class TestClientSerialization:
+    """Tests for the client list serialization fast path."""
+
+    def test_to_dict_matches_response_schema(self):
+        """Client.to_dict() must stay in sync with ClientResponseSchema."""
+        from datetime import datetime
+        from app.clients.models import Client
+        from app.clients.schemas import ClientResponseSchema
+
+        client_obj = Client(
+            id=7,
+            chef_id=3,
+            name='Jane Doe',
+            email='jane@example.com',
+            phone=None,
+            company='ACME',
+            notes=None,
+            created_at=datetime(2026, 1, 2, 3, 4, 5),
+            updated_at=datetime(2026, 1, 2, 3, 4, 6)
+        )
+
+        assert client_obj.to_dict() == ClientResponseSchema().dump(client_obj)
+
+
+class TestClientUpdateSchema:
+    """Tests for ClientUpdateSchema loading."""
+
+    def test_load_drops_unknown_and_keeps_explicit_null(self):
+        """Unknown keys are excluded; explicit nulls survive so fields can be cleared."""
+        from app.clients.schemas import ClientUpdateSchema
+
+        loaded = ClientUpdateSchema().load({'notes': None, 'chef_id': 99, 'name': 'New'})
+
+        assert loaded == {'notes': None, 'name': 'New'}
+
+
+class TestClientOwnershipLookup:
+    """Tests for the single-query ownership lookup in ClientService."""
+
+    def test_get_client_by_id_hit_skips_chef_lookup(self):
+        """An owned client is resolved with one repository call."""
+        from unittest.mock import MagicMock
+        from app.clients.services import ClientService
+
+        client_repo, chef_repo = MagicMock(), MagicMock()
+        client_repo.get_owned_by_chef_user.return_value = 'client'
+
+        service = ClientService(client_repo, chef_repo)
+
+        assert service.get_client_by_id(5, 1) == 'client'
+        client_repo.get_owned_by_chef_user.assert_called_once_with(1, 5)
+        chef_repo.get_by_user_id.assert_not_called()
+
+    def test_get_client_by_id_miss_without_chef_raises(self):
+        """A miss still reports a missing chef profile."""
+        from unittest.mock import MagicMock
+        from app.clients.services import ClientService
+
+        client_repo, chef_repo = MagicMock(), MagicMock()
+        client_repo.get_owned_by_chef_user.return_value = None
+        chef_repo.get_by_user_id.return_value = None
+
+        service = ClientService(client_repo, chef_repo)
+
+        with pytest.raises(ValueError, match="Chef profile not found"):
+            service.get_client_by_id(5, 1)
+
+    def test_get_client_by_id_logs_access_to_another_chefs_client(self, caplog):
+        """A client owned by another chef is denied and logged."""
+        import logging
+        from unittest.mock import MagicMock
+        from app.clients.services import ClientService
+
+        client_repo, chef_repo = MagicMock(), MagicMock()
+        client_repo.get_owned_by_chef_user.return_value = None
+        client_repo.get_by_id.return_value = MagicMock(chef_id=9)
+        chef_repo.get_by_user_id.return_value = MagicMock(id=3)
+
+        service = ClientService(client_repo, chef_repo)
+
+        with caplog.at_level(logging.WARNING):
+            assert service.get_client_by_id(5, 1) is None
+        assert "User 1 attempted to access client 5 owned by chef 9" in caplog.text
@@ -0,0 +1,30 @@
+"""Per-request service memoization in controllers."""
+
+import importlib
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+
+@pytest.mark.parametrize(
+    "module_name, controller_name",
+    [
+        ("app.dishes.controllers.dish_controller", "DishController"),
+        ("app.menus.controllers.menu_controller", "MenuController"),
+    ],
+)
+def test_get_service_is_built_once_per_request(monkeypatch, module_name, controller_name):
+    """Repeated _get_service() calls in one request share a service and session lookup."""
+    module = importlib.import_module(module_name)
+    get_db = MagicMock()
+    monkeypatch.setattr(module, "get_db", get_db)
+    controller = getattr(module, controller_name)()
+    app = Flask(__name__)
+
+    with app.app_context():
+        service = controller._get_service()
+        assert controller._get_service() is service
+    with app.app_context():
+        assert controller._get_service() is not service
+    assert get_db.call_count == 2
@@ -43,6 +43,9 @@ def test_close_db_commits_when_no_exception(app, monkeypatch):
     calls = {"commit": 0, "rollback": 0, "close": 0}
 
     class _Session:
+        info = {"has_writes": True}
+        new = dirty = deleted = ()
+
         def commit(self):
             calls["commit"] += 1
 
@@ -59,6 +62,46 @@ def test_close_db_commits_when_no_exception(app, monkeypatch):
     assert calls == {"commit": 1, "rollback": 0, "close": 1}
 
 
+def test_close_db_skips_commit_for_read_only_session(app):
+    import app.core.database as db
+    from flask import g
+
+    calls = {"commit": 0, "rollback": 0, "close": 0}
+
+    class _Session:
+        info = {}
+        new = dirty = deleted = ()
+
+        def commit(self):
+            calls["commit"] += 1
+
+        def rollback(self):
+            calls["rollback"] += 1
+
+        def close(self):
+            calls["close"] += 1
+
+    with app.test_request_context("/"):
+        g.db = _Session()
+        db.close_db(None)
+
+    assert calls == {"commit": 0, "rollback": 0, "close": 1}
+
+
+def test_flush_marks_session_as_having_writes():
+    import app.core.database as db
+    from sqlalchemy.orm import Session
+
+    session = Session()
+    assert db._has_writes(session) is False
+
+    db._mark_flush_writes(session, None)
+    assert db._has_writes(session) is True
+
+    db._clear_writes(session)
+    assert db._has_writes(session) is False
+
+
 def test_close_db_rolls_back_when_exception(app):
     import app.core.database as db
     from flask import g
@@ -90,6 +133,9 @@ def test_close_db_rolls_back_on_sqlalchemy_error(app):
     calls = {"commit": 0, "rollback": 0, "close": 0}
 
     class _Session:
+        info = {"has_writes": True}
+        new = dirty = deleted = ()
+
         def commit(self):
             calls["commit"] += 1
             raise SQLAlchemyError("commit failed")
@@ -109,6 +155,52 @@ def test_close_db_rolls_back_on_sqlalchemy_error(app):
     assert calls["close"] == 1
 
 
+def test_close_db_runs_after_commit_callbacks_only_after_commit(app):
+    import app.core.database as db
+    from flask import g
+    from sqlalchemy.exc import SQLAlchemyError
+
+    events = []
+
+    class _Session:
+        info = {"has_writes": True}
+        new = dirty = deleted = ()
+        fail = False
+
+        def commit(self):
+            events.append("commit")
+            if self.fail:
+                raise SQLAlchemyError("commit failed")
+
+        def rollback(self):
+            events.append("rollback")
+
+        def close(self):
+            pass
+
+    with app.test_request_context("/"):
+        g.db = _Session()
+        db.call_after_commit(lambda: events.append("callback"))
+        db.close_db(None)
+    assert events == ["commit", "callback"]
+
+    events.clear()
+    with app.test_request_context("/"):
+        g.db = _Session()
+        g.db.fail = True
+        db.call_after_commit(lambda: events.append("callback"))
+        db.close_db(None)
+    assert events == ["commit", "rollback"]
+
+    events.clear()
+    with app.test_request_context("/"):
+        g.db = _Session()
+        db.call_after_commit(lambda: events.append("callback"))
+        db.close_db(Exception("boom"))
+    assert events == ["rollback"]
+    assert "after_commit" not in g
+
+
 def test_create_and_drop_tables_call_metadata(monkeypatch):
     import app.core.database as db
 
@@ -168,3 +260,85 @@ def test_init_db_sets_engine_and_sessionlocal(monkeypatch):
     assert callable(db.SessionLocal)
     assert created["engine"] == 1
     assert created["sessionmaker"] == 1
+
+
+def test_close_db_removes_scoped_session(app, monkeypatch):
+    import app.core.database as db
+    from flask import g
+
+    calls = {"remove": 0}
+
+    class _Registry:
+        def remove(self):
+            calls["remove"] += 1
+
+    class _Session:
+        info = {}
+        new = dirty = deleted = ()
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(db, "SessionLocal", _Registry())
+
+    with app.test_request_context("/"):
+        g.db = _Session()
+        db.close_db(None)
+
+    assert calls["remove"] == 1
+
+
+def test_init_db_applies_pool_settings(monkeypatch):
+    import app.core.database as db
+    from config import settings
+
+    captured = {}
+
+    def _create_engine(url, **kwargs):
+        captured.update(kwargs)
+        return object()
+
+    monkeypatch.setattr(db, "create_engine", _create_engine)
+    monkeypatch.setattr(db, "sessionmaker", lambda **kwargs: lambda: SimpleNamespace())
+    monkeypatch.setattr(settings, "get_database_url", lambda: "postgresql://fake")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 4)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 2)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 7)
+    monkeypatch.setattr(settings, "DB_POOL_RECYCLE", 900)
+    monkeypatch.setattr(db, "engine", None)
+    monkeypatch.setattr(db, "SessionLocal", None)
+
+    db.init_db()
+
+    assert captured["pool_size"] == 4
+    assert captured["max_overflow"] == 2
+    assert captured["pool_timeout"] == 7
+    assert captured["pool_recycle"] == 900
+    assert captured["pool_use_lifo"] is True
+
+
+def test_init_db_disposes_previous_engine(monkeypatch):
+    import app.core.database as db
+
+    calls = {"dispose": 0, "remove": 0}
+
+    class _OldEngine:
+        def dispose(self):
+            calls["dispose"] += 1
+
+    class _OldRegistry:
+        def remove(self):
+            calls["remove"] += 1
+
+    monkeypatch.setattr(db, "create_engine", lambda url, **kwargs: object())
+    monkeypatch.setattr(db, "sessionmaker", lambda **kwargs: lambda: SimpleNamespace())
+
+    from config import settings
+    monkeypatch.setattr(settings, "get_database_url", lambda: "postgresql://fake")
+
+    monkeypatch.setattr(db, "engine", _OldEngine())
+    monkeypatch.setattr(db, "SessionLocal", _OldRegistry())
+
+    db.init_db()
+
+    assert calls == {"dispose": 1, "remove": 1}
@@ -167,3 +167,275 @@ class TestDishAuthorization:
         """Listing dishes without token should fail."""
         response = client.get('/dishes')
         assert_unauthorized_error(response)
+
+
+class TestDishSerialization:
+    """Tests for the model to_dict() serialization."""
+
+    def test_to_dict_keeps_fields_and_string_quantity(self):
+        """Dish.to_dict() emits every column; ingredient quantities stay strings."""
+        from datetime import datetime
+        from decimal import Decimal
+        from app.dishes.models import Dish, Ingredient
+
+        created = datetime(2026, 1, 2, 3, 4, 5)
+        dish = Dish(
+            id=5, chef_id=3, name='Soup', description=None, price=Decimal('0.00'),
+            category='Starter', preparation_steps=None, prep_time=10, servings=2,
+            photo_url=None, is_active=True, created_at=created, updated_at=created
+        )
+        dish.ingredients = [
+            Ingredient(id=1, dish_id=5, name='Salt', quantity='1/2 tsp', unit=None,
+                       is_optional=True, created_at=created, updated_at=None)
+        ]
+
+        data = dish.to_dict()
+
+        assert data['price'] == 0.0
+        assert data['is_active'] is True
+        assert data['created_at'] == created.isoformat()
+        assert data['ingredients'] == [{
+            'id': 1, 'dish_id': 5, 'name': 'Salt', 'quantity': '1/2 tsp', 'unit': None,
+            'is_optional': True, 'created_at': created.isoformat(), 'updated_at': None
+        }]
+        assert 'ingredients' not in dish.to_dict(include_ingredients=False)
+
+    def test_list_schema_omits_long_text_fields(self):
+        """List items leave out description/preparation_steps; the detail schema keeps them."""
+        from app.dishes.schemas import DishListResponseSchema, dish_response_schema
+
+        dish = {'id': 5, 'name': 'Soup', 'description': 'Hot', 'preparation_steps': 'Boil'}
+
+        assert DishListResponseSchema().dump(dish) == {'id': 5, 'name': 'Soup'}
+        assert dish_response_schema.dump(dish)['preparation_steps'] == 'Boil'
+
+
+class TestDishSchemaValidation:
+    """Tests for the ingredient list cap."""
+
+    def test_oversized_ingredient_list_rejected_before_items_load(self):
+        """More than 50 ingredients fails on length alone; items are never validated."""
+        from marshmallow import ValidationError
+        from app.dishes.schemas import DishCreateSchema, DishUpdateSchema
+
+        for schema in (DishCreateSchema(partial=True), DishUpdateSchema()):
+            with pytest.raises(ValidationError) as exc:
+                schema.load({'ingredients': [{}] * 51})
+            assert exc.value.messages == {'ingredients': ['Maximum 50 ingredients allowed per dish']}
+
+            loaded = schema.load({'ingredients': [{'name': 'Salt'}] * 50})
+            assert len(loaded['ingredients']) == 50
+
+
+class TestDishListRows:
+    """Tests for the ORM-free dish list query."""
+
+    def test_get_list_rows_attaches_ingredients_to_their_dish(self):
+        """Dish rows and ingredient rows are read with two statements and joined in Python."""
+        from datetime import datetime
+        from decimal import Decimal
+        from unittest.mock import MagicMock
+        from app.dishes.repositories.dish_repository import DishRepository, IngredientRow
+        from app.dishes.schemas import DishListResponseSchema
+
+        now = datetime(2026, 1, 2, 3, 4, 5)
+        db = MagicMock()
+        db.execute.side_effect = [
+            [(1, 3, 'Soup', Decimal('4.50'), None, 10, 2, None, True, now, now),
+             (2, 3, 'Stew', None, None, None, 1, None, True, now, now)],
+            [(7, 2, 'Beef', '500', 'g', False)],
+        ]
+
+        rows = DishRepository(db).get_list_rows(3)
+
+        assert [row.ingredients for row in rows] == [[], [IngredientRow(7, 2, 'Beef', '500', 'g', False)]]
+        data = DishListResponseSchema(many=True).dump(rows)
+        assert data[0]['price'] == '4.50'
+        assert data[1]['ingredients'][0]['name'] == 'Beef'
+        assert DishRepository(db).get_list_rows(3, dish_ids=[]) == []
+
+
+class TestDishServiceChefLookup:
+    """Tests for the per-request chef lookup."""
+
+    def test_chef_is_looked_up_once_per_request(self):
+        """Repeated lookups in one request reuse the chef; a new request looks it up again."""
+        from unittest.mock import MagicMock
+        from flask import Flask
+        from app.chefs.repositories import get_chef_for_user
+
+        chef_repo = MagicMock()
+        app = Flask(__name__)
+
+        with app.app_context():
+            assert get_chef_for_user(chef_repo, 9) is get_chef_for_user(chef_repo, 9)
+        with app.app_context():
+            get_chef_for_user(chef_repo, 9)
+        assert chef_repo.get_by_user_id.call_count == 2
+
+        # Missing profiles aren't memoized
+        chef_repo.get_by_user_id.return_value = None
+        with app.app_context():
+            get_chef_for_user(chef_repo, 10)
+            get_chef_for_user(chef_repo, 10)
+        assert chef_repo.get_by_user_id.call_count == 4
+
+    def test_cache_dish_waits_for_commit(self, app):
+        """Created/updated dishes are written to the cache only after the commit."""
+        from unittest.mock import MagicMock
+        from flask import g
+        import app.core.database as db
+        from app.dishes.services import DishService
+
+        service = DishService(MagicMock(), MagicMock())
+        service.cache_helper = MagicMock()
+
+        with app.test_request_context("/"):
+            g.pop("after_commit", None)
+            service.cache_dish({"id": 4, "name": "Soup"}, 9)
+            service.cache_helper.set.assert_not_called()
+            db.close_db(None)
+
+        assert service.cache_helper.set.call_count == 2
+
+        with app.test_request_context("/"):
+            service.cache_dish({"id": 5, "name": "Stew"}, 9)
+            db.close_db(Exception("boom"))
+
+        assert service.cache_helper.set.call_count == 2
+
+    def test_cached_dish_hit_skips_chef_lookup(self, monkeypatch):
+        """A detail cache hit is served without resolving the chef profile."""
+        from unittest.mock import MagicMock
+        from app.dishes.services import DishService
+
+        chef_repo = MagicMock()
+        service = DishService(MagicMock(), chef_repo)
+        monkeypatch.setattr(service.cache_helper, "cache", MagicMock(get=MagicMock(return_value={"id": 4})))
+
+        assert service.get_dish_by_id_cached(4, 9) == {"id": 4}
+        chef_repo.get_by_user_id.assert_not_called()
+
+    def test_get_dish_by_id_hit_skips_chef_lookup(self):
+        """An owned dish is resolved with one repository call."""
+        from unittest.mock import MagicMock
+        from app.dishes.services import DishService
+
+        dish_repo, chef_repo = MagicMock(), MagicMock()
+        dish_repo.get_owned_by_chef_user.return_value = 'dish'
+        service = DishService(dish_repo, chef_repo)
+
+        assert service.get_dish_by_id(4, 9) == 'dish'
+        dish_repo.get_owned_by_chef_user.assert_called_once_with(9, 4)
+        chef_repo.get_by_user_id.assert_not_called()
+
+    def test_get_dish_by_id_miss_without_chef_raises(self):
+        """A miss still reports a missing chef profile."""
+        from unittest.mock import MagicMock
+        from app.dishes.services import DishService
+
+        dish_repo, chef_repo = MagicMock(), MagicMock()
+        dish_repo.get_owned_by_chef_user.return_value = None
+        chef_repo.get_by_user_id.return_value = None
+        service = DishService(dish_repo, chef_repo)
+
+        with pytest.raises(ValueError, match="Chef profile not found"):
+            service.get_dish_by_id(4, 9)
+
+
+class TestDishIngredientReplacement:
+    """Tests for skipping no-op ingredient replacement."""
+
+    def test_same_ingredients_ignores_order_and_matches_stored_quantities(self):
+        """Submitting the current ingredients again is detected; any change is not."""
+        from decimal import Decimal
+        from types import SimpleNamespace
+        from app.dishes.repositories.dish_repository import DishRepository
+
+        dish = SimpleNamespace(ingredients=[
+            SimpleNamespace(name='Salt', quantity='1.5', unit='g', is_optional=False),
+            SimpleNamespace(name='Oil', quantity=None, unit=None, is_optional=True),
+        ])
+        same = [
+            {'name': 'Oil', 'is_optional': True},
+            {'name': 'Salt', 'quantity': Decimal('1.5'), 'unit': 'g'},
+        ]
+
+        assert DishRepository._same_ingredients(dish, same)
+        assert not DishRepository._same_ingredients(dish, same[:1])
+        assert not DishRepository._same_ingredients(dish, [same[0], {**same[1], 'unit': 'kg'}])
+
+
+class TestDishQueryCount:
+    """Guards against N+1 lazy loads of Dish.ingredients."""
+
+    @pytest.fixture
+    def chef_dishes(self, db_session, test_chef):
+        """Three dishes with two ingredients each, expunged from the session."""
+        from app.dishes.repositories import DishRepository
+
+        repo = DishRepository(db_session)
+        for n in range(3):
+            repo.create(
+                {'chef_id': test_chef.id, 'name': f'Dish {n}'},
+                [{'name': 'Salt', 'quantity': '1', 'unit': 'g'}, {'name': 'Oil', 'quantity': '2', 'unit': 'ml'}]
+            )
+        db_session.commit()
+        db_session.expunge_all()
+        return repo
+
+    def test_chef_dish_list_loads_ingredients_in_one_query(self, chef_dishes, test_chef, statements):
+        """Serializing a chef's dishes costs one dish SELECT plus one ingredient SELECT."""
+        from app.dishes.schemas import DishResponseSchema
+
+        dishes = chef_dishes.get_by_chef_id(test_chef.id)
+        data = DishResponseSchema(many=True).dump(dishes)
+
+        assert [len(d['ingredients']) for d in data] == [2, 2, 2]
+        assert len(statements) == 2
+
+    def test_dish_list_rows_load_ingredients_in_one_query(self, chef_dishes, test_chef, statements):
+        """The cached list path reads dishes and ingredients with two statements."""
+        rows = chef_dishes.get_list_rows(test_chef.id)
+
+        assert [len(row.ingredients) for row in rows] == [2, 2, 2]
+        assert len(statements) == 2
+
+    def test_dish_detail_loads_ingredients_with_the_dish(self, chef_dishes, test_chef, statements):
+        """get_by_id() joins the ingredients; serializing issues no further SELECT."""
+        from app.dishes.schemas import dish_response_schema
+
+        dish_id = chef_dishes.get_list_rows(test_chef.id)[0].id
+        statements.clear()
+
+        data = dish_response_schema.dump(chef_dishes.get_by_id(dish_id))
+
+        assert len(data['ingredients']) == 2
+        assert len(statements) == 1
+
+    def test_owned_dish_loads_with_ingredients_in_one_query(self, chef_dishes, test_chef, statements):
+        """The ownership check and the ingredients share the dish SELECT."""
+        from app.dishes.schemas import dish_response_schema
+
+        dish_id = chef_dishes.get_list_rows(test_chef.id)[0].id
+        statements.clear()
+
+        data = dish_response_schema.dump(chef_dishes.get_owned_by_chef_user(test_chef.user_id, dish_id))
+
+        assert len(data['ingredients']) == 2
+        assert len(statements) == 1
+        assert chef_dishes.get_owned_by_chef_user(test_chef.user_id + 1, dish_id) is None
+
+    def test_created_dish_serializes_without_reloading_ingredients(self, db_session, test_chef, statements):
+        """create() attaches the RETURNING rows, so the response needs no SELECT."""
+        from app.dishes.repositories import DishRepository
+        from app.dishes.schemas import dish_response_schema
+
+        dish = DishRepository(db_session).create(
+            {'chef_id': test_chef.id, 'name': 'Fresh'},
+            [{'name': 'Salt', 'quantity': '1', 'unit': 'g'}]
+        )
+        statements.clear()
+
+        assert dish_response_schema.dump(dish)['ingredients'][0]['name'] == 'Salt'
+        assert not [s for s in statements if s.lstrip().upper().startswith('SELECT')]
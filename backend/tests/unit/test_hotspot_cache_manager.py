@@ -10,6 +10,18 @@ import fnmatch
 import pytest
 
 
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def setex(self, *args):
+        self._calls.append(args)
+
+    def execute(self):
+        return [self._client.setex(*args) for args in self._calls]
+
+
 class _FakeRedis:
     def __init__(self, *args, **kwargs):
         self._store: dict[str, str] = {}
@@ -21,11 +33,22 @@ class _FakeRedis:
     def get(self, key: str):
         return self._store.get(key)
 
+    def mget(self, keys):
+        return [self._store.get(k) for k in keys]
+
     def setex(self, key: str, ttl: int, value: str):
         self._store[key] = value
         self._ttl[key] = int(ttl)
         return True
 
+    def incr(self, key: str):
+        value = int(self._store.get(key, b"0")) + 1
+        self._store[key] = str(value).encode()
+        return value
+
+    def pipeline(self, transaction: bool = True):
+        return _FakePipeline(self)
+
     def delete(self, *keys: str):
         deleted = 0
         for key in keys:
@@ -35,8 +58,18 @@ class _FakeRedis:
                 self._ttl.pop(key, None)
         return deleted
 
-    def keys(self, pattern: str):
-        return [k for k in list(self._store.keys()) if fnmatch.fnmatch(k, pattern)]
+    def unlink(self, *keys: str):
+        return self.delete(*keys)
+
+    def scan_iter(self, match: str = "*", count: int | None = None):
+        return iter([k for k in list(self._store.keys()) if fnmatch.fnmatch(k, match)])
+
+    def register_script(self, script: str):
+        # Emulates the delete-patterns Lua script
+        def run(keys=None, args=None):
+            return sum(self.unlink(*list(self.scan_iter(match=p))) for p in args or [])
+
+        return run
 
     def exists(self, key: str):
         return 1 if key in self._store else 0
@@ -75,13 +108,114 @@ def test_cache_manager_set_get_delete(cache_manager):
     assert cache_manager.get("k1") == payload
 
     assert cache_manager.exists("k1") is True
-    assert cache_manager.get_ttl("k1") == 123
+    # TTL carries up to 10% random jitter
+    assert 123 <= cache_manager.get_ttl("k1") <= 135
+
+    # A miss returns the caller's default; a cached None is a real hit
+    assert cache_manager.get("missing", "dflt") == "dflt"
+    assert cache_manager.set("none", None, ttl=10) is True
+    assert cache_manager.get("none", "dflt") is None
 
     assert cache_manager.delete("k1") is True
     assert cache_manager.get("k1") is None
     assert cache_manager.exists("k1") is False
 
 
+def test_cache_manager_get_many_returns_only_hits(cache_manager):
+    cache_manager.set("a", {"n": 1}, ttl=60)
+    cache_manager.set("c", [3], ttl=60)
+
+    assert cache_manager.get_many(["a", "b", "c"]) == {"a": {"n": 1}, "c": [3]}
+    assert cache_manager.get_many([]) == {}
+
+    # A corrupt value is dropped like a miss so the caller refetches it
+    cache_manager.redis_client._store["lyftercook:test:c"] = b"{not json"
+    assert cache_manager.get_many(["a", "c"]) == {"a": {"n": 1}}
+
+
+def test_cache_manager_get_many_raw_returns_undecoded_hits(cache_manager):
+    cache_manager.set("a", {"x": 1}, ttl=60)
+
+    assert cache_manager.get_many_raw(["a", "missing"]) == {"a": b'{"x":1}'}
+
+
+def test_cache_manager_incr_counts_and_reads_back_as_int(cache_manager):
+    assert cache_manager.incr("chef:__generation__") == 1
+    assert cache_manager.incr("chef:__generation__") == 2
+    assert cache_manager.get("chef:__generation__") == 2
+    assert cache_manager.get_counter("chef:__generation__") == 2
+    assert cache_manager.get_counter("dish:__generation__") == 0
+
+
+def test_cache_manager_set_many_stores_each_key_with_ttl(cache_manager):
+    assert cache_manager.set_many({"a": {"n": 1}, "b": [2]}, ttl=100) is True
+
+    assert cache_manager.get_many(["a", "b"]) == {"a": {"n": 1}, "b": [2]}
+    assert 100 <= cache_manager.get_ttl("b") <= 110
+    assert cache_manager.set_many({}, ttl=100) is False
+
+
+def test_cache_manager_compresses_large_values(cache_manager, monkeypatch):
+    import threading
+    import zlib
+    import app.core.cache_manager as cm
+
+    # Stand-in codec emitting zstd-framed bytes (zstandard isn't required here)
+    class _Codec:
+        def compress(self, data):
+            return cm._ZSTD_MAGIC + zlib.compress(data)
+
+        def decompress(self, data):
+            return zlib.decompress(data[len(cm._ZSTD_MAGIC):])
+
+    monkeypatch.setattr(cm, "zstandard", type("zstd", (), {
+        "ZstdCompressor": staticmethod(lambda level: _Codec()),
+        "ZstdDecompressor": staticmethod(_Codec),
+    }))
+    monkeypatch.setattr(cm, "_zstd_local", threading.local())
+    monkeypatch.setattr(cm.settings, "CACHE_COMPRESS_MIN_BYTES", 64)
+
+    big = {"text": "x" * 500}
+    cache_manager.set("big", big, ttl=60)
+    cache_manager.set_many({"big2": big, "small": {"n": 1}}, ttl=60)
+
+    assert cache_manager.get_raw("big").startswith(cm._ZSTD_MAGIC)
+    assert cache_manager.get_raw("small") == b'{"n":1}'
+    assert cache_manager.get("big") == big
+    assert cache_manager.get_many(["big2", "small"]) == {"big2": big, "small": {"n": 1}}
+
+    # A worker without zstandard treats compressed values as misses
+    monkeypatch.setattr(cm, "zstandard", None)
+    assert cache_manager.get("big", "dflt") == "dflt"
+
+
+def test_cache_manager_get_raw_returns_stored_bytes(cache_manager):
+    cache_manager.set("body", {"data": [1, 2]}, ttl=60)
+
+    assert cache_manager.get_raw("body") == b'{"data":[1,2]}'
+    assert cache_manager.get_raw("missing") is None
+
+
+def test_cache_manager_set_raw_stores_bytes_as_is(cache_manager):
+    assert cache_manager.set_raw("body", b'{"ok":true}', ttl=60) is True
+
+    assert cache_manager.get_raw("body") == b'{"ok":true}'
+    assert cache_manager.get("body") == {"ok": True}
+
+
+def test_cache_manager_delete_many_unlinks_in_one_call(cache_manager, monkeypatch):
+    cache_manager.set("a", 1, ttl=60)
+    cache_manager.set("b", 2, ttl=60)
+    calls = []
+    unlink = cache_manager.redis_client.unlink
+    monkeypatch.setattr(cache_manager.redis_client, "unlink", lambda *keys: calls.append(keys) or unlink(*keys))
+
+    assert cache_manager.delete_many(["a", "b", "missing"]) == 2
+    assert len(calls) == 1
+    assert cache_manager.get_many(["a", "b"]) == {}
+    assert cache_manager.delete_many([]) == 0
+
+
 def test_cache_manager_delete_pattern(cache_manager):
     cache_manager.set("route:public:chefs:/public/chefs", {"ok": True}, ttl=60)
     cache_manager.set("route:public:dishes:/public/dishes/1", {"ok": True}, ttl=60)
@@ -93,6 +227,58 @@ def test_cache_manager_delete_pattern(cache_manager):
     assert cache_manager.get("unrelated") == {"ok": True}
 
 
+def test_cache_manager_delete_pattern_drops_route_body_cache_entries(cache_manager):
+    import app.core.cache_manager as cm
+
+    cm.route_body_cache.set("route:public:chefs:/public/chefs", b"{}")
+    cm.route_body_cache.set("route:dishes:/dishes", b"{}")
+
+    cache_manager.delete_pattern("route:public:*")
+
+    assert cm.route_body_cache.get("route:public:chefs:/public/chefs") is None
+    assert cm.route_body_cache.get("route:dishes:/dishes") == b"{}"
+    cm.route_body_cache.clear()
+
+
+def test_cache_manager_delete_patterns_runs_one_script_call(cache_manager):
+    cache_manager.set("route:public:dishes:/public/dishes", {"ok": True}, ttl=60)
+    cache_manager.set("route:dishes:/dishes", {"ok": True}, ttl=60)
+    cache_manager.set("unrelated", {"ok": True}, ttl=60)
+
+    assert cache_manager.delete_patterns(["route:public:dishes:*", "route:dishes:*"]) == 2
+    assert cache_manager.get("unrelated") == {"ok": True}
+    assert cache_manager.delete_patterns([]) == 0
+
+
+def test_cache_manager_delete_patterns_falls_back_without_scripting(cache_manager, monkeypatch):
+    def no_scripting(_script):
+        raise RuntimeError("NOSCRIPT")
+
+    monkeypatch.setattr(cache_manager.redis_client, "register_script", no_scripting)
+    cache_manager.set("route:a:1", {"ok": True}, ttl=60)
+    cache_manager.set("route:b:1", {"ok": True}, ttl=60)
+
+    assert cache_manager.delete_patterns(["route:a:*", "route:b:*"]) == 2
+
+
+def test_cache_manager_delete_pattern_unlinks_in_batches(cache_manager, monkeypatch):
+    monkeypatch.setattr(cache_manager, "SCAN_BATCH_SIZE", 2)
+    for i in range(5):
+        cache_manager.set(f"route:public:item:{i}", {"i": i}, ttl=60)
+
+    calls = []
+    original_unlink = cache_manager.redis_client.unlink
+
+    def _unlink(*keys):
+        calls.append(len(keys))
+        return original_unlink(*keys)
+
+    monkeypatch.setattr(cache_manager.redis_client, "unlink", _unlink)
+
+    assert cache_manager.delete_pattern("route:public:*") == 5
+    assert calls == [2, 2, 1]
+
+
 def test_cached_decorator_caches_none(monkeypatch):
     import app.core.cache_manager as cm
 
@@ -103,7 +289,7 @@ def test_cached_decorator_caches_none(monkeypatch):
         {
             "enabled": True,
             "_store": {},
-            "get": lambda self, k: self._store.get(k),
+            "get": lambda self, k, default=None: self._store.get(k, default),
             "set": lambda self, k, v, ttl=3600: self._store.__setitem__(k, v) or True,
         },
     )()
@@ -121,3 +307,85 @@ def test_cached_decorator_caches_none(monkeypatch):
     assert maybe("missing") is None
     # Under the decorator, None should be cached to avoid repeated function calls.
     assert calls["n"] == 1
+
+    # Entries written with the old None marker still read back as None
+    fake_cache._store["x:y:old"] = "__CACHE_NONE__"
+    assert maybe("old") is None
+    assert calls["n"] == 1
+
+
+def test_cached_decorator_key_format(monkeypatch):
+    import app.core.cache_manager as cm
+
+    seen = []
+    fake_cache = type(
+        "FakeCache",
+        (),
+        {
+            "enabled": True,
+            "get": lambda self, k, default=None: seen.append(k) or default,
+            "set": lambda self, k, v, ttl=3600: True,
+        },
+    )()
+    monkeypatch.setattr(cm, "get_cache", lambda: fake_cache)
+
+    class _Service:
+        @cm.cached(key_prefix="user:auth", ttl=60)
+        def get_user(self, user_id, scope=None):
+            return {"id": user_id}
+
+    svc = _Service()
+    svc.get_user(123)
+    svc.get_user(123, scope="admin")
+
+    # Single positional argument uses the fast path; same key shape as the generic path.
+    assert seen == ["user:auth:123", "user:auth:123:scope=admin"]
+
+
+def test_cached_decorator_skips_cls_for_classmethods(monkeypatch):
+    import app.core.cache_manager as cm
+
+    seen = []
+    fake_cache = type(
+        "FakeCache",
+        (),
+        {
+            "enabled": True,
+            "get": lambda self, k, default=None: seen.append(k) or default,
+            "set": lambda self, k, v, ttl=3600: True,
+        },
+    )()
+    monkeypatch.setattr(cm, "get_cache", lambda: fake_cache)
+
+    class _Repo:
+        @classmethod
+        @cm.cached(key_prefix="repo:item", ttl=60)
+        def load(cls, item_id):
+            return {"id": item_id}
+
+    @cm.cached(key_prefix="plain", ttl=60)
+    def lookup(obj):
+        return obj
+
+    _Repo.load(9)
+    lookup(42)
+
+    assert seen == ["repo:item:9", "plain:42"]
+
+
+def test_cache_manager_delete_drops_only_exact_route_body_cache_keys(cache_manager):
+    import app.core.cache_manager as cm
+
+    cm.route_body_cache.set("route:dishes:/dishes?q=[a]", b"{}")
+    cm.route_body_cache.set("route:dishes:/dishes?q=a", b"{}")
+    cm.route_body_cache.set("route:dishes:/dishes", b"{}")
+
+    # Literal keys are not globs: '[a]' must not evict the '?q=a' entry
+    cache_manager.delete("route:dishes:/dishes?q=[a]")
+    assert cm.route_body_cache.get("route:dishes:/dishes?q=[a]") is None
+    assert cm.route_body_cache.get("route:dishes:/dishes?q=a") == b"{}"
+
+    cache_manager.delete_many(["route:dishes:/dishes", "route:dishes:/missing"])
+    assert cm.route_body_cache.get("route:dishes:/dishes") is None
+    assert cm.route_body_cache.get("route:dishes:/dishes?q=a") == b"{}"
+    cm.route_body_cache.clear()
@@ -27,6 +27,9 @@ class _InMemoryCache:
     def delete(self, key: str):
         return self._store.pop(key, None) is not None
 
+    def delete_many(self, keys):
+        return sum(self._store.pop(k, None) is not None for k in keys)
+
     def delete_pattern(self, pattern: str):
         # Minimal pattern support for tests.
         if pattern.endswith("*"):
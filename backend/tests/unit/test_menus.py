@@ -126,3 +126,133 @@ class TestMenuDishAssociation:
                               headers=chef_headers)
         
         assert_success_response(response, 200)
+
+
+class TestMenuNameLookup:
+    """Tests for the duplicate-name lookup."""
+
+    def test_name_lookup_is_case_insensitive_and_literal(self, db_session, test_chef, test_menu):
+        """Names match regardless of case; '%' and '_' aren't wildcards."""
+        from app.menus.repositories import MenuRepository
+
+        repo = MenuRepository(db_session)
+
+        assert repo.get_by_chef_and_name(test_chef.id, 'TEST MENU').id == test_menu.id
+        assert repo.get_by_chef_and_name(test_chef.id, 'Test%') is None
+        assert repo.get_by_chef_and_name(test_chef.id, 'Test_Menu') is None
+
+
+class TestMenuListRows:
+    """Tests for the ORM-free menu list query."""
+
+    def test_get_list_rows_attaches_dishes_to_their_menu(self):
+        """Menu rows and dish rows are read with two statements and joined in Python."""
+        from datetime import datetime
+        from decimal import Decimal
+        from unittest.mock import MagicMock
+        from app.menus.models.menu_model import MenuStatus
+        from app.menus.repositories.menu_repository import MenuRepository
+        from app.menus.schemas import MenuResponseSchema
+
+        now = datetime(2026, 1, 2, 3, 4, 5)
+        db = MagicMock()
+        db.execute.side_effect = [
+            [(1, 3, 'Lunch', None, MenuStatus.PUBLISHED, now, now),
+             (2, 3, 'Dinner', 'Late', MenuStatus.DRAFT, now, now)],
+            [(2, 7, 0, 7, 'Soup', Decimal('4.50'), 'Starter', None, True),
+             (2, 8, 1, 8, 'Stew', Decimal('9.00'), 'Main', None, True)],
+        ]
+
+        rows = MenuRepository(db).get_list_rows(3)
+
+        assert [len(row.menu_dishes) for row in rows] == [0, 2]
+        data = MenuResponseSchema(many=True).dump(rows)
+        assert data[0]['status'] == 'published'
+        assert [d['dish']['name'] for d in data[1]['dishes']] == ['Soup', 'Stew']
+        assert data[1]['total_price'] == '13.50'
+
+
+class TestMenuServiceChefLookup:
+    """Tests for the per-request chef lookup."""
+
+    def test_chef_lookup_is_shared_with_other_services(self):
+        """A chef resolved by MenuService is reused by other services in the same request."""
+        from unittest.mock import MagicMock
+        from flask import Flask
+        from app.chefs.repositories import get_chef_for_user
+        from app.menus.services import MenuService
+
+        chef_repo, menu_repo, other_chef_repo = MagicMock(), MagicMock(), MagicMock()
+        chef = chef_repo.get_by_user_id.return_value
+        menu_repo.get_by_id.return_value = MagicMock(chef_id=chef.id)
+        service = MenuService(menu_repo, chef_repo, MagicMock())
+        app = Flask(__name__)
+
+        with app.app_context():
+            assert service.get_menu_by_id(1, 9) is menu_repo.get_by_id.return_value
+            assert get_chef_for_user(other_chef_repo, 9) is chef
+        chef_repo.get_by_user_id.assert_called_once_with(9)
+        other_chef_repo.get_by_user_id.assert_not_called()
+
+
+class TestMenuQueryCount:
+    """Guards against row explosion / N+1 loads of menu dishes."""
+
+    def test_chef_menus_load_dishes_in_one_query_per_level(self, db_session, test_chef, test_dish, statements):
+        """Serializing a chef's menus costs one SELECT each for menus, menu_dishes and dishes."""
+        from app.menus.repositories import MenuRepository
+        from app.menus.schemas import MenuResponseSchema
+
+        repo = MenuRepository(db_session)
+        for n in range(3):
+            repo.create({'chef_id': test_chef.id, 'name': f'Menu {n}'}, [test_dish.id])
+        db_session.commit()
+        db_session.expunge_all()
+        statements.clear()
+
+        data = MenuResponseSchema(many=True).dump(repo.get_by_chef_id(test_chef.id))
+
+        assert [menu['dish_count'] for menu in data] == [1, 1, 1]
+        assert len(statements) == 3
+
+    def test_assign_dishes_writes_only_the_difference(self, db_session, test_chef, test_dish, statements):
+        """Re-assigning deletes, moves and inserts only what changed; an unchanged list writes nothing."""
+        from app.dishes.models import Dish
+        from app.menus.repositories import MenuRepository
+        from app.menus.schemas import menu_response_schema
+
+        repo = MenuRepository(db_session)
+        dropped, added = Dish(chef_id=test_chef.id, name='Dropped'), Dish(chef_id=test_chef.id, name='Added')
+        db_session.add_all([dropped, added])
+        db_session.flush()
+        menu = repo.create({'chef_id': test_chef.id, 'name': 'Diffed'}, [test_dish.id, dropped.id])
+        statements.clear()
+
+        repo.assign_dishes(menu, [
+            {'dish_id': added.id, 'order_position': 0},
+            {'dish_id': test_dish.id, 'order_position': 1},
+        ])
+
+        assert [s.split()[0] for s in statements] == ['DELETE', 'INSERT', 'UPDATE']
+        assert [d['dish_id'] for d in menu_response_schema.dump(menu)['dishes']] == [added.id, test_dish.id]
+
+        statements.clear()
+        repo.assign_dishes(menu, [
+            {'dish_id': test_dish.id, 'order_position': 1},
+            {'dish_id': added.id, 'order_position': 0},
+        ])
+        assert statements == []
+
+    def test_chef_menu_list_rows_take_two_queries(self, db_session, test_chef, test_dish, statements):
+        """The cached list path reads menus and their dishes with two statements."""
+        from app.menus.repositories import MenuRepository
+
+        repo = MenuRepository(db_session)
+        for n in range(3):
+            repo.create({'chef_id': test_chef.id, 'name': f'Menu {n}'}, [test_dish.id])
+        statements.clear()
+
+        rows = repo.get_list_rows(test_chef.id)
+
+        assert [len(row.menu_dishes) for row in rows] == [1, 1, 1]
+        assert len(statements) == 2
@@ -5,6 +5,8 @@ import types
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
+import pytest
+
 
 def test_calendar_ics_service_appointment_to_event_and_escaping():
     from app.appointments.services.calendar_ics_service import CalendarIcsService
@@ -176,6 +178,21 @@ def _install_fake_sendgrid(monkeypatch, *, status_code=202, raise_on_send=False)
     monkeypatch.setitem(sys.modules, "sendgrid.helpers", helpers)
     monkeypatch.setitem(sys.modules, "sendgrid.helpers.mail", helpers_mail)
 
+    import app.core.email_service as email_service
+
+    monkeypatch.setattr(email_service, "SendGridAPIClient", SendGridAPIClient)
+    monkeypatch.setattr(email_service, "Mail", Mail)
+    monkeypatch.setattr(email_service, "_sg_client", None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_email_enabled():
+    from app.core.email_service import EmailService
+
+    EmailService.enabled.cache_clear()
+    yield
+    EmailService.enabled.cache_clear()
+
 
 def test_email_service_enabled_respects_env_and_api_key(monkeypatch):
     from app.core.email_service import EmailService
@@ -186,9 +203,12 @@ def test_email_service_enabled_respects_env_and_api_key(monkeypatch):
     assert EmailService.enabled() is False
 
     monkeypatch.setattr(settings, "SENDGRID_API_KEY", "key")
+    assert EmailService.enabled() is False  # resolved once per process
+    EmailService.enabled.cache_clear()
     assert EmailService.enabled() is True
 
     monkeypatch.setenv("EMAIL_ENABLED", "false")
+    EmailService.enabled.cache_clear()
     assert EmailService.enabled() is False
 
 
@@ -282,6 +302,236 @@ def test_email_service_send_welcome_email_calls_send_email(monkeypatch):
     assert "andy" in called["html_content"]
 
 
+def test_email_service_send_many_retries_transient_errors(monkeypatch):
+    import app.core.email_service as email_service
+    from app.core.email_service import EmailService
+    from config import settings
+
+    monkeypatch.setattr(settings, "SENDGRID_API_KEY", "key")
+    monkeypatch.setattr(settings, "SENDGRID_RATE_PER_SEC", 0)
+    monkeypatch.delenv("EMAIL_ENABLED", raising=False)
+    _install_fake_sendgrid(monkeypatch)
+
+    statuses = {"a@example.com": [429, 503, 202], "b@example.com": [400], "c@example.com": [202]}
+    sleeps = []
+
+    class _Client:
+        def send(self, mail):
+            return SimpleNamespace(status_code=statuses[mail.to_emails].pop(0))
+
+    monkeypatch.setattr(email_service, "_sg_client", _Client())
+    monkeypatch.setattr(email_service.time, "sleep", sleeps.append)
+
+    results = EmailService.send_many(
+        [
+            {"to_email": to, "subject": "s", "html_content": "<p>hi</p>"}
+            for to in ("a@example.com", "b@example.com", "c@example.com")
+        ],
+        max_concurrency=2,
+    )
+
+    assert results == [True, False, True]
+    assert len(sleeps) == 2  # two backoffs for a@example.com
+    assert statuses == {"a@example.com": [], "b@example.com": [], "c@example.com": []}
+
+
+def test_email_service_send_many_disabled_returns_false(monkeypatch):
+    from app.core.email_service import EmailService
+    from config import settings
+
+    monkeypatch.setattr(settings, "SENDGRID_API_KEY", "")
+    monkeypatch.delenv("EMAIL_ENABLED", raising=False)
+
+    assert EmailService.send_many([]) == []
+    assert EmailService.send_many([{"to_email": "a@example.com"}]) == [False]
+
+
+class _FakeQueueRedis:
+    def __init__(self):
+        self.lists = {}
+        self.zsets = {}
+
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+
+    def lmove(self, src, dest, wherefrom="LEFT", whereto="RIGHT"):
+        items = self.lists.get(src)
+        if not items:
+            return None
+        value = items.pop() if wherefrom == "RIGHT" else items.pop(0)
+        target = self.lists.setdefault(dest, [])
+        target.append(value) if whereto == "RIGHT" else target.insert(0, value)
+        return value
+
+    def blmove(self, src, dest, timeout, wherefrom="LEFT", whereto="RIGHT"):
+        return self.lmove(src, dest, wherefrom, whereto)
+
+    def lrem(self, key, count, value):
+        self.lists.get(key, []).remove(value)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def register_script(self, _source):
+        # Python stand-in for _PROMOTE_RETRIES_LUA
+        def promote(keys, args):
+            retry_key, outbound_key = keys
+            zset = self.zsets.get(retry_key, {})
+            due = sorted((job for job, at in zset.items() if at <= args[0]), key=zset.get)[: args[1]]
+            for job in due:
+                del zset[job]
+                self.lpush(outbound_key, job)
+            return len(due)
+
+        promote.registered_client = self
+        return promote
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis, self.calls = redis, []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+def _install_fake_queue(monkeypatch):
+    import app.core.email_queue as email_queue
+
+    fake_redis = _FakeQueueRedis()
+    cache = SimpleNamespace(enabled=True, redis_client=fake_redis, _format_key=lambda k: f"t:{k}")
+    monkeypatch.setattr(email_queue, "get_cache", lambda: cache)
+    monkeypatch.setattr(email_queue, "default_worker_id", lambda: "w1")
+    monkeypatch.setattr(email_queue.settings, "EMAIL_QUEUE_ENABLED", True, raising=False)
+    monkeypatch.setattr(email_queue.settings, "SENDGRID_API_KEY", "SG.test", raising=False)
+    monkeypatch.delenv("EMAIL_ENABLED", raising=False)
+    return fake_redis
+
+
+def _install_fake_clock(monkeypatch, start=1000.0):
+    import app.core.email_queue as email_queue
+
+    clock = [start]
+    monkeypatch.setattr(email_queue, "time", SimpleNamespace(time=lambda: clock[0], sleep=lambda _s: None))
+    return clock
+
+
+def test_email_welcome_is_queued_and_worker_sends_it(monkeypatch):
+    import app.core.email_queue as email_queue
+    from app.core.email_service import EmailService
+
+    fake_redis = _install_fake_queue(monkeypatch)
+    sent = []
+
+    def fake_send_email(*, to_email, subject, html_content, text_content=None):
+        sent.append(to_email)
+        return True
+
+    monkeypatch.setattr(EmailService, "send_email", staticmethod(fake_send_email))
+
+    assert EmailService.send_welcome_email(to_email="a@example.com", username="andy") is True
+    assert sent == []
+    assert len(fake_redis.lists["t:emails:outbound"]) == 1
+
+    assert email_queue.process_next() is True
+    assert sent == ["a@example.com"]
+    assert email_queue.process_next() is None
+
+
+def test_email_queue_is_skipped_when_email_is_not_configured(monkeypatch):
+    import app.core.email_queue as email_queue
+    from app.core.email_service import EmailService
+
+    fake_redis = _install_fake_queue(monkeypatch)
+    monkeypatch.setenv("EMAIL_ENABLED", "false")
+
+    assert EmailService.send_welcome_email(to_email="a@example.com", username="andy") is False
+    assert "t:emails:outbound" not in fake_redis.lists
+
+
+def test_email_queue_dead_letters_undecodable_jobs(monkeypatch):
+    import app.core.email_queue as email_queue
+
+    fake_redis = _install_fake_queue(monkeypatch)
+    _install_fake_clock(monkeypatch)
+    fake_redis.lpush("t:emails:outbound", b"not json")
+
+    assert email_queue.process_next() is False
+    assert fake_redis.lists["t:emails:processing:w1"] == []
+    assert fake_redis.lists["t:emails:dead"] == [b"not json"]
+
+
+def test_email_queue_moves_failing_jobs_to_dead_letter(monkeypatch):
+    import app.core.email_queue as email_queue
+    from app.core.email_service import EmailService
+
+    fake_redis = _install_fake_queue(monkeypatch)
+    clock = _install_fake_clock(monkeypatch)
+    monkeypatch.setattr(EmailService, "send_email", staticmethod(lambda **_kw: False))
+
+    assert email_queue.enqueue_email(to_email="a@example.com", subject="s", html_content="h") is True
+    for attempt in range(1, email_queue.MAX_ATTEMPTS + 1):
+        assert email_queue.process_next() is False
+        clock[0] += email_queue.retry_delay(attempt)
+
+    assert fake_redis.lists["t:emails:outbound"] == []
+    assert fake_redis.lists["t:emails:processing:w1"] == []
+    assert fake_redis.zsets["t:emails:retry"] == {}
+    assert len(fake_redis.lists["t:emails:dead"]) == 1
+
+
+def test_email_queue_waits_for_backoff_before_retrying(monkeypatch):
+    import app.core.email_queue as email_queue
+    from app.core.email_service import EmailService
+
+    fake_redis = _install_fake_queue(monkeypatch)
+    clock = _install_fake_clock(monkeypatch)
+    results = [False, True]
+    monkeypatch.setattr(EmailService, "send_email", staticmethod(lambda **_kw: results.pop(0)))
+
+    email_queue.enqueue_email(to_email="a@example.com", subject="s", html_content="h")
+    assert email_queue.process_next() is False
+    assert len(fake_redis.zsets["t:emails:retry"]) == 1
+
+    # Not due yet: the queue looks empty and nothing is sent
+    clock[0] += email_queue.retry_delay(1) - 1
+    assert email_queue.process_next() is None
+    assert results == [True]
+
+    clock[0] += 1
+    assert email_queue.process_next() is True
+    assert fake_redis.zsets["t:emails:retry"] == {}
+    assert fake_redis.lists["t:emails:processing:w1"] == []
+
+
+def test_email_queue_requeues_jobs_left_by_a_crashed_worker(monkeypatch):
+    import app.core.email_queue as email_queue
+    from app.core.email_service import EmailService
+
+    fake_redis = _install_fake_queue(monkeypatch)
+    _install_fake_clock(monkeypatch)
+
+    def crash(**_kw):
+        raise RuntimeError("worker died mid-send")
+
+    monkeypatch.setattr(EmailService, "send_email", staticmethod(crash))
+    email_queue.enqueue_email(to_email="a@example.com", subject="s", html_content="h")
+    with pytest.raises(RuntimeError):
+        email_queue.process_next()
+    assert len(fake_redis.lists["t:emails:processing:w1"]) == 1
+
+    monkeypatch.setattr(EmailService, "send_email", staticmethod(lambda **_kw: True))
+    assert email_queue.requeue_unfinished() == 1
+    assert email_queue.process_next() is True
+    assert fake_redis.lists["t:emails:processing:w1"] == []
+
+
 def test_limiter_config_branches(monkeypatch):
     # Reloading not required: we only cover helper functions.
     limiter_mod = importlib.import_module("app.core.limiter")
@@ -306,3 +556,30 @@ def test_limiter_config_branches(monkeypatch):
 
     monkeypatch.setattr(limiter_mod.settings, "FLASK_ENV", "development")
     assert limiter_mod._enabled() is True
+
+
+def test_limiter_strategy_and_storage_options(monkeypatch):
+    limiter_mod = importlib.import_module("app.core.limiter")
+
+    monkeypatch.delenv("RATELIMIT_STRATEGY", raising=False)
+    monkeypatch.setenv("RATELIMIT_STORAGE_URI", "memory://")
+    assert limiter_mod._strategy() == "fixed-window"
+    assert limiter_mod._storage_options() == {}
+
+    monkeypatch.setenv("RATELIMIT_STORAGE_URI", "redis://explicit")
+    assert limiter_mod._strategy() == "sliding-window-counter"
+    assert limiter_mod._storage_options()["max_connections"] == limiter_mod.settings.REDIS_POOL_SIZE
+
+    monkeypatch.setenv("RATELIMIT_STRATEGY", "moving-window")
+    assert limiter_mod._strategy() == "moving-window"
+
+
+def test_time_utils_utcnow_naive_matches_aware_utc():
+    from app.core.lib.time_utils import utcnow_aware, utcnow_epoch, utcnow_naive
+
+    naive = utcnow_naive()
+    aware = utcnow_aware()
+
+    assert naive.tzinfo is None
+    assert abs((aware.replace(tzinfo=None) - naive).total_seconds()) < 1
+    assert abs(utcnow_epoch() - aware.timestamp()) < 1
@@ -53,6 +53,24 @@ class TestRequestDecoratorsCoverage:
         body = resp.get_json()
         assert body["error"] == "Request body is required"
 
+    def test_validate_json_empty_body_skips_parsing(self, app, client, monkeypatch):
+        from flask.wrappers import Request
+        from app.core.middleware.request_decorators import validate_json
+
+        def _unexpected(*_args, **_kwargs):
+            raise AssertionError("empty bodies must not be parsed")
+
+        monkeypatch.setattr(Request, "get_json", _unexpected)
+
+        @app.post("/t")
+        @validate_json()
+        def handler():
+            return jsonify({"ok": True}), 200
+
+        resp = client.post("/t", data=b"", content_type="application/json")
+        assert resp.status_code == 400
+        assert resp.get_json()["error"] == "Request body is required"
+
     def test_validate_json_schema_validation_error_includes_details(self, app, client):
         from app.core.middleware.request_decorators import validate_json
 
@@ -86,6 +104,27 @@ class TestRequestDecoratorsCoverage:
         assert resp.status_code == 200
         assert resp.get_json()["validated"] == {"name": "Alice"}
 
+    def test_validate_json_reuses_schema_instance(self, app, client):
+        from app.core.middleware.request_decorators import validate_json
+
+        instances = []
+
+        class ReqSchema(Schema):
+            name = fields.String(required=True)
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                instances.append(self)
+
+        @app.post("/t")
+        @validate_json(ReqSchema)
+        def handler():
+            return jsonify({"validated": request.validated_data}), 200
+
+        assert client.post("/t", json={"name": "A"}).status_code == 200
+        assert client.post("/t", json={"name": "B"}).get_json()["validated"] == {"name": "B"}
+        assert len(instances) == 1
+
     def test_require_content_type_rejects_mismatch_415(self, app, client):
         from app.core.middleware.request_decorators import require_content_type
 
@@ -109,6 +148,25 @@ class TestRequestDecoratorsCoverage:
         resp = client.post("/t", json={"x": 1})
         assert resp.status_code == 200
 
+    def test_require_content_type_ignores_charset_parameter(self, app, client):
+        from app.core.middleware.request_decorators import require_content_type
+
+        @app.post("/t")
+        @require_content_type("application/json")
+        def handler():
+            return jsonify({"ok": True}), 200
+
+        resp = client.post("/t", data='{"x": 1}', content_type="Application/JSON; charset=utf-8")
+        assert resp.status_code == 200
+
+
+class TestParseBool:
+    def test_true_in_any_case_else_false(self):
+        from app.core.lib.request_utils import parse_bool
+
+        assert all(parse_bool(v) for v in ("true", "True", "TRUE", "tRuE"))
+        assert not any(parse_bool(v) for v in (None, "", "false", "1", "yes", "truex"))
+
 
 class TestCacheHelperCoverage:
     def test_get_or_set_cache_hit_returns_cached_and_skips_fetch(self, monkeypatch):
@@ -201,19 +259,19 @@ class TestCacheHelperCoverage:
         import app.core.middleware.cache_helper as ch
 
         cache = MagicMock()
-        cache.delete.side_effect = [True, False]
+        cache.delete_many.return_value = 1
         monkeypatch.setattr(ch, "get_cache", lambda: cache)
 
         helper = ch.CacheHelper(resource_name="chef", version="v1")
         helper.invalidate("profile:1", "profile:2")
 
-        assert cache.delete.call_count == 2
+        cache.delete_many.assert_called_once_with(["chef:profile:1:v1", "chef:profile:2:v1"])
 
     def test_invalidate_swallows_delete_exception(self, monkeypatch):
         import app.core.middleware.cache_helper as ch
 
         cache = MagicMock()
-        cache.delete.side_effect = Exception("boom")
+        cache.delete_many.side_effect = Exception("boom")
         monkeypatch.setattr(ch, "get_cache", lambda: cache)
 
         helper = ch.CacheHelper(resource_name="chef", version="v1")
@@ -231,3 +289,241 @@ class TestCacheHelperCoverage:
 
         cache.delete_pattern.side_effect = Exception("boom")
         assert helper.invalidate_pattern("*") == 0
+
+    def test_get_or_set_reuses_schema_instance_across_misses(self, monkeypatch):
+        import app.core.middleware.cache_helper as ch
+
+        cache = MagicMock()
+        cache.get.return_value = None
+        monkeypatch.setattr(ch, "get_cache", lambda: cache)
+
+        instances = []
+
+        class AnySchema(Schema):
+            x = fields.Integer()
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                instances.append(self)
+
+        helper = ch.CacheHelper(resource_name="chef")
+        helper.get_or_set("profile:1", fetch_func=lambda: {"x": 1}, schema_class=AnySchema)
+        helper.get_or_set("profile:2", fetch_func=lambda: {"x": 2}, schema_class=AnySchema)
+        helper.get_or_set("list:all", fetch_func=lambda: [{"x": 3}], schema_class=AnySchema, many=True)
+        assert len(instances) == 2
+
+    def test_get_or_set_concurrent_misses_fetch_once(self, monkeypatch):
+        import threading
+        import time
+
+        import app.core.middleware.cache_helper as ch
+
+        store = {}
+        cache = MagicMock()
+        cache.enabled = True
+        cache.get.side_effect = store.get
+        cache.set.side_effect = lambda key, value, ttl: store.__setitem__(key, value)
+        monkeypatch.setattr(ch, "get_cache", lambda: cache)
+
+        class AnySchema(Schema):
+            x = fields.Integer()
+
+        fetches = []
+
+        def fetch():
+            fetches.append(1)
+            time.sleep(0.05)
+            return {"x": 1}
+
+        results = []
+        helper = ch.CacheHelper(resource_name="chef")
+        threads = [
+            threading.Thread(target=lambda: results.append(helper.get_or_set("hot", fetch, AnySchema)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [{"x": 1}] * 5
+        assert len(fetches) == 1
+        assert ch._fetch_locks == {}
+
+    def test_get_or_set_many_builds_index_then_reassembles_with_mget(self, monkeypatch):
+        import app.core.middleware.cache_helper as ch
+
+        class _DictCache:
+            enabled = True
+
+            def __init__(self):
+                self.store = {}
+
+            def get(self, key, default=None):
+                return self.store.get(key, default)
+
+            def get_many(self, keys):
+                return {k: self.store[k] for k in keys if k in self.store}
+
+            def set(self, key, value, ttl=300):
+                self.store[key] = value
+
+            def set_many(self, mapping, ttl=300):
+                self.store.update(mapping)
+
+            def delete_many(self, keys):
+                return sum(self.store.pop(key, None) is not None for key in keys)
+
+        cache = _DictCache()
+        monkeypatch.setattr(ch, "get_cache", lambda: cache)
+
+        class ItemSchema(Schema):
+            id = fields.Integer()
+            name = fields.String()
+
+        rows = {1: {"id": 1, "name": "a"}, 2: {"id": 2, "name": "b"}}
+        fetch_all = MagicMock(side_effect=lambda: [rows[1], rows[2]])
+        fetch_by_ids = MagicMock(side_effect=lambda ids: [rows[i] for i in ids])
+
+        helper = ch.CacheHelper(resource_name="dish")
+        kwargs = dict(
+            index_key="index:chef:5",
+            item_key_prefix="item",
+            fetch_all_func=fetch_all,
+            fetch_by_ids_func=fetch_by_ids,
+            schema_class=ItemSchema,
+        )
+
+        assert helper.get_or_set_many(**kwargs) == [rows[1], rows[2]]
+        assert cache.store["dish:index:chef:5:v1"] == [1, 2]
+        assert cache.store["dish:item:2:v1"] == rows[2]
+
+        # Editing one item drops only its key; the list refetches just that item
+        rows[2] = {"id": 2, "name": "b2"}
+        helper.invalidate("item:2")
+        assert helper.get_or_set_many(**kwargs) == [rows[1], rows[2]]
+        assert fetch_all.call_count == 1
+        fetch_by_ids.assert_called_once_with([2])
+
+    def test_key_stats_stretch_read_mostly_and_shrink_write_heavy_ttls(self, monkeypatch):
+        import app.core.middleware.cache_helper as ch
+
+        monkeypatch.setattr(ch.settings, "CACHE_ADAPTIVE_TTL_MAX", 4)
+        stats = ch._KeyStats()
+
+        assert stats.ttl_for("unknown", 300) == 300
+
+        for _ in range(25):
+            stats.record_read("dish:detail:1:v1")
+        assert stats.ttl_for("dish:detail:1:v1", 300) == 750
+
+        for _ in range(100):
+            stats.record_read("dish:detail:2:v1")
+        assert stats.ttl_for("dish:detail:2:v1", 300) == 1200  # capped at 4x
+
+        stats.record_write("dish:index:5:v1")
+        stats.record_read("dish:index:5:v1")
+        assert stats.ttl_for("dish:index:5:v1", 300) == 150  # floor at 0.5x
+
+        stats.record_write_matching("dish:detail:*")
+        assert stats.ttl_for("dish:detail:1:v1", 300) == 150
+
+        monkeypatch.setattr(ch.settings, "CACHE_ADAPTIVE_TTL_MAX", 1)
+        assert stats.ttl_for("dish:detail:2:v1", 300) == 300
+        # A helper can opt in even when the deployment default is off
+        for _ in range(100):
+            stats.record_read("menu:detail:1:v1")
+        assert stats.ttl_for("menu:detail:1:v1", 300) == 300
+        assert stats.ttl_for("menu:detail:1:v1", 300, max_factor=4) == 1200
+
+    def test_key_stats_untouched_while_adaptive_ttl_is_disabled(self, monkeypatch):
+        import app.core.middleware.cache_helper as ch
+
+        stats = ch._KeyStats()
+        monkeypatch.setattr(ch, "_key_stats", stats)
+        monkeypatch.setattr(ch.settings, "CACHE_ADAPTIVE_TTL_MAX", 1)
+        cache = MagicMock()
+        cache.get.return_value = {"id": 1}
+        monkeypatch.setattr(ch, "get_cache", lambda: cache)
+
+        helper = ch.CacheHelper(resource_name="dish")
+        helper.get_or_set("detail:1", lambda: None, MagicMock())
+        helper.invalidate("detail:1")
+        helper.invalidate_pattern("*")
+        assert len(stats._stats) == 0
+
+        # A resource that opts in is still tracked
+        ch.CacheHelper(resource_name="menu", adaptive_ttl_max=4).get_or_set("detail:1", lambda: None, MagicMock())
+        assert list(stats._stats) == ["menu:detail:1:v1"]
+
+    def test_generational_helper_invalidate_all_moves_to_new_generation(self, monkeypatch):
+        import app.core.middleware.cache_helper as ch
+
+        store = {}
+        cache = MagicMock()
+        cache.enabled = True
+        cache.get_counter.side_effect = lambda key: store.get(key, 0)
+
+        def incr(key):
+            store[key] = store.get(key, 0) + 1
+            return store[key]
+
+        cache.incr.side_effect = incr
+        monkeypatch.setattr(ch, "get_cache", lambda: cache)
+
+        app = Flask(__name__)
+        helper = ch.CacheHelper(resource_name="chef", generational=True)
+
+        with app.app_context():
+            assert helper._build_cache_key("profile:1") == "chef:profile:1:v1:g0"
+            assert helper._build_cache_key("profile:2") == "chef:profile:2:v1:g0"
+            assert cache.get_counter.call_count == 1  # generation read once per context
+
+            helper.invalidate_all()
+            assert helper._build_cache_key("profile:1") == "chef:profile:1:v1:g1"
+
+        with app.app_context():
+            assert helper._build_cache_key("profile:1") == "chef:profile:1:v1:g1"
+        cache.delete_pattern.assert_not_called()
+
+    def test_generational_helper_bypasses_cache_when_generation_read_fails(self, monkeypatch):
+        import app.core.middleware.cache_helper as ch
+
+        cache = MagicMock()
+        cache.enabled = True
+        cache.get_counter.return_value = None  # Redis GET failed
+        monkeypatch.setattr(ch, "get_cache", lambda: cache)
+
+        app = Flask(__name__)
+        helper = ch.CacheHelper(resource_name="chef", generational=True)
+        fetch_func = MagicMock(return_value={"id": 1, "name": "a"})
+
+        class AnySchema(Schema):
+            id = fields.Integer()
+            name = fields.String()
+
+        with app.app_context():
+            result = helper.get_or_set("profile:1", fetch_func, AnySchema, ttl=60)
+            helper.set("profile:1", {"id": 1})
+            helper.invalidate("profile:1")
+
+        assert result == {"id": 1, "name": "a"}
+        fetch_func.assert_called_once()
+        cache.get.assert_not_called()
+        cache.set.assert_not_called()
+        cache.delete_many.assert_not_called()
+        assert cache.get_counter.call_count == 1
+
+    def test_set_writes_serialized_value_through_to_full_key(self, monkeypatch):
+        import app.core.middleware.cache_helper as ch
+
+        cache = MagicMock()
+        monkeypatch.setattr(ch, "get_cache", lambda: cache)
+
+        helper = ch.CacheHelper(resource_name="dish")
+        helper.set("item:7", {"id": 7}, ttl=120)
+        cache.set.assert_called_once_with("dish:item:7:v1", {"id": 7}, ttl=120)
+
+        # Cache write failures never reach the caller
+        cache.set.side_effect = RuntimeError("redis down")
+        helper.set("item:7", {"id": 7})